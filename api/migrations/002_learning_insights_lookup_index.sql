@@ -0,0 +1,13 @@
+-- Migration: Composite index for learning insight lookups
+-- Run this in Supabase SQL Editor (safe to run multiple times)
+
+-- get_learning_insights filters on insight_type and category, then takes the
+-- most frequent rows; one index serves the filter, sort and LIMIT together
+CREATE INDEX IF NOT EXISTS idx_learning_insights_type_category_frequency
+ON learning_insights(insight_type, category, frequency DESC);
+
+-- Verify migration
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration complete: learning_insights lookup index added';
+END $$;
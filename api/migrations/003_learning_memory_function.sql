@@ -0,0 +1,54 @@
+-- Migration: Single-query learning memory lookup
+-- Run this in Supabase SQL Editor (safe to run multiple times)
+
+-- Returns the three lists LearningMemory.load_session_memory needs (common
+-- mistakes, successful patterns, recent insights) from one round-trip.
+-- A NULL category matches every category. Each list is ordered by frequency,
+-- like SupabaseStorage.get_learning_insights.
+CREATE OR REPLACE FUNCTION get_learning_memory(
+    p_category TEXT DEFAULT NULL,
+    p_limit INT DEFAULT 10,
+    p_recent INT DEFAULT 5
+)
+RETURNS JSON
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT json_build_object(
+        'common_mistakes', COALESCE((
+            SELECT json_agg(t.description ORDER BY t.frequency DESC)
+            FROM (
+                SELECT description, frequency FROM learning_insights
+                WHERE insight_type = 'common_mistake'
+                  AND (p_category IS NULL OR category = p_category)
+                ORDER BY frequency DESC
+                LIMIT p_limit
+            ) t
+        ), '[]'::json),
+        'successful_patterns', COALESCE((
+            SELECT json_agg(t.description ORDER BY t.frequency DESC)
+            FROM (
+                SELECT description, frequency FROM learning_insights
+                WHERE insight_type = 'improvement_pattern'
+                  AND (p_category IS NULL OR category = p_category)
+                ORDER BY frequency DESC
+                LIMIT p_limit
+            ) t
+        ), '[]'::json),
+        'recent_insights', COALESCE((
+            SELECT json_agg(row_to_json(t) ORDER BY t.frequency DESC)
+            FROM (
+                SELECT * FROM learning_insights
+                WHERE p_category IS NULL OR category = p_category
+                ORDER BY frequency DESC
+                LIMIT p_recent
+            ) t
+        ), '[]'::json)
+    );
+$$;
+
+-- Verify migration
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration complete: get_learning_memory function added';
+END $$;
@@ -25,7 +25,7 @@ class GenerationConfig(BaseModel):
     """Configuration for blog post generation"""
     batch_size: int = 10
     search_days_back: int = 30
-    model: str = "gpt-4"
+    model: str = "gpt-4o-mini"
     use_placeholder_images: bool = False
     use_legacy_orchestrator: bool = False
 
@@ -73,7 +73,7 @@ def run_generation_task(job_id: str, config: dict):
         from blog_post_generator import run_generation
         
         result = run_generation(
-            model=config.get("model", "gpt-4"),
+            model=config.get("model", "gpt-4o-mini"),
             use_placeholder_images=config.get("use_placeholder_images", False),
             batch_size=config.get("batch_size", 10),
             search_days_back=config.get("search_days_back", 30),
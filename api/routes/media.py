@@ -4,7 +4,6 @@ Endpoints for managing media library (image uploads).
 """
 import sys
 import os
-import base64
 from uuid import uuid4
 from typing import Optional, List
 from datetime import datetime
@@ -124,10 +123,9 @@ async def upload_media(
         ext = original_filename.rsplit(".", 1)[-1] if "." in original_filename else "png"
         unique_filename = f"{uuid4().hex[:12]}.{ext}"
 
-        # Upload to Supabase Storage
-        image_base64 = base64.b64encode(content).decode("utf-8")
+        # Upload to Supabase Storage (raw bytes, no base64 round trip)
         upload_result = storage.upload_image(
-            image_data=image_base64,
+            image_data=content,
             filename=unique_filename,
             folder=MEDIA_FOLDER,
             content_type=file.content_type
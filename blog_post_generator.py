@@ -33,8 +33,8 @@ except ImportError as e:
 
 # Import components
 from zap_exa_ranker import main as search_articles
-from langchain_blog_agent import BlogPostGenerator
-from image_generator import get_image_generator
+from langchain_blog_agent import BlogPostGenerator, DEFAULT_MODEL
+from image_generator import get_image_generator, image_mime_type
 from supabase_storage import get_supabase_client
 from example_store import ExampleStore, retrieve_similar_examples
 from reflection_agent import ReflectionAgent
@@ -59,8 +59,9 @@ class BlogPostOrchestrator:
 
     def __init__(
         self,
-        model: str = "gpt-4",
-        use_placeholder_images: bool = False
+        model: str = DEFAULT_MODEL,
+        use_placeholder_images: bool = False,
+        http_timeout: Optional[float] = None
     ):
         """
         Initialize the orchestrator.
@@ -68,9 +69,13 @@ class BlogPostOrchestrator:
         Args:
             model: OpenAI model for blog generation
             use_placeholder_images: Use placeholder images instead of Gemini
+            http_timeout: Image API request timeout in seconds (SDK default if None)
         """
         self.generator = BlogPostGenerator(model=model)
-        self.image_generator = get_image_generator(use_placeholder=use_placeholder_images)
+        self.image_generator = get_image_generator(
+            use_placeholder=use_placeholder_images,
+            http_timeout=http_timeout
+        )
         self.supabase = get_supabase_client()
         self.example_store = ExampleStore(self.supabase)
         self.reflection_agent = ReflectionAgent()
@@ -286,10 +291,11 @@ class BlogPostOrchestrator:
         if not image_result.get("success") or not self.supabase:
             return {"success": False, "error": "No image or Supabase client"}
 
-        content_type = f"image/{image_result.get('format', 'png')}"
+        # Raw bytes go straight to storage; "format" may already be a MIME type
+        content_type = image_mime_type(image_result)
 
         return self.supabase.upload_image(
-            image_data=image_result.get("image_data", ""),
+            image_data=image_result.get("image_bytes") or image_result.get("image_data", ""),
             filename=filename,
             content_type=content_type
         )
@@ -566,17 +572,22 @@ class BlogPostOrchestrator:
 
 
 def run_generation(
-    model: str = "gpt-4",
+    model: str = DEFAULT_MODEL,
     use_placeholder_images: bool = False,
     batch_size: int = 30,
     search_days_back: int = 30,
-    use_langgraph: bool = True
+    use_langgraph: bool = True,
+    concurrency: int = MAX_WORKERS,
+    http_timeout: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Run the blog post generation workflow.
 
     Uses LangGraph StateGraph for orchestration by default.
     Falls back to legacy async orchestration if LangGraph is unavailable.
+
+    concurrency caps parallel image generation requests (LangGraph path);
+    http_timeout sets the image API request timeout in seconds.
     """
     # Use LangGraph if available and enabled
     if use_langgraph and LANGGRAPH_AVAILABLE and USE_LANGGRAPH:
@@ -584,7 +595,9 @@ def run_generation(
             batch_size=batch_size,
             search_days_back=search_days_back,
             model=model,
-            use_placeholder_images=use_placeholder_images
+            use_placeholder_images=use_placeholder_images,
+            image_concurrency=concurrency,
+            http_timeout=http_timeout
         )
 
     # Fallback to legacy orchestration
@@ -592,15 +605,17 @@ def run_generation(
         model=model,
         use_placeholder_images=use_placeholder_images,
         batch_size=batch_size,
-        search_days_back=search_days_back
+        search_days_back=search_days_back,
+        http_timeout=http_timeout
     )
 
 
 def run_generation_legacy(
-    model: str = "gpt-4",
+    model: str = DEFAULT_MODEL,
     use_placeholder_images: bool = False,
     batch_size: int = 30,
-    search_days_back: int = 30
+    search_days_back: int = 30,
+    http_timeout: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Run the blog post generation workflow using legacy async orchestration.
@@ -609,7 +624,8 @@ def run_generation_legacy(
     """
     orchestrator = BlogPostOrchestrator(
         model=model,
-        use_placeholder_images=use_placeholder_images
+        use_placeholder_images=use_placeholder_images,
+        http_timeout=http_timeout
     )
 
     return asyncio.run(orchestrator.run(batch_size, search_days_back))
@@ -622,7 +638,7 @@ if __name__ == "__main__":
     import sys
 
     parser = argparse.ArgumentParser(description="Generate blog posts from articles")
-    parser.add_argument("--model", default="gpt-4", help="OpenAI model to use")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="OpenAI model to use")
     parser.add_argument("--placeholder-images", action="store_true", help="Use placeholder images")
     parser.add_argument("--batch-size", type=int, default=30, help="Number of articles to search")
     parser.add_argument("--days-back", type=int, default=30, help="Search window in days")
@@ -22,8 +22,8 @@ from langgraph.graph import StateGraph, START, END
 
 # Import existing components
 from zap_exa_ranker import main as search_articles_exa
-from langchain_blog_agent import BlogPostGenerator
-from image_generator import get_image_generator
+from langchain_blog_agent import BlogPostGenerator, DEFAULT_MODEL
+from image_generator import get_image_generator, image_mime_type
 from supabase_storage import get_supabase_client
 from example_store import ExampleStore
 from reflection_agent import ReflectionAgent
@@ -47,6 +47,8 @@ class BlogPostState(TypedDict):
     search_days_back: int
     model: str
     use_placeholder_images: bool
+    image_concurrency: int
+    http_timeout: Optional[float]
     
     # Search results
     search_results: Dict[str, Any]
@@ -118,8 +120,10 @@ def get_url_hash(url: str) -> str:
 def create_initial_state(
     batch_size: int = 30,
     search_days_back: int = 30,
-    model: str = "gpt-4",
-    use_placeholder_images: bool = False
+    model: str = DEFAULT_MODEL,
+    use_placeholder_images: bool = False,
+    image_concurrency: int = MAX_WORKERS,
+    http_timeout: Optional[float] = None
 ) -> BlogPostState:
     """Create the initial state for the workflow."""
     return BlogPostState(
@@ -127,6 +131,8 @@ def create_initial_state(
         search_days_back=search_days_back,
         model=model,
         use_placeholder_images=use_placeholder_images,
+        image_concurrency=image_concurrency,
+        http_timeout=http_timeout,
         search_results={},
         articles=[],
         shoppers_articles=[],
@@ -349,7 +355,7 @@ def generate_posts_node(state: BlogPostState) -> Dict[str, Any]:
         articles_to_process = articles
     
     try:
-        generator = BlogPostGenerator(model=state.get("model", "gpt-4"))
+        generator = BlogPostGenerator(model=state.get("model", DEFAULT_MODEL))
         
         # Prepare articles with learning context
         shoppers_context = state.get("shoppers_context", {})
@@ -365,27 +371,24 @@ def generate_posts_node(state: BlogPostState) -> Dict[str, Any]:
         # Debug logging
         logs.append(f"  📊 Found {len(recall_articles_to_process)} recall articles and {len(shoppers_articles_to_process)} shoppers articles")
         
-        # Generate individual shoppers posts
-        for article in shoppers_articles_to_process:
-            context = shoppers_context
+        # Generate individual shoppers posts, batched concurrently
+        context = shoppers_context
+
+        # Inject prompt_additions from feedback into bad_examples so the LLM sees them
+        effective_bad_examples = list(context.get("bad_examples") or [])
+        if context.get("prompt_additions"):
+            effective_bad_examples.insert(0,
+                f"<!-- CRITICAL FEEDBACK FROM REVIEWS — follow these rules:\n"
+                f"{context['prompt_additions']}\n-->"
+            )
 
-            # Inject prompt_additions from feedback into bad_examples so the LLM sees them
-            effective_bad_examples = list(context.get("bad_examples") or [])
-            if context.get("prompt_additions"):
-                effective_bad_examples.insert(0,
-                    f"<!-- CRITICAL FEEDBACK FROM REVIEWS — follow these rules:\n"
-                    f"{context['prompt_additions']}\n-->"
-                )
+        shoppers_results = generator.batch_generate(
+            [{**article, "category": "shoppers"} for article in shoppers_articles_to_process],
+            good_examples=context.get("good_examples"),
+            bad_examples=effective_bad_examples
+        ) if shoppers_articles_to_process else []
 
-            result = generator.generate_with_reflection(
-                title=article.get("title", ""),
-                content=article.get("content", article.get("description", "")),
-                original_link=article.get("link", ""),
-                category="shoppers",
-                good_examples=context.get("good_examples"),
-                bad_examples=effective_bad_examples
-            )
-            
+        for article, result in zip(shoppers_articles_to_process, shoppers_results):
             result["article"] = article
             result["category"] = "shoppers"
             result["post_id"] = get_url_hash(article.get("link", ""))
@@ -590,7 +593,7 @@ def proofread_posts_node(state: BlogPostState) -> Dict[str, Any]:
         from langchain_core.prompts import ChatPromptTemplate
         from langchain_core.output_parsers import StrOutputParser
 
-        model = state.get("model", "gpt-4")
+        model = state.get("model", DEFAULT_MODEL)
         llm = ChatOpenAI(
             model=model,
             temperature=0,  # Deterministic for proofreading
@@ -641,6 +644,47 @@ def proofread_posts_node(state: BlogPostState) -> Dict[str, Any]:
         }
 
 
+async def _generate_and_upload_images(
+    image_generator,
+    to_generate: List[tuple],
+    max_workers: int
+) -> List[Dict[str, Any]]:
+    """
+    Generate images for (slot, post) pairs, uploading each to imgBB as it completes.
+
+    Returns one image result per pair, in input order. Successful results
+    carry an "upload_result" that upload_images_node uses instead of
+    uploading again, and no longer carry the image payload.
+    """
+    loop = asyncio.get_running_loop()
+    results: List[Optional[Dict[str, Any]]] = [None] * len(to_generate)
+    uploads = {}
+
+    articles = [post.get("article", {}) for _, post in to_generate]
+    async for index, result in image_generator.generate_images_as_completed(articles, max_workers):
+        results[index] = result
+        image_data = result.get("image_bytes") or result.get("image_data")
+        if result.get("success") and image_data:
+            # The upload owns the payload from here; don't keep it in graph state
+            result.pop("image_bytes", None)
+            result.pop("image_data", None)
+            post_id = to_generate[index][1].get("post_id")
+            uploads[index] = loop.run_in_executor(
+                None,
+                lambda data=image_data, name=post_id, mime=image_mime_type(result): upload_image_to_imgbb(
+                    image_data=data, name=name, content_type=mime
+                )
+            )
+
+    for index, upload in uploads.items():
+        try:
+            results[index]["upload_result"] = await upload
+        except Exception as e:
+            results[index]["upload_result"] = {"success": False, "error": str(e)}
+
+    return results
+
+
 def generate_images_node(state: BlogPostState) -> Dict[str, Any]:
     """
     Node: Generate images for all blog posts in parallel.
@@ -654,10 +698,12 @@ def generate_images_node(state: BlogPostState) -> Dict[str, Any]:
     
     try:
         image_generator = get_image_generator(
-            use_placeholder=state.get("use_placeholder_images", False)
+            use_placeholder=state.get("use_placeholder_images", False),
+            http_timeout=state.get("http_timeout")
         )
         
         images = []
+        to_generate = []
         
         for post in generated_posts:
             if not post.get("success") and not post.get("blog_post"):
@@ -677,11 +723,24 @@ def generate_images_node(state: BlogPostState) -> Dict[str, Any]:
                 })
                 continue
 
-            image_result = image_generator.generate_image_for_article(article)
+            # Reserve the slot; filled once the concurrent batch returns
+            to_generate.append((len(images), post))
+            images.append(None)
+
+        # Generate the remaining images concurrently, starting each imgBB
+        # upload as soon as its image lands instead of after the whole batch
+        results = asyncio.run(_generate_and_upload_images(
+            image_generator,
+            to_generate,
+            max_workers=state.get("image_concurrency", MAX_WORKERS)
+        ))
+
+        for (slot, post), image_result in zip(to_generate, results):
+            article = image_result.pop("article", {})
             image_result["post_id"] = post.get("post_id")
             image_result["is_recall"] = False
 
-            images.append(image_result)
+            images[slot] = image_result
 
             status = "✓" if image_result.get("success") else "✗"
             error_msg = f" ({image_result.get('error', 'unknown error')})" if not image_result.get("success") else ""
@@ -740,10 +799,11 @@ def upload_images_node(state: BlogPostState) -> Dict[str, Any]:
                 logs.append(f"  ✗ No image data for {post_id}")
                 continue
 
-            # Upload to imgBB
-            upload_result = upload_image_to_imgbb(
-                image_data=image.get("image_data", ""),
-                name=post_id
+            # Upload to imgBB (usually already done while images were generating)
+            upload_result = image.get("upload_result") or upload_image_to_imgbb(
+                image_data=image.get("image_bytes") or image.get("image_data", ""),
+                name=post_id,
+                content_type=image_mime_type(image)
             )
 
             uploaded_urls.append({
@@ -1072,8 +1132,10 @@ def create_blog_post_graph() -> StateGraph:
 def run_blog_post_workflow(
     batch_size: int = 30,
     search_days_back: int = 30,
-    model: str = "gpt-4",
-    use_placeholder_images: bool = False
+    model: str = DEFAULT_MODEL,
+    use_placeholder_images: bool = False,
+    image_concurrency: int = MAX_WORKERS,
+    http_timeout: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Run the complete blog post generation workflow using LangGraph.
@@ -1083,6 +1145,8 @@ def run_blog_post_workflow(
         search_days_back: How far back to search
         model: OpenAI model for generation
         use_placeholder_images: Use placeholder images instead of Gemini
+        image_concurrency: Maximum concurrent image generation requests
+        http_timeout: Image API request timeout in seconds (SDK default if None)
         
     Returns:
         Final workflow state with results
@@ -1099,7 +1163,9 @@ def run_blog_post_workflow(
         batch_size=batch_size,
         search_days_back=search_days_back,
         model=model,
-        use_placeholder_images=use_placeholder_images
+        use_placeholder_images=use_placeholder_images,
+        image_concurrency=image_concurrency,
+        http_timeout=http_timeout
     )
     
     # Run the workflow
@@ -1157,7 +1223,7 @@ if __name__ == "__main__":
     import json
     
     parser = argparse.ArgumentParser(description="Run LangGraph blog post workflow")
-    parser.add_argument("--model", default="gpt-4", help="OpenAI model to use")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="OpenAI model to use")
     parser.add_argument("--placeholder-images", action="store_true", help="Use placeholder images")
     parser.add_argument("--batch-size", type=int, default=30, help="Number of articles to search")
     parser.add_argument("--days-back", type=int, default=30, help="Search window in days")
@@ -4,9 +4,11 @@
 import os
 import sys
 import json
+import time
 import argparse
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
 try:
     from dotenv import load_dotenv
@@ -14,13 +16,13 @@ try:
 except ImportError:
     pass
 
-try:
-    import pytz
-except ImportError:
-    pytz = None
-    print("Warning: pytz not installed. Using UTC times.")
+# supabase and pytz are imported on first use so that importing this module
+# for get_week_start_date() or the REQUIRED_* constants stays cheap
+if TYPE_CHECKING:
+    from supabase import Client
 
-from supabase import create_client, Client
+_pytz = None  # pytz module once imported, False if unavailable
+_week_start_cache = None  # (week start, epoch time of the next week start)
 
 
 # ============================================================================
@@ -33,12 +35,27 @@ REQUIRED_RECALL = 1
 REQUIRED_TOTAL = REQUIRED_SHOPPERS + REQUIRED_RECALL  # 7
 
 
+
 # ============================================================================
 # DATE UTILITIES
 # ============================================================================
 
+def _get_pytz():
+    """Import pytz on first use; returns None if it is not installed."""
+    global _pytz
+    if _pytz is None:
+        try:
+            import pytz
+            _pytz = pytz
+        except ImportError:
+            _pytz = False
+            print("Warning: pytz not installed. Using UTC times.")
+    return _pytz or None
+
+
 def get_chicago_timezone():
     """Get Chicago timezone object."""
+    pytz = _get_pytz()
     if pytz:
         return pytz.timezone('America/Chicago')
     return None
@@ -52,9 +69,20 @@ def get_week_start_date() -> datetime:
     Uses midnight to capture all posts generated on Tuesday,
     including those created before the 9 AM generation job.
 
+    The result is reused until the next Tuesday midnight boundary passes.
+
     Returns:
         datetime: Start of current week in UTC
     """
+    global _week_start_cache
+    now = time.time()
+    if _week_start_cache is None or now >= _week_start_cache[1]:
+        _week_start_cache = _compute_week_start_date()
+    return _week_start_cache[0]
+
+
+def _compute_week_start_date() -> Tuple[datetime, float]:
+    """Compute the week start and the epoch time the next week starts at."""
     tz = get_chicago_timezone()
 
     if tz:
@@ -76,23 +104,29 @@ def get_week_start_date() -> datetime:
     if tz:
         tuesday = tuesday.replace(hour=0, minute=0, second=0, microsecond=0)
         # Convert to UTC for database query
-        tuesday_utc = tuesday.astimezone(pytz.UTC)
+        tuesday_utc = tuesday.astimezone(timezone.utc)
+        # Next Tuesday midnight in Chicago local time (DST-aware)
+        next_tuesday = tz.localize(tuesday.replace(tzinfo=None) + timedelta(days=7))
+        next_start = next_tuesday.timestamp()
     else:
         # Approximate: midnight CST = 06:00 UTC
         tuesday = tuesday.replace(hour=6, minute=0, second=0, microsecond=0)
         tuesday_utc = tuesday
+        next_start = (tuesday + timedelta(days=7)).replace(tzinfo=timezone.utc).timestamp()
 
-    return tuesday_utc
+    return tuesday_utc, next_start
 
 
 # ============================================================================
 # SUPABASE CLIENT
 # ============================================================================
 
-def get_supabase_client() -> Optional[Client]:
+def get_supabase_client() -> Optional["Client"]:
     """
     Get a Supabase client instance.
 
+    The client is shared and uses a pooled HTTP/2 connection (see supabase_storage).
+
     Returns:
         Supabase Client instance or None if credentials not set
     """
@@ -103,42 +137,84 @@ def get_supabase_client() -> Optional[Client]:
         print("Error: SUPABASE_URL and SUPABASE_KEY must be set")
         return None
 
-    return create_client(url, key)
+    from supabase_storage import create_pooled_client
+    return create_pooled_client(url, key)
 
 
 # ============================================================================
 # BLOG STATUS CHECK
 # ============================================================================
 
-def get_this_weeks_posts(supabase: Client, week_start: datetime) -> List[Dict[str, Any]]:
+def _this_week_filter(week_start_iso: str) -> str:
+    """PostgREST filter for posts created OR published to Blogger this week."""
+    # This catches older drafts that were published after the week started
+    return f"created_at.gte.{week_start_iso},blogger_published_at.gte.{week_start_iso}"
+
+
+def count_this_weeks_posts(supabase: "Client", week_start_iso: str, category: Optional[str] = None) -> int:
     """
-    Query blog posts created since week_start.
+    Count blog posts created (or published to Blogger) since week_start.
 
     Args:
         supabase: Supabase client
-        week_start: Start of the week (datetime)
+        week_start_iso: ISO timestamp of week start
+        category: Optional category filter (matched case-insensitively)
 
     Returns:
-        List of blog post records
+        Number of matching posts (0 on query error)
     """
-    week_start_iso = week_start.isoformat()
+    try:
+        query = supabase.table("blog_posts").select(
+            "id", count="exact"
+        ).or_(_this_week_filter(week_start_iso))
+
+        if category:
+            query = query.ilike("category", category)
+
+        # Only the count is needed, not the rows
+        result = query.limit(1).execute()
+        return result.count or 0
+    except Exception as e:
+        print(f"Error counting blog posts: {e}")
+        return 0
 
+
+def get_published_this_week(supabase: "Client", week_start_iso: str) -> List[Dict[str, Any]]:
+    """
+    Query posts that went live on Blogger since week_start.
+
+    A post counts as "published this week" if:
+    1. status == 'published' AND blogger_url is set (confirmed LIVE on Blogger)
+    2. blogger_published_at falls within this week's window
+       (filters out old Blogger posts imported during sync)
+
+    All filtering happens in the database; only the category column is returned.
+
+    Args:
+        supabase: Supabase client
+        week_start_iso: ISO timestamp of week start
+
+    Returns:
+        List of published post records
+    """
     try:
-        # Include posts created this week OR published to Blogger this week
-        # This catches older drafts that were published after the week started
         result = supabase.table("blog_posts").select(
-            "id, title, category, status, blogger_url, blogger_post_id, blogger_published_at, created_at"
-        ).or_(
-            f"created_at.gte.{week_start_iso},blogger_published_at.gte.{week_start_iso}"
+            "category"
+        ).eq(
+            "status", "published"
+        ).not_.is_(
+            "blogger_url", "null"
+        ).gte(
+            "blogger_published_at", week_start_iso
         ).execute()
 
         return result.data or []
     except Exception as e:
-        print(f"Error querying blog posts: {e}")
+        print(f"Error querying published posts: {e}")
         return []
 
 
-def check_publish_status(supabase: Optional[Client] = None) -> Dict[str, Any]:
+def check_publish_status(supabase: Optional["Client"] = None) -> Dict[str, Any]:
     """
     Check the publish status of this week's blog posts.
 
@@ -167,51 +243,40 @@ def check_publish_status(supabase: Optional[Client] = None) -> Dict[str, Any]:
 
     week_start = get_week_start_date()
     week_start_iso = week_start.isoformat()
-    posts = get_this_weeks_posts(supabase, week_start)
-
-    # Count totals
-    total_posts = len(posts)
-
-    # A post counts as "published this week" if:
-    # 1. status == 'published' AND blogger_url is set (confirmed LIVE on Blogger)
-    # 2. blogger_published_at falls within this week's window
-    #    (filters out old Blogger posts imported during sync)
-    published_posts = [
-        p for p in posts
-        if p.get('status') == 'published'
-        and p.get('blogger_url')
-        and p.get('blogger_published_at')
-        and p['blogger_published_at'] >= week_start_iso
-    ]
-
-    # Count by category
-    shoppers_posts = [p for p in posts if (p.get('category') or '').upper() == 'SHOPPERS']
-    recall_posts = [p for p in posts if (p.get('category') or '').upper() == 'RECALL']
-
-    shoppers_published = [
-        p for p in published_posts
-        if (p.get('category') or '').upper() == 'SHOPPERS'
-    ]
-    recall_published = [
-        p for p in published_posts
-        if (p.get('category') or '').upper() == 'RECALL'
-    ]
+
+    # Totals are count-only queries; the published list is filtered server-side.
+    # All four are independent, so run them concurrently.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        total_future = executor.submit(count_this_weeks_posts, supabase, week_start_iso)
+        shoppers_future = executor.submit(count_this_weeks_posts, supabase, week_start_iso, "SHOPPERS")
+        recall_future = executor.submit(count_this_weeks_posts, supabase, week_start_iso, "RECALL")
+        published_future = executor.submit(get_published_this_week, supabase, week_start_iso)
+
+        total_posts = total_future.result()
+        shoppers_total = shoppers_future.result()
+        recall_total = recall_future.result()
+        published_posts = published_future.result()
+
+    # Flatten to a single category column, then count in C via list.count()
+    published_categories = [(p.get('category') or '').upper() for p in published_posts]
+    shoppers_published = published_categories.count('SHOPPERS')
+    recall_published = published_categories.count('RECALL')
 
     # Check requirements: 1 RECALL + 6 SHOPPERS = 7 total
     meets_requirement = (
-        len(recall_published) >= REQUIRED_RECALL and
-        len(shoppers_published) >= REQUIRED_SHOPPERS
+        recall_published >= REQUIRED_RECALL and
+        shoppers_published >= REQUIRED_SHOPPERS
     )
 
     return {
         "success": True,
-        "week_start": week_start.isoformat(),
+        "week_start": week_start_iso,
         "total_posts": total_posts,
         "published_posts": len(published_posts),
-        "shoppers_total": len(shoppers_posts),
-        "shoppers_published": len(shoppers_published),
-        "recall_total": len(recall_posts),
-        "recall_published": len(recall_published),
+        "shoppers_total": shoppers_total,
+        "shoppers_published": shoppers_published,
+        "recall_total": recall_total,
+        "recall_published": recall_published,
         "required_count": REQUIRED_TOTAL,
         "required_shoppers": REQUIRED_SHOPPERS,
         "required_recall": REQUIRED_RECALL,
@@ -219,6 +284,71 @@ def check_publish_status(supabase: Optional[Client] = None) -> Dict[str, Any]:
     }
 
 
+def count_published_this_week(supabase: "Client", category: str, week_start_iso: str, limit: int) -> int:
+    """
+    Count posts in a category that went live on Blogger since week_start.
+
+    Only the row count is requested, and the query stops after `limit` rows
+    since callers only care whether a threshold was crossed.
+
+    Args:
+        supabase: Supabase client
+        category: Post category (SHOPPERS or RECALL, matched case-insensitively)
+        week_start_iso: ISO timestamp of week start
+        limit: Maximum number of rows to scan
+
+    Returns:
+        Number of matching posts (0 on query error)
+    """
+    try:
+        result = supabase.table("blog_posts").select(
+            "id", count="exact"
+        ).eq(
+            "status", "published"
+        ).ilike(
+            "category", category
+        ).not_.is_(
+            "blogger_url", "null"
+        ).gte(
+            "blogger_published_at", week_start_iso
+        ).limit(limit).execute()
+
+        if result.count is not None:
+            return result.count
+        return len(result.data or [])
+    except Exception as e:
+        print(f"Error counting {category} posts: {e}")
+        return 0
+
+
+def check_requirement_met(supabase: Optional["Client"] = None) -> bool:
+    """
+    Check whether this week's publishing requirement is met.
+
+    Cheaper than check_publish_status(): runs two count-only queries instead
+    of downloading and filtering every post created this week.
+
+    Args:
+        supabase: Supabase client (creates one if not provided)
+
+    Returns:
+        True if at least 1 RECALL and 6 SHOPPERS posts are published this week
+    """
+    if supabase is None:
+        supabase = get_supabase_client()
+        if supabase is None:
+            return False
+
+    week_start_iso = get_week_start_date().isoformat()
+
+    recall_count = count_published_this_week(supabase, "RECALL", week_start_iso, REQUIRED_RECALL)
+    if recall_count < REQUIRED_RECALL:
+        return False
+
+    shoppers_count = count_published_this_week(supabase, "SHOPPERS", week_start_iso, REQUIRED_SHOPPERS)
+    return shoppers_count >= REQUIRED_SHOPPERS
+
+
 def print_status_report(status: Dict[str, Any]) -> None:
     """Print a human-readable status report."""
     if not status.get("success"):
@@ -274,14 +404,25 @@ def main():
         action="store_true",
         help="Exit with code 1 if requirements not met"
     )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Skip the status report (use with --exit-code for a fast check)"
+    )
 
     args = parser.parse_args()
 
+    # Only the exit code is wanted: skip building the full status report
+    if args.exit_code and args.quiet and not args.json:
+        if not check_requirement_met():
+            sys.exit(1)
+        return
+
     status = check_publish_status()
 
     if args.json:
         print(json.dumps(status, indent=2))
-    else:
+    elif not args.quiet:
         print_status_report(status)
 
     # Exit with error code if requirements not met and --exit-code flag is set
@@ -35,28 +35,36 @@ def load_blog_posts(directory: str = "blog_posts") -> List[Dict[str, Any]]:
         print(f"Directory not found: {directory}")
         return posts
     
-    for filename in os.listdir(directory):
-        if filename.endswith(".html"):
-            filepath = os.path.join(directory, filename)
-            
-            with open(filepath, "r", encoding="utf-8") as f:
-                html_content = f.read()
-            
-            # Try to load metadata
-            metadata_path = filepath.replace(".html", ".json")
-            metadata = {}
-            if os.path.exists(metadata_path):
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
-            
-            posts.append({
-                "id": filename.replace(".html", ""),
-                "filename": filename,
-                "filepath": filepath,
-                "html_content": html_content,
-                "metadata": metadata,
-                "article_data": metadata.get("article", {})
-            })
+    # Single directory pass: find HTML posts and note which metadata files exist
+    with os.scandir(directory) as it:
+        entries = [entry.name for entry in it if entry.is_file()]
+    json_files = {name for name in entries if name.endswith(".json")}
+    
+    for filename in entries:
+        stem, ext = os.path.splitext(filename)
+        if ext != ".html":
+            continue
+        
+        filepath = os.path.join(directory, filename)
+        
+        with open(filepath, "r", encoding="utf-8") as f:
+            html_content = f.read()
+        
+        # Try to load metadata
+        metadata_name = stem + ".json"
+        metadata = {}
+        if metadata_name in json_files:
+            with open(os.path.join(directory, metadata_name), "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+        
+        posts.append({
+            "id": stem,
+            "filename": filename,
+            "filepath": filepath,
+            "html_content": html_content,
+            "metadata": metadata,
+            "article_data": metadata.get("article", {})
+        })
     
     return posts
 
@@ -205,21 +213,22 @@ def process_posts_batch(
         List of feedback results
     """
     collector = FeedbackCollector()
-    results = []
     
-    for post in posts:
-        result = collector.collect_feedback(
-            blog_post_id=post["id"],
-            blog_post_html=post["html_content"],
-            article_data=post.get("article_data", {}),
-            score=default_score,
-            approved=approve_all,
-            feedback_type="overall",
-            comments="Batch processed"
-        )
-        
+    results = collector.collect_feedback_batch([
+        {
+            "blog_post_id": post["id"],
+            "blog_post_html": post["html_content"],
+            "article_data": post.get("article_data", {}),
+            "score": default_score,
+            "approved": approve_all,
+            "feedback_type": "overall",
+            "comments": "Batch processed"
+        }
+        for post in posts
+    ])
+    
+    for post, result in zip(posts, results):
         result["post_id"] = post["id"]
-        results.append(result)
     
     return results
 
@@ -2,18 +2,19 @@
 # Store and retrieve blog post examples for few-shot learning
 
 import os
+import zlib
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
-
+# supabase_storage loads .env on import
 from supabase_storage import get_supabase_client, SupabaseStorage
 
 
+def _decompress_html(data: bytes) -> str:
+    """Decompress HTML stored in the local example cache."""
+    return zlib.decompress(data).decode("utf-8")
+
+
 class ExampleStore:
     """
     Store and retrieve blog post examples for few-shot learning.
@@ -80,7 +81,8 @@ class ExampleStore:
             example = {
                 "original_article_url": original_article_url,
                 "original_article_title": original_article_title,
-                "generated_html": generated_html,
+                # Stored compressed; decompressed on read by _decompress_html()
+                "generated_html": zlib.compress(generated_html.encode("utf-8"), 1),
                 "category": category.lower(),
                 "feedback_score": feedback_score,
                 "feedback_comments": feedback_comments,
@@ -115,7 +117,7 @@ class ExampleStore:
         else:
             cache_key = f"{category.lower()}_good"
             return [
-                e["generated_html"] 
+                _decompress_html(e["generated_html"])
                 for e in self._local_cache[cache_key][:limit]
             ]
     
@@ -144,7 +146,7 @@ class ExampleStore:
         else:
             cache_key = f"{category.lower()}_bad"
             return [
-                e["generated_html"] 
+                _decompress_html(e["generated_html"])
                 for e in self._local_cache[cache_key][:limit]
             ]
     
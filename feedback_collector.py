@@ -2,8 +2,11 @@
 # Collect and store human feedback on generated blog posts
 
 import os
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+from datetime import datetime, timezone
 
 try:
     from dotenv import load_dotenv
@@ -11,10 +14,40 @@ try:
 except ImportError:
     pass
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from supabase_storage import get_supabase_client, get_supabase_storage, SupabaseStorage
 from example_store import ExampleStore
 
 
+def _iso(ns: int) -> str:
+    """Format a time.time_ns() timestamp as an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
+@lru_cache(maxsize=None)
+def _build_issue_automaton(keywords: Tuple[str, ...]):
+    """
+    Build an Aho-Corasick automaton over issue keywords.
+    
+    Cached per keyword set, so every FeedbackCollector shares one automaton
+    and adding keywords costs nothing per comment beyond the single scan.
+    
+    Returns:
+        ahocorasick.Automaton, or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
 class FeedbackCollector:
     """
     Collect and store human feedback on generated blog posts.
@@ -23,6 +56,26 @@ class FeedbackCollector:
     
     FEEDBACK_TYPES = ["structure", "content", "tone", "completeness", "overall"]
     
+    # Comment keyword -> issue label used by _extract_common_issues.
+    # Extend this table to track new issue types; all keywords are matched
+    # in one automaton pass, and labels are emitted in this order.
+    ISSUE_LABELS = {
+        "missing": "Missing elements",
+        "structure": "Structure issue",
+        "link": "Link issue"
+    }
+    # Comments shorter than the shortest keyword cannot contain any issue
+    MIN_ISSUE_KEYWORD_LEN = min(map(len, ISSUE_LABELS))
+    
+    # Maximum number of issues returned by _extract_common_issues
+    MAX_COMMON_ISSUES = 10
+    
+    # Queued records are flushed automatically once a batch reaches this size
+    BATCH_FLUSH_SIZE = 500
+    
+    # How long Supabase feedback patterns are reused before refetching (seconds)
+    PATTERNS_CACHE_SECONDS = 60
+    
     def __init__(self, supabase_client: Optional[SupabaseStorage] = None):
         """
         Initialize the feedback collector.
@@ -33,6 +86,26 @@ class FeedbackCollector:
         self.client = supabase_client or get_supabase_storage()
         self.example_store = ExampleStore(self.client)
         self._local_feedback: List[Dict] = []
+        self._batching = False
+        self._pending_feedback: List[Dict[str, Any]] = []
+        self._pending_examples: List[Dict[str, Any]] = []
+        # Result dicts handed back by _queue_feedback, updated by flush()
+        self._pending_results: List[Dict[str, Any]] = []
+        self._local_feedback_dirty = True
+        self._cached_patterns: List[Dict[str, Any]] = []
+        # Per-instance memo of Supabase patterns keyed by (category, time bucket)
+        self._patterns_memo = lru_cache(maxsize=8)(self._fetch_feedback_patterns)
+        self._issue_automaton = _build_issue_automaton(tuple(self.ISSUE_LABELS))
+    
+    def _find_issue_keywords(self, comment_lower: str) -> set:
+        """Find all issue keywords in a lowercased comment in a single scan."""
+        if self._issue_automaton is not None:
+            return {keyword for _, keyword in self._issue_automaton.iter(comment_lower)}
+        comment_len = len(comment_lower)
+        return {
+            keyword for keyword in self.ISSUE_LABELS
+            if comment_len >= len(keyword) and keyword in comment_lower
+        }
     
     def collect_feedback(
         self,
@@ -64,6 +137,18 @@ class FeedbackCollector:
         if feedback_type not in self.FEEDBACK_TYPES:
             feedback_type = "overall"
         
+        if self._batching and self.client:
+            return self._queue_feedback(
+                blog_post_id=blog_post_id,
+                blog_post_html=blog_post_html,
+                article_data=article_data,
+                score=score,
+                approved=approved,
+                feedback_type=feedback_type,
+                comments=comments,
+                reviewer_notes=reviewer_notes
+            )
+        
         # Store feedback
         feedback_result = self._store_feedback(
             blog_post_id=blog_post_id,
@@ -96,6 +181,140 @@ class FeedbackCollector:
             "approved": approved
         }
     
+    def collect_feedback_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Collect feedback on many blog posts with bulk database inserts.
+        
+        Args:
+            items: List of dicts with collect_feedback keyword arguments
+            
+        Returns:
+            List of per-item result dictionaries
+        """
+        with self.batch():
+            return [self.collect_feedback(**item) for item in items]
+    
+    @contextmanager
+    def batch(self) -> Iterator["FeedbackCollector"]:
+        """
+        Queue feedback and examples, inserting them in bulk on exit.
+        
+        Usage:
+            with collector.batch():
+                for post in posts:
+                    collector.collect_feedback(...)
+        """
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            self.flush()
+    
+    def flush(self) -> Dict[str, Any]:
+        """
+        Insert all queued feedback and examples.
+        
+        If a bulk insert fails, its rows are retried one at a time so a single
+        bad record cannot drop the rest. The result dict returned for each
+        queued item is updated in place with what was actually stored.
+        
+        Returns:
+            Result dictionary with counts per table
+        """
+        if not self.client or not (self._pending_feedback or self._pending_examples):
+            return {"success": True, "feedback_count": 0, "example_count": 0}
+        
+        feedback, self._pending_feedback = self._pending_feedback, []
+        examples, self._pending_examples = self._pending_examples, []
+        results, self._pending_results = self._pending_results, []
+        
+        feedback_result = self.client.save_feedback_batch(feedback)
+        self.invalidate_patterns_cache()
+        if feedback_result.get("success"):
+            feedback_stored = [True] * len(feedback)
+        else:
+            print(f"Error saving feedback batch, retrying per row: {feedback_result.get('error')}")
+            feedback_stored = [
+                self.client.save_feedback(**f).get("success", False) for f in feedback
+            ]
+        
+        example_result = self.client.save_blog_examples_batch(examples)
+        if example_result.get("success"):
+            example_stored = [True] * len(examples)
+        else:
+            print(f"Error saving example batch, retrying per row: {example_result.get('error')}")
+            example_stored = [
+                self.client.save_blog_example(**e).get("success", False) for e in examples
+            ]
+        
+        for result, f_ok, e_ok in zip(results, feedback_stored, example_stored):
+            result.update({
+                "success": f_ok and e_ok,
+                "queued": False,
+                "feedback_stored": f_ok,
+                "example_stored": e_ok
+            })
+        
+        return {
+            "success": all(feedback_stored) and all(example_stored),
+            "feedback_count": sum(feedback_stored),
+            "example_count": sum(example_stored)
+        }
+    
+    def _queue_feedback(
+        self,
+        blog_post_id: str,
+        blog_post_html: str,
+        article_data: Dict[str, Any],
+        score: int,
+        approved: bool,
+        feedback_type: str,
+        comments: str,
+        reviewer_notes: str
+    ) -> Dict[str, Any]:
+        """
+        Queue feedback and its example for the next flush().
+        
+        The returned dict reports success=False until flush() has written
+        the records, then is updated in place with the stored status.
+        """
+        category = article_data.get("category", "shoppers").lower()
+        is_good = score >= 4 and approved
+        
+        self._pending_feedback.append({
+            "blog_post_id": blog_post_id,
+            "feedback_type": feedback_type,
+            "score": score,
+            "comments": comments,
+            "approved": approved,
+            "reviewer_notes": reviewer_notes
+        })
+        self._pending_examples.append({
+            "original_article_url": article_data.get("link", ""),
+            "original_article_title": article_data.get("title", ""),
+            "generated_html": blog_post_html,
+            "category": category,
+            "feedback_score": score,
+            "feedback_comments": comments,
+            "is_good_example": is_good
+        })
+        
+        result = {
+            "success": False,
+            "queued": True,
+            "feedback_stored": False,
+            "example_stored": False,
+            "is_good_example": is_good,
+            "approved": approved
+        }
+        self._pending_results.append(result)
+        
+        if len(self._pending_feedback) >= self.BATCH_FLUSH_SIZE:
+            self.flush()
+        
+        return result
+    
     def _store_feedback(
         self,
         blog_post_id: str,
@@ -107,6 +326,7 @@ class FeedbackCollector:
     ) -> Dict[str, Any]:
         """Store feedback in database or local cache."""
         if self.client:
+            self.invalidate_patterns_cache()
             return self.client.save_feedback(
                 blog_post_id=blog_post_id,
                 feedback_type=feedback_type,
@@ -123,9 +343,14 @@ class FeedbackCollector:
                 "comments": comments,
                 "approved": approved,
                 "reviewer_notes": reviewer_notes,
-                "created_at": datetime.now().isoformat()
+                # Formatted lazily by get_local_feedback()
+                "created_at_ns": time.time_ns()
             }
+            if comments:
+                # Lowercased once here so issue extraction never re-lowers it
+                feedback["comments_lower"] = comments.lower()
             self._local_feedback.append(feedback)
+            self._local_feedback_dirty = True
             return {"success": True, "cached": True}
     
     def get_feedback_summary(
@@ -142,7 +367,7 @@ class FeedbackCollector:
             Summary dictionary with counts and averages
         """
         if self.client:
-            patterns = self.client.get_feedback_patterns(category=category)
+            patterns = self._get_feedback_patterns(category)
         else:
             patterns = self._analyze_local_feedback()
         
@@ -159,8 +384,42 @@ class FeedbackCollector:
             "common_issues": self._extract_common_issues(patterns)
         }
     
+    def _fetch_feedback_patterns(self, category: Optional[str], bucket: int) -> List[Dict[str, Any]]:
+        """Fetch feedback patterns from Supabase; `bucket` only keys the memo."""
+        return self.client.get_feedback_patterns(category=category)
+    
+    def _get_feedback_patterns(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get Supabase feedback patterns, reused for PATTERNS_CACHE_SECONDS."""
+        bucket = int(time.monotonic() // self.PATTERNS_CACHE_SECONDS)
+        return self._patterns_memo(category, bucket)
+    
+    def invalidate_patterns_cache(self) -> None:
+        """Drop memoized Supabase feedback patterns (called when feedback is saved)."""
+        self._patterns_memo.cache_clear()
+    
+    def get_local_feedback(self) -> List[Dict[str, Any]]:
+        """
+        Get locally cached feedback records (used when Supabase is unavailable).
+        
+        Returns:
+            Copies of the cached records with an ISO 8601 created_at timestamp
+        """
+        records = []
+        for feedback in self._local_feedback:
+            record = {k: v for k, v in feedback.items() if k not in ("created_at_ns", "comments_lower")}
+            record["created_at"] = _iso(feedback["created_at_ns"])
+            records.append(record)
+        return records
+    
+    def invalidate_cache(self) -> None:
+        """Force the next summary to re-analyze the local feedback cache."""
+        self._local_feedback_dirty = True
+    
     def _analyze_local_feedback(self) -> List[Dict[str, Any]]:
-        """Analyze local feedback cache."""
+        """Analyze local feedback cache (reuses the last result until new feedback arrives)."""
+        if not self._local_feedback_dirty:
+            return self._cached_patterns
+        
         patterns = {}
         for feedback in self._local_feedback:
             ftype = feedback.get("feedback_type", "unknown")
@@ -169,44 +428,50 @@ class FeedbackCollector:
                     "type": ftype,
                     "count": 0,
                     "avg_score": 0,
-                    "comments": []
+                    "comments": [],
+                    "comments_lower": []
                 }
-            patterns[ftype]["count"] += 1
-            patterns[ftype]["avg_score"] += feedback.get("score", 0)
+            data = patterns[ftype]
+            data["count"] += 1
+            # Running mean, so no second pass is needed to divide totals
+            data["avg_score"] += (feedback.get("score", 0) - data["avg_score"]) / data["count"]
             if feedback.get("comments"):
-                patterns[ftype]["comments"].append(feedback["comments"])
-        
-        # Calculate averages
-        for ftype, data in patterns.items():
-            if data["count"] > 0:
-                data["avg_score"] = data["avg_score"] / data["count"]
+                data["comments"].append(feedback["comments"])
+                data["comments_lower"].append(feedback["comments_lower"])
         
-        return list(patterns.values())
+        self._cached_patterns = list(patterns.values())
+        self._local_feedback_dirty = False
+        return self._cached_patterns
     
     def _extract_common_issues(
         self,
         patterns: List[Dict[str, Any]]
     ) -> List[str]:
-        """Extract common issues from feedback patterns."""
-        issues = []
+        """Extract up to MAX_COMMON_ISSUES unique issues, in first-seen order."""
+        # dict keys act as an insertion-ordered set
+        issues: Dict[str, None] = {}
         
         for pattern in patterns:
             if pattern.get("avg_score", 5) < 3:
-                issues.append(f"Low score in {pattern.get('type', 'unknown')}")
+                issues[f"Low score in {pattern.get('type', 'unknown')}"] = None
+                if len(issues) >= self.MAX_COMMON_ISSUES:
+                    return list(issues)
             
             # Analyze comments for common keywords
             comments = pattern.get("comments", [])
-            for comment in comments:
-                comment_lower = comment.lower()
-                if "missing" in comment_lower:
-                    issues.append(f"Missing elements: {comment}")
-                if "structure" in comment_lower:
-                    issues.append(f"Structure issue: {comment}")
-                if "link" in comment_lower:
-                    issues.append(f"Link issue: {comment}")
+            # Local patterns carry pre-lowered comments; Supabase ones don't
+            comments_lower = pattern.get("comments_lower") or [c.lower() for c in comments]
+            for comment, comment_lower in zip(comments, comments_lower):
+                if len(comment) < self.MIN_ISSUE_KEYWORD_LEN:
+                    continue
+                found = self._find_issue_keywords(comment_lower)
+                for keyword, label in self.ISSUE_LABELS.items():
+                    if keyword in found:
+                        issues[f"{label}: {comment}"] = None
+                        if len(issues) >= self.MAX_COMMON_ISSUES:
+                            return list(issues)
         
-        # Deduplicate
-        return list(set(issues))[:10]
+        return list(issues)
     
     def get_approval_rate(self) -> float:
         """
@@ -218,7 +483,7 @@ class FeedbackCollector:
         if self.client:
             # Would need a specific query for this
             # For now, use patterns
-            patterns = self.client.get_feedback_patterns()
+            patterns = self._get_feedback_patterns()
             total = sum(p.get("count", 0) for p in patterns)
             # Approximate based on average scores
             approved = sum(
@@ -7,51 +7,56 @@ import os
 import sys
 import json
 import argparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    import orjson
 except ImportError:
-    pass
+    orjson = None
 
-from supabase import create_client, Client
+if TYPE_CHECKING:
+    from supabase import Client
 
 
 # ============================================================================
-# DATE UTILITIES (imported from check_blog_status.py for consistency)
+# CONFIGURATION
 # ============================================================================
 
-from check_blog_status import get_week_start_date
+# Upper bound on posts fetched per run (a week normally has ~7)
+MAX_POSTS = 500
+
+# Columns read by write_post_json, with the value used when a column is absent
+# (rows selected by fetch_published_posts always have all of them)
+POST_DEFAULTS = {
+    "title": "Article",
+    "blogger_url": None,
+    "category": "SHOPPERS",
+    "article_url": "",
+    "image_url": None,
+    "created_at": "",
+    "blogger_post_id": None,
+    "status": None,
+    "id": None
+}
+_post_fields = itemgetter(*POST_DEFAULTS)
 
 
 # ============================================================================
-# SUPABASE CLIENT
+# DATE UTILITIES AND SUPABASE CLIENT (shared with check_blog_status.py)
 # ============================================================================
 
-def get_supabase_client() -> Optional[Client]:
-    """
-    Get a Supabase client instance.
-
-    Returns:
-        Supabase Client instance or None if credentials not set
-    """
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_KEY")
-
-    if not url or not key:
-        print("Error: SUPABASE_URL and SUPABASE_KEY must be set")
-        return None
-
-    return create_client(url, key)
+from check_blog_status import get_week_start_date, get_supabase_client
 
 
 # ============================================================================
 # FETCH PUBLISHED POSTS
 # ============================================================================
 
-def fetch_published_posts(supabase: Client, week_start: datetime) -> List[Dict[str, Any]]:
+def fetch_published_posts(supabase: "Client", week_start: datetime) -> List[Dict[str, Any]]:
     """
     Query Supabase for this week's published blog posts.
 
@@ -71,16 +76,19 @@ def fetch_published_posts(supabase: Client, week_start: datetime) -> List[Dict[s
     week_start_iso = week_start.isoformat()
 
     try:
+        # Only the columns write_post_json reads, newest first
         result = supabase.table("blog_posts").select(
             "id, title, category, status, blogger_url, blogger_post_id, "
-            "article_url, image_url, blogger_published_at, created_at, updated_at"
+            "article_url, image_url, blogger_published_at, created_at"
         ).gte(
             "blogger_published_at", week_start_iso
         ).eq(
             "status", "published"
         ).not_.is_(
             "blogger_url", "null"
-        ).execute()
+        ).order(
+            "blogger_published_at", desc=True
+        ).limit(MAX_POSTS).execute()
 
         return result.data or []
     except Exception as e:
@@ -88,10 +96,56 @@ def fetch_published_posts(supabase: Client, week_start: datetime) -> List[Dict[s
         return []
 
 
+def count_published_posts(supabase: "Client", week_start: datetime) -> Optional[int]:
+    """
+    Count this week's published blog posts without fetching any rows.
+
+    Uses the same criteria as fetch_published_posts with a HEAD request.
+
+    Args:
+        supabase: Supabase client
+        week_start: Start of the week (datetime)
+
+    Returns:
+        Number of published posts, or None if the count query failed
+    """
+    week_start_iso = week_start.isoformat()
+
+    try:
+        result = supabase.table("blog_posts").select(
+            "id", count="exact", head=True
+        ).gte(
+            "blogger_published_at", week_start_iso
+        ).eq(
+            "status", "published"
+        ).not_.is_(
+            "blogger_url", "null"
+        ).execute()
+
+        return result.count
+    except Exception as e:
+        print(f"Error counting blog posts: {e}")
+        return None
+
+
+def _write_bytes(filepath: str, data: bytes) -> None:
+    """Write bytes to a file with raw fd syscalls (no buffered text layer)."""
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
 def write_post_json(post: Dict[str, Any], output_dir: str) -> str:
     """
     Write a blog post to a JSON file.
 
+    The output directory must already exist (see fetch_and_write_posts).
+
     Args:
         post: Blog post record from Supabase
         output_dir: Output directory path
@@ -99,34 +153,47 @@ def write_post_json(post: Dict[str, Any], output_dir: str) -> str:
     Returns:
         Path to the written file
     """
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-
     # Build the JSON structure expected by mailchimp_campaign.py
     # Note: The blog_posts table doesn't have a summary column, so we leave it empty
     # The newsletter will still work - it just won't show summaries under article links
+    try:
+        # Rows from fetch_published_posts carry every selected column
+        fields = _post_fields(post)
+    except KeyError:
+        fields = [post.get(column, default) for column, default in POST_DEFAULTS.items()]
+    (
+        title, blogger_url, category, article_url, image_url,
+        created_at, blogger_post_id, status, post_id
+    ) = fields
+
     post_data = {
-        "title": post.get("title", "Article"),
-        "blogger_url": post.get("blogger_url"),
-        "published_url": post.get("blogger_url"),  # Alias for compatibility
-        "category": post.get("category", "SHOPPERS"),
+        "title": title,
+        "blogger_url": blogger_url,
+        "published_url": blogger_url,  # Alias for compatibility
+        "category": category,
         "summary": "",  # No summary column in blog_posts table
         "description": "",  # Alias for compatibility
-        "original_link": post.get("article_url", ""),
-        "generated_at": post.get("created_at", ""),
-        "blogger_post_id": post.get("blogger_post_id"),
-        "image_url": post.get("image_url"),
-        "status": post.get("status"),
-        "id": post.get("id")
+        "original_link": article_url,
+        "generated_at": created_at,
+        "blogger_post_id": blogger_post_id,
+        "image_url": image_url,
+        "status": status,
+        "id": post_id
     }
 
     # Use the database ID for the filename
-    post_id = post.get("id", "unknown")
+    if "id" not in post:
+        post_id = "unknown"
     filename = f"{post_id}.json"
     filepath = os.path.join(output_dir, filename)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(post_data, f, indent=2, ensure_ascii=False)
+    if orjson:
+        # orjson serializes straight to UTF-8 bytes
+        payload = orjson.dumps(post_data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(post_data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    _write_bytes(filepath, payload)
 
     return filepath
 
@@ -151,7 +218,10 @@ def fetch_and_write_posts(output_dir: str = "blog_posts") -> Dict[str, Any]:
     week_start = get_week_start_date()
     print(f"Fetching posts created since: {week_start.isoformat()}")
 
-    posts = fetch_published_posts(supabase, week_start)
+    # Cheap count-only probe first: skips the full select on empty weeks
+    posts = []
+    if count_published_posts(supabase, week_start) != 0:
+        posts = fetch_published_posts(supabase, week_start)
 
     if not posts:
         return {
@@ -164,15 +234,16 @@ def fetch_and_write_posts(output_dir: str = "blog_posts") -> Dict[str, Any]:
             "warning": "No published posts found for this week"
         }
 
-    # Count by category
-    shoppers_count = sum(1 for p in posts if (p.get("category") or "").upper() == "SHOPPERS")
-    recall_count = sum(1 for p in posts if (p.get("category") or "").upper() == "RECALL")
+    category_counts = Counter((p.get("category") or "").upper() for p in posts)
+    shoppers_count = category_counts.get("SHOPPERS", 0)
+    recall_count = category_counts.get("RECALL", 0)
+
+    # Create output directory once, then write the files concurrently
+    os.makedirs(output_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=min(16, len(posts))) as executor:
+        files_written = list(executor.map(lambda p: write_post_json(p, output_dir), posts))
 
-    # Write each post to a JSON file
-    files_written = []
-    for post in posts:
-        filepath = write_post_json(post, output_dir)
-        files_written.append(filepath)
+    for post, filepath in zip(posts, files_written):
         print(f"  Wrote: {filepath} - {post.get('title', 'Untitled')[:50]}")
 
     return {
@@ -159,7 +159,7 @@ export default function JobsPage() {
                     
                     <div>
                       <p className="font-medium text-stone-900">
-                        {job.config?.batch_size || 10} articles • {job.config?.model || 'gpt-4'}
+                        {job.config?.batch_size || 10} articles • {job.config?.model || 'gpt-4o-mini'}
                       </p>
                       <p className="text-sm text-stone-500">
                         {formatRelativeTime(job.started_at || job.completed_at)}
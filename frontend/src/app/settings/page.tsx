@@ -8,7 +8,7 @@ export default function SettingsPage() {
   const [config, setConfig] = useState({
     batchSize: 10,
     searchDaysBack: 30,
-    model: 'gpt-4',
+    model: 'gpt-4o-mini',
     usePlaceholderImages: false,
     useLegacyOrchestrator: false,
   })
@@ -98,6 +98,8 @@ export default function SettingsPage() {
               onChange={(e) => setConfig({ ...config, model: e.target.value })}
               className="w-full px-3 py-2 rounded-lg border border-midnight-300 bg-white text-stone-900 focus:ring-2 focus:ring-youdle-500 focus:border-transparent"
             >
+              <option value="gpt-4o-mini">GPT-4o mini</option>
+              <option value="gpt-4o">GPT-4o</option>
               <option value="gpt-4">GPT-4</option>
               <option value="gpt-4-turbo">GPT-4 Turbo</option>
               <option value="gpt-3.5-turbo">GPT-3.5 Turbo</option>
@@ -21,7 +21,7 @@ export function QuickActions({ onSearchPreview, onStartGeneration, className }:
       const response = await api.startGeneration({
         batch_size: 6,
         search_days_back: 3,
-        model: 'gpt-4',
+        model: 'gpt-4o-mini',
         use_placeholder_images: false,
       })
       onStartGeneration?.(response.job_id)
@@ -76,7 +76,7 @@ export function RunStatus({ jobs, className, onCancel }: RunStatusProps) {
 
                 <div className="flex-1">
                   <p className="text-sm font-medium text-stone-900 ">
-                    {job.config?.batch_size || 10} articles • {job.config?.model || 'gpt-4'}
+                    {job.config?.batch_size || 10} articles • {job.config?.model || 'gpt-4o-mini'}
                   </p>
                   <div className="flex items-center gap-3 mt-1">
                     <p className="text-xs text-stone-500 ">
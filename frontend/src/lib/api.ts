@@ -313,7 +313,7 @@ class ApiClient {
       body: JSON.stringify({
         batch_size: config.batch_size ?? 10,
         search_days_back: config.search_days_back ?? 30,
-        model: config.model ?? 'gpt-4',
+        model: config.model ?? 'gpt-4o-mini',
         use_placeholder_images: config.use_placeholder_images ?? false,
         use_legacy_orchestrator: config.use_legacy_orchestrator ?? false,
       }),
@@ -8,6 +8,11 @@ import json
 import argparse
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
@@ -15,47 +20,76 @@ except ImportError:
     pass
 
 
-def check_environment(quiet=False):
-    """Check that required environment variables are set."""
-    required_vars = [
-        ("EXA_API_KEY", "Exa search API"),
-        ("OPENAI_API_KEY", "OpenAI blog generation")
-    ]
+def _dumps(obj) -> str:
+    """Serialize a result dict as indented JSON (orjson when installed)."""
+    if orjson:
+        # Datetimes go through default=str, as in the json path, so naive
+        # local times aren't given a zone they don't have
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            default=str
+        ).decode("utf-8")
+    return json.dumps(obj, indent=2, default=str)
+
 
-    optional_vars = [
-        ("GEMINI_API_KEY", "Gemini image generation"),
-        ("SUPABASE_URL", "Supabase storage"),
-        ("SUPABASE_KEY", "Supabase storage")
-    ]
+# Environment variables checked at startup, with what each one enables
+REQUIRED_ENV_VARS = {
+    "EXA_API_KEY": "Exa search API",
+    "OPENAI_API_KEY": "OpenAI blog generation"
+}
 
-    missing_required = []
-    missing_optional = []
+OPTIONAL_ENV_VARS = {
+    "GEMINI_API_KEY": "Gemini image generation",
+    "IMGBB_API_KEY": "imgBB image hosting",
+    "SUPABASE_URL": "Supabase storage",
+    "SUPABASE_KEY": "Supabase storage"
+}
 
-    for var, description in required_vars:
-        if not os.getenv(var):
-            missing_required.append(f"  - {var}: {description}")
+# Articles listed by --dry-run (the search stops once it has this many)
+DRY_RUN_TOP = 6
+DRY_RUN_RECALL = 3
 
-    for var, description in optional_vars:
-        if not os.getenv(var):
-            missing_optional.append(f"  - {var}: {description}")
+
+def check_environment(quiet=False):
+    """Check that required environment variables are set."""
+    environ = os.environ
+    missing_required = [var for var in REQUIRED_ENV_VARS if not environ.get(var)]
 
     if missing_required:
         if not quiet:
-            print("ERROR: Missing required environment variables:", file=sys.stderr)
-            for var in missing_required:
-                print(var, file=sys.stderr)
-            print("\nPlease set these variables in your .env file or environment.", file=sys.stderr)
+            sys.stderr.write(
+                "ERROR: Missing required environment variables:\n"
+                + "".join(f"  - {var}: {REQUIRED_ENV_VARS[var]}\n" for var in missing_required)
+                + "\nPlease set these variables in your .env file or environment.\n"
+            )
         return False
 
-    if missing_optional and not quiet:
-        print("WARNING: Missing optional environment variables:", file=sys.stderr)
-        for var in missing_optional:
-            print(var, file=sys.stderr)
-        print("\nSome features may be limited.\n", file=sys.stderr)
+    if quiet:
+        return True
+
+    missing_optional = [var for var in OPTIONAL_ENV_VARS if not environ.get(var)]
+    if missing_optional:
+        sys.stderr.write(
+            "WARNING: Missing optional environment variables:\n"
+            + "".join(f"  - {var}: {OPTIONAL_ENV_VARS[var]}\n" for var in missing_optional)
+            + "\nSome features may be limited.\n\n"
+        )
 
     return True
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main entry point for blog post generation."""
     parser = argparse.ArgumentParser(
@@ -64,16 +98,21 @@ def main():
         epilog="""
 Examples:
   python generate_blog_posts.py                    # Run with defaults
-  python generate_blog_posts.py --model gpt-3.5-turbo  # Use faster model
+  python generate_blog_posts.py --model gpt-4o     # Use the stronger model throughout
   python generate_blog_posts.py --placeholder-images   # Skip image generation
   python generate_blog_posts.py --batch-size 50        # Search more articles
+  python generate_blog_posts.py --concurrency 8        # More parallel image requests
+
+Concurrency: 4 parallel Gemini image requests suits the default quota; raise
+it (8-16) only with a higher per-minute quota, lower it (1-2) for local testing.
+Rate-limited requests are retried with backoff either way.
         """
     )
     
     parser.add_argument(
         "--model", "-m",
-        default="gpt-4",
-        help="OpenAI model to use (default: gpt-4)"
+        default="gpt-4o-mini",
+        help="OpenAI model to use (default: gpt-4o-mini; failed posts retry on gpt-4o)"
     )
     
     parser.add_argument(
@@ -96,6 +135,21 @@ Examples:
         help="How far back to search for articles in days (default: 30)"
     )
     
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=_positive_int,
+        # A string default goes through type= too, so a bad env value is a usage error
+        default=os.environ.get("YOUDLE_CONCURRENCY", "4"),
+        help="Maximum parallel image generation requests (default: 4, or $YOUDLE_CONCURRENCY)"
+    )
+    
+    parser.add_argument(
+        "--http-timeout",
+        type=float,
+        default=float(os.environ["YOUDLE_HTTP_TIMEOUT"]) if os.environ.get("YOUDLE_HTTP_TIMEOUT") else None,
+        help="Image API request timeout in seconds (default: SDK default, or $YOUDLE_HTTP_TIMEOUT)"
+    )
+    
     parser.add_argument(
         "--output", "-o",
         default="blog_posts",
@@ -105,7 +159,9 @@ Examples:
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Show what would be done without actually generating posts"
+        help=f"Preview the top articles without generating posts (stops searching once "
+             f"{DRY_RUN_TOP} shoppers and {DRY_RUN_RECALL} recall articles are found, "
+             "so totals are not shown)"
     )
     
     parser.add_argument(
@@ -138,24 +194,7 @@ Examples:
                 "posts_failed": 0,
                 "duration_seconds": 0
             }
-            print(json.dumps(error_result, indent=2), flush=True)
-        sys.exit(1)
-
-    # Import after environment check (wrapped in try/except for JSON mode)
-    try:
-        from blog_post_generator import BlogPostOrchestrator, run_generation
-    except Exception as e:
-        if args.json:
-            error_result = {
-                "success": False,
-                "error": f"Import error: {e}",
-                "posts_generated": 0,
-                "posts_failed": 0,
-                "duration_seconds": 0
-            }
-            print(json.dumps(error_result, indent=2), flush=True)
-        else:
-            print(f"\nERROR: Failed to import blog_post_generator: {e}", file=sys.stderr)
+            print(_dumps(error_result), flush=True)
         sys.exit(1)
 
     if args.dry_run:
@@ -171,27 +210,49 @@ Examples:
         from zap_exa_ranker import main as search_articles
         
         print("\nSearching for articles...")
+        # Only the head of each list is shown, so let the ranker stop early
         results = search_articles({
             "batch_size": args.batch_size,
-            "search_days_back": args.days_back
+            "search_days_back": args.days_back,
+            "limit_top": DRY_RUN_TOP,
+            "limit_recall": DRY_RUN_RECALL
         })
         
         items = results.get("items", [])
         recall_items = results.get("recall_items", [])
         
-        print(f"\nFound {len(items)} articles, {len(recall_items)} recall items")
+        print(f"\nPreview: first {len(items)} articles, {len(recall_items)} recall items "
+              "(search stopped early; a full run may find more)")
         
         print("\nTop shoppers articles:")
-        for i, item in enumerate(items[:6], 1):
+        for i, item in enumerate(items, 1):
             print(f"  {i}. {item.get('title', 'Unknown')[:60]}...")
         
         if recall_items:
             print("\nRecall articles:")
-            for i, item in enumerate(recall_items[:3], 1):
+            for i, item in enumerate(recall_items, 1):
                 print(f"  {i}. {item.get('title', 'Unknown')[:60]}...")
         
         return
 
+    # Import only when generating: blog_post_generator pulls in LangGraph,
+    # OpenAI, Supabase and Gemini (wrapped in try/except for JSON mode)
+    try:
+        from blog_post_generator import run_generation
+    except Exception as e:
+        if args.json:
+            error_result = {
+                "success": False,
+                "error": f"Import error: {e}",
+                "posts_generated": 0,
+                "posts_failed": 0,
+                "duration_seconds": 0
+            }
+            print(_dumps(error_result), flush=True)
+        else:
+            print(f"\nERROR: Failed to import blog_post_generator: {e}", file=sys.stderr)
+        sys.exit(1)
+
     # Run the generation workflow
     if not args.json:
         print("\n" + "=" * 60)
@@ -208,13 +269,15 @@ Examples:
             use_placeholder_images=args.placeholder_images,
             batch_size=args.batch_size,
             search_days_back=args.days_back,
-            use_langgraph=not args.legacy
+            use_langgraph=not args.legacy,
+            concurrency=args.concurrency,
+            http_timeout=args.http_timeout
         )
 
         if args.json:
             # Exclude full state from JSON output for readability
             result_output = {k: v for k, v in result.items() if k != "final_state"}
-            print(json.dumps(result_output, indent=2, default=str), flush=True)
+            print(_dumps(result_output), flush=True)
         else:
             print("\n" + "=" * 60)
             print("COMPLETE")
@@ -258,7 +321,7 @@ Examples:
                 "posts_failed": 0,
                 "duration_seconds": 0
             }
-            print(json.dumps(error_result, indent=2), flush=True)
+            print(_dumps(error_result), flush=True)
         else:
             print("\n\nInterrupted by user", file=sys.stderr)
         sys.exit(130)
@@ -272,10 +335,10 @@ Examples:
                 "posts_failed": 0,
                 "duration_seconds": 0
             }
-            print(json.dumps(error_result, indent=2), flush=True)
+            print(_dumps(error_result), flush=True)
         else:
             print(f"\nERROR: {e}", file=sys.stderr)
-            if args.verbose:
+            if args.verbose or os.getenv("YOUDLE_DEBUG"):
                 import traceback
                 traceback.print_exc()
         sys.exit(1)
@@ -3,8 +3,36 @@
 # Uses the new google-genai SDK for image generation
 
 import os
+import sys
+import json
+import time
+import asyncio
 import base64
-from typing import Optional, Dict, Any, List
+import binascii
+import random
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
+from string import Formatter
+from types import MappingProxyType
+from xml.sax.saxutils import escape
+from typing import Optional, Dict, Any, List, AsyncIterator, Callable, Mapping, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Full Unicode grapheme clusters (\X) for placeholder title truncation
+    import regex
+except ImportError:
+    regex = None
 
 try:
     from dotenv import load_dotenv
@@ -12,15 +40,10 @@ try:
 except ImportError:
     pass
 
-# Import the new google-genai SDK
+# The google-genai SDK is imported by the first ImageGenerator (see _load_genai)
+# so placeholder-only runs never pay for its import
 genai_client = None
 genai_types = None
-try:
-    from google import genai
-    from google.genai import types as genai_types
-    genai_client = genai
-except ImportError:
-    pass
 
 
 # ============================================================================
@@ -30,6 +53,51 @@ except ImportError:
 DEFAULT_IMAGE_SIZE = "1K"  # Options: "1K", "2K", "4K"
 DEFAULT_ASPECT_RATIO = "16:9"
 
+# Generated-image cache: in-memory LRU in front of an on-disk SQLite store
+IMAGE_CACHE_PATH = os.path.expanduser(
+    os.getenv("IMAGE_CACHE_PATH", "~/.cache/youdle/images.sqlite")
+)
+IMAGE_CACHE_MEMORY_SIZE = 512
+# Upper bound on the SQLite store; oldest images are evicted past it (0 = unbounded)
+IMAGE_CACHE_MAX_BYTES = int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(1024 ** 3)))
+
+# Entries older than this (seconds) are treated as misses and regenerated
+IMAGE_CACHE_TTL = int(os.getenv("IMAGE_CACHE_TTL", "86400"))
+
+# Prefix on every cache key; bump when IMAGE_PROMPT_TEMPLATE or the response
+# handling changes so stale images are never served
+IMAGE_CACHE_VERSION = "v1"
+
+# Memoized article themes and built prompts; sized to cover several batches so
+# previews, retries and re-runs in one process never recompute either
+THEME_CACHE_SIZE = 2048
+
+# Optional semantic layer: reuse an image whose title embedding is close enough.
+# Off unless IMAGE_SEMANTIC_CACHE=1 and sentence-transformers is installed.
+SEMANTIC_CACHE_ENABLED = os.getenv("IMAGE_SEMANTIC_CACHE", "").lower() in ("1", "true", "yes")
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.92
+
+# Threads shared by every generate_images_concurrent call; per-call concurrency
+# is gated by an asyncio.Semaphore rather than by the pool size
+IMAGE_EXECUTOR_MAX_WORKERS = 32
+
+# Generated images smaller than this are treated as truncated responses
+MIN_IMAGE_BYTES = 1024
+
+# Retry policy for transient failures (HTTP 429 / RESOURCE_EXHAUSTED, 5xx, timeouts)
+IMAGE_MAX_RETRIES = 4
+IMAGE_RETRY_BASE_DELAY = 1.0  # seconds, doubled per attempt
+IMAGE_RETRY_MAX_DELAY = 30.0
+
+# Client-side cap on Gemini requests per second across all generators
+# (0 disables); keeps batches under quota instead of reacting to 429s
+GEMINI_RPS = float(os.getenv("GEMINI_RPS", "2"))
+
+# Per-call progress lines and full tracebacks for generation failures
+# (otherwise only failures are printed, one stderr line each)
+DEBUG = bool(os.getenv("YOUDLE_DEBUG"))
+
 IMAGE_PROMPT_TEMPLATE = """Create a unique, eye-catching image for a grocery newsletter article titled "{title}".
 
 Theme/Context: {theme}
@@ -52,18 +120,508 @@ Style guidelines:
 
 The image should immediately convey what the article is about without reading the title."""
 
+# IMAGE_PROMPT_TEMPLATE pre-split into (literal, field) pairs so building a
+# prompt is a single join rather than a re-parse of the template
+_PROMPT_SEGMENTS = tuple(
+    (literal, field) for literal, field, _, _ in Formatter().parse(IMAGE_PROMPT_TEMPLATE)
+)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+_embedder = None
+_embedder_lock = threading.Lock()
+# genai clients shared per (api_key, timeout) so generators reuse one connection pool
+_clients: Dict[Tuple[str, Optional[float]], Any] = {}
+_clients_lock = threading.Lock()
+
+
+@lru_cache(maxsize=THEME_CACHE_SIZE)
+def _build_image_prompt(title: str, theme: str) -> str:
+    """Fill IMAGE_PROMPT_TEMPLATE; repeated title/theme pairs are memoized."""
+    values = {"title": title, "theme": theme}
+    return "".join(
+        literal + (values[field] if field else "")
+        for literal, field in _PROMPT_SEGMENTS
+    )
+
+
+def image_data_b64(result: Dict[str, Any]) -> Optional[str]:
+    """
+    Return a generation result's image as a base64 string.
+
+    Generators return raw image_bytes; encoding is deferred to the callers
+    that actually need text (JSON, data URIs).
+
+    Args:
+        result: Result from generate_image / generate_image_for_article
+
+    Returns:
+        Base64-encoded image, or None if the result has no image
+    """
+    image_bytes = result.get("image_bytes")
+    if image_bytes is None:
+        return result.get("image_data")
+    if isinstance(image_bytes, str):
+        # Already base64 text; no re-encoding
+        return image_bytes
+    # b2a_base64 encodes in one C call straight from the buffer
+    return binascii.b2a_base64(memoryview(image_bytes), newline=False).decode("ascii")
+
+
+def image_mime_type(result: Dict[str, Any]) -> str:
+    """
+    Return the Content-Type for a generation result's image_bytes.
+
+    Gemini results carry a full MIME type in "format"; placeholders carry a
+    bare subtype ("svg").
+
+    Args:
+        result: Result from generate_image / generate_image_for_article
+
+    Returns:
+        MIME type such as "image/png" or "image/svg+xml"
+    """
+    image_format = result.get("format") or "png"
+    if "/" in image_format:
+        return image_format
+    if image_format == "svg":
+        return "image/svg+xml"
+    return f"image/{image_format}"
+
+
+@lru_cache(maxsize=16)
+def _content_config(aspect_ratio: str, image_size: str):
+    """
+    Return the GenerateContentConfig for an aspect ratio and size.
+
+    Memoized because nearly every call uses the defaults; the SDK only reads
+    the config when serializing the request, so one instance can be shared.
+    """
+    return genai_types.GenerateContentConfig(
+        response_modalities=["TEXT", "IMAGE"],
+        image_config=genai_types.ImageConfig(
+            aspect_ratio=aspect_ratio,
+            image_size=image_size
+        )
+    )
+
+
+def _send_to_sink(result: Dict[str, Any], sink: Callable[[bytes, str], str]) -> Dict[str, Any]:
+    """
+    Hand a generation result's image to sink and return the result without its payload.
+
+    Args:
+        result: Result from generate_image
+        sink: Callable taking (image_bytes, mime type) and returning a URI
+
+    Returns:
+        The result with "uri" in place of image_bytes (unchanged on failure)
+    """
+    image_bytes = result.pop("image_bytes", None)
+    if not result.get("success") or not image_bytes:
+        result["image_bytes"] = image_bytes
+        return result
+    try:
+        result["uri"] = sink(image_bytes, image_mime_type(result))
+    except Exception as e:
+        print(f"[ImageGenerator] ✗ Image sink failed: {type(e).__name__}: {e}",
+              file=sys.stderr, flush=True)
+        return {**result, "success": False, "error": str(e)}
+    return result
+
+
+def _load_genai() -> None:
+    """Import the google-genai SDK on first use."""
+    global genai_client, genai_types
+    if genai_client is None:
+        from google import genai
+        from google.genai import types
+        genai_client, genai_types = genai, types
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether an SDK error is a transient quota/availability failure worth retrying."""
+    if getattr(error, "code", None) in (429, 503):
+        return True
+    message = str(error)
+    return "RESOURCE_EXHAUSTED" in message or "UNAVAILABLE" in message
+
+
+def _image_bytes_error(image_bytes: bytes) -> Optional[str]:
+    """Return why image_bytes is not a usable PNG/JPEG/WebP, or None if it looks valid."""
+    if len(image_bytes) < MIN_IMAGE_BYTES:
+        return f"image too small ({len(image_bytes)} bytes)"
+    if (image_bytes.startswith(b"\x89PNG\r\n\x1a\n") or image_bytes.startswith(b"\xff\xd8\xff")
+            or (image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP")):
+        return None
+    return "invalid image magic bytes"
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether an SDK error is worth retrying: rate limits, 5xx responses and timeouts."""
+    if _is_rate_limited(error) or getattr(error, "code", None) in (500, 502, 504):
+        return True
+    # httpx/requests timeouts don't subclass the builtin TimeoutError
+    return isinstance(error, TimeoutError) or "Timeout" in type(error).__name__
+
+
+class _RateLimiter:
+    """Thread-safe minimum-interval limiter: at most `rps` acquisitions per second."""
+
+    def __init__(self, rps: float):
+        self.min_interval = 1.0 / rps if rps > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def acquire(self) -> None:
+        """Block until the caller's request slot comes up."""
+        if not self.min_interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_rate_limiter = _RateLimiter(GEMINI_RPS)
+
+
+def _call_with_retry(fn):
+    """
+    Call fn under the shared rate limiter, retrying transient failures with
+    jittered exponential backoff.
+
+    Non-transient errors, and the last transient one, are re-raised.
+    """
+    for attempt in range(IMAGE_MAX_RETRIES + 1):
+        _rate_limiter.acquire()
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == IMAGE_MAX_RETRIES or not _is_transient(e):
+                raise
+            delay = min(IMAGE_RETRY_BASE_DELAY * 2 ** attempt, IMAGE_RETRY_MAX_DELAY)
+            print(f"[ImageGenerator] Transient error ({type(e).__name__}), retrying in {delay:.0f}s "
+                  f"({attempt + 1}/{IMAGE_MAX_RETRIES})", file=sys.stderr, flush=True)
+            time.sleep(delay + random.random() * IMAGE_RETRY_BASE_DELAY)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared image-generation thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=IMAGE_EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="img-gen"
+                )
+    return _executor
+
+
+def _get_client(api_key: str, http_timeout: Optional[float] = None):
+    """Return the shared genai Client for an API key and timeout, creating it on first use."""
+    key = (api_key, http_timeout)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                http_options = None
+                if http_timeout:
+                    http_options = genai_types.HttpOptions(timeout=int(http_timeout * 1000))  # ms
+                client = _clients[key] = genai_client.Client(api_key=api_key, http_options=http_options)
+    return client
+
+
+def _get_embedder():
+    """Load the sentence-transformers model on first use (None if unavailable)."""
+    global _embedder
+    if _embedder is None:
+        with _embedder_lock:
+            if _embedder is None:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                    _embedder = SentenceTransformer(SEMANTIC_CACHE_MODEL)
+                except Exception as e:
+                    print(f"Warning: semantic image cache disabled ({e})")
+                    _embedder = False
+    return _embedder or None
+
+
+class ImageCache:
+    """
+    Two-tier cache for generated images.
+
+    Exact lookups go through an in-memory LRU and then a SQLite store keyed on
+    the prompt hash. With the semantic layer enabled, a miss falls back to the
+    stored image whose title embedding has the highest cosine similarity
+    (at or above SEMANTIC_CACHE_THRESHOLD) for the same model/size variant.
+    Entries older than the TTL count as misses in both tiers.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = IMAGE_CACHE_PATH,
+        memory_size: int = IMAGE_CACHE_MEMORY_SIZE,
+        semantic: bool = SEMANTIC_CACHE_ENABLED,
+        ttl: int = IMAGE_CACHE_TTL,
+        max_bytes: int = IMAGE_CACHE_MAX_BYTES
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file path (None keeps the cache in memory only)
+            memory_size: Maximum entries held in the in-memory LRU
+            semantic: Enable title-embedding similarity lookups
+            ttl: Maximum entry age in seconds (0 disables expiry)
+            max_bytes: Maximum image bytes kept on disk (0 = unbounded)
+        """
+        self.memory_size = memory_size
+        self.semantic = semantic
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        # Bytes on disk as of the last SUM(size), plus this instance's writes
+        # since (None = recount on the next put)
+        self._disk_bytes: Optional[int] = None
+
+        if path:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+                # WAL lets concurrent CLI runs read while another one writes
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS images ("
+                    "key TEXT PRIMARY KEY, size INTEGER, bytes BLOB, mime TEXT, "
+                    "created_at TEXT, variant TEXT, embedding BLOB)"
+                )
+                columns = {row[1] for row in self._db.execute("PRAGMA table_info(images)")}
+                if "size" not in columns:
+                    # Caches written before sizes were stored: backfill once
+                    self._db.execute("ALTER TABLE images ADD COLUMN size INTEGER")
+                    self._db.execute("UPDATE images SET size = LENGTH(bytes)")
+                # Covers TTL deletes, SUM(size) and oldest-first eviction
+                # without touching the image blobs
+                self._db.execute("DROP INDEX IF EXISTS images_created_at")
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS images_created_at_size ON images (created_at, size)"
+                )
+                self._db.commit()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: image disk cache disabled ({e})")
+                self._db = None
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry if full."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _embed(self, title: str):
+        """Return a normalized float32 title embedding, or None."""
+        embedder = _get_embedder() if self.semantic else None
+        if embedder is None:
+            return None
+        return embedder.encode(title, normalize_embeddings=True).astype("float32")
+
+    def _cutoff(self) -> str:
+        """Return the oldest created_at still considered fresh (ISO format)."""
+        if not self.ttl:
+            return ""
+        return datetime.fromtimestamp(time.time() - self.ttl).isoformat()
+
+    def get(self, key: str, title: str = "", variant: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached image.
+
+        Args:
+            key: Exact cache key (see ImageGenerator.cache_key)
+            title: Article title, used by the semantic layer
+            variant: Model/aspect/size tag the semantic match must share
+
+        Returns:
+            Dictionary with image_bytes and mime, or None on a miss
+        """
+        cutoff = self._cutoff()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry["created_at"] < cutoff:
+                del self._memory[key]
+                entry = None
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry
+
+            row = None
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT bytes, mime, created_at FROM images "
+                        "WHERE key = ? AND created_at >= ?",
+                        (key, cutoff)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    print(f"Warning: image cache read failed ({e})")
+
+        if row is None and title and self._db is not None:
+            row = self._get_similar(title, variant, cutoff)
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            entry = {"image_bytes": bytes(row[0]), "mime": row[1], "created_at": row[2]}
+            self._remember(key, entry)
+            self.hits += 1
+            return entry
+
+    def _get_similar(self, title: str, variant: str, cutoff: str = ""):
+        """Return the (bytes, mime, created_at) row with the closest title embedding, or None."""
+        query = self._embed(title)
+        if query is None:
+            return None
+
+        import numpy as np
+
+        # Compare embeddings only; the image bytes are read for the winner alone
+        with self._lock:
+            try:
+                rows = self._db.execute(
+                    "SELECT key, embedding FROM images "
+                    "WHERE variant = ? AND embedding IS NOT NULL AND created_at >= ?",
+                    (variant, cutoff)
+                ).fetchall()
+            except sqlite3.Error as e:
+                print(f"Warning: image cache read failed ({e})")
+                return None
+
+        best_key, best_score = None, SEMANTIC_CACHE_THRESHOLD
+        for key, embedding in rows:
+            score = float(np.dot(query, np.frombuffer(embedding, dtype="float32")))
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+
+        with self._lock:
+            try:
+                return self._db.execute(
+                    "SELECT bytes, mime, created_at FROM images WHERE key = ?",
+                    (best_key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"Warning: image cache read failed ({e})")
+                return None
+
+    def put(
+        self,
+        key: str,
+        image_bytes: bytes,
+        mime: str,
+        title: str = "",
+        variant: str = ""
+    ) -> None:
+        """
+        Store a generated image in both tiers.
+
+        Args:
+            key: Exact cache key
+            image_bytes: Raw image bytes
+            mime: Image MIME type
+            title: Article title, embedded for the semantic layer
+            variant: Model/aspect/size tag
+        """
+        embedding = self._embed(title) if title else None
+        created_at = datetime.now().isoformat()
+
+        with self._lock:
+            self._remember(key, {"image_bytes": image_bytes, "mime": mime, "created_at": created_at})
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO images "
+                    "(key, size, bytes, mime, created_at, variant, embedding) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key, len(image_bytes), image_bytes, mime, created_at, variant,
+                        embedding.tobytes() if embedding is not None else None
+                    )
+                )
+                if self._disk_bytes is not None:
+                    self._disk_bytes += len(image_bytes)
+                self._prune()
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: image cache write failed ({e})")
+
+    def _prune(self) -> None:
+        """
+        Drop expired rows, then the oldest ones until under max_bytes (caller holds the lock).
+
+        Puts add to a running byte count; SUM(size) is re-read from the
+        covering index only once that count passes max_bytes or rows expire,
+        which also picks up writes from other processes.
+        """
+        cutoff = self._cutoff()
+        if cutoff and self._db.execute("DELETE FROM images WHERE created_at < ?", (cutoff,)).rowcount:
+            self._disk_bytes = None
+        if not self.max_bytes:
+            return
+        if self._disk_bytes is not None and self._disk_bytes <= self.max_bytes:
+            return
+
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM images").fetchone()[0]
+        if total > self.max_bytes:
+            evicted = []
+            for rowid, size in self._db.execute(
+                "SELECT rowid, size FROM images ORDER BY created_at, rowid"
+            ).fetchall():
+                if total <= self.max_bytes:
+                    break
+                evicted.append((rowid,))
+                total -= size
+            self._db.executemany("DELETE FROM images WHERE rowid = ?", evicted)
+        self._disk_bytes = total
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses}
+
 
 class ImageGenerator:
     """Google Gemini-powered image generator using the new google-genai SDK."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ImageCache] = None,
+        http_timeout: Optional[float] = None
+    ):
         """
         Initialize the image generator.
 
         Args:
             api_key: Google Gemini API key (defaults to GEMINI_API_KEY env var)
+            cache: Image cache (defaults to the shared on-disk cache)
+            http_timeout: Request timeout in seconds (SDK default if None)
         """
-        if genai_client is None:
+        try:
+            _load_genai()
+        except ImportError:
             raise ImportError(
                 "google-genai SDK not available. "
                 "Install it with `pip install google-genai`"
@@ -73,9 +631,11 @@ class ImageGenerator:
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY environment variable is not set")
 
-        # Initialize the new client
-        self.client = genai_client.Client(api_key=self.api_key)
+        # Shared client: generators with the same key and timeout reuse its connections
+        self.client = _get_client(self.api_key, http_timeout)
         self.model_name = "gemini-3-pro-image-preview"
+        self.cache = cache or ImageCache()
+        self._warmed_up = False
 
     def _create_image_prompt(
         self,
@@ -88,10 +648,28 @@ class ImageGenerator:
         if not effective_theme:
             # Use the title itself as theme context so images are article-specific
             effective_theme = f"Article topic: {title}. Focus the image on the specific subject matter."
-        return IMAGE_PROMPT_TEMPLATE.format(
-            title=title,
-            theme=effective_theme
-        )
+        return _build_image_prompt(title, effective_theme)
+
+    def cache_key(
+        self,
+        title: str,
+        theme: str = "",
+        aspect_ratio: str = DEFAULT_ASPECT_RATIO,
+        image_size: str = DEFAULT_IMAGE_SIZE
+    ) -> str:
+        """Return the versioned SHA-256 cache key for a model/prompt/size combination."""
+        payload = {
+            "model": self.model_name,
+            "prompt": self._create_image_prompt(title, theme),
+            "aspect_ratio": aspect_ratio,
+            "image_size": image_size
+        }
+        digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+        return f"{IMAGE_CACHE_VERSION}:image:{self.model_name}:{digest}"
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return image cache hit/miss counters."""
+        return self.cache.stats()
 
     def generate_image(
         self,
@@ -101,7 +679,7 @@ class ImageGenerator:
         image_size: str = DEFAULT_IMAGE_SIZE
     ) -> Dict[str, Any]:
         """
-        Generate an image for a blog post.
+        Generate an image for a blog post, reusing a cached image when available.
 
         Args:
             title: Blog post title
@@ -110,77 +688,176 @@ class ImageGenerator:
             image_size: Resolution ("1K", "2K", "4K")
 
         Returns:
-            Dictionary with image_data (base64), format, and metadata
+            Dictionary with image_bytes (raw), format, and metadata
+        """
+        key = self.cache_key(title, theme, aspect_ratio, image_size)
+        variant = f"{self.model_name}|{aspect_ratio}|{image_size}"
+
+        cached = self.cache.get(key, title=title, variant=variant)
+        if cached is not None:
+            if DEBUG:
+                print(f"[ImageGenerator] ✓ Using cached image ({cached['mime']})", flush=True)
+            return {
+                "success": True,
+                "image_bytes": cached["image_bytes"],
+                "format": cached["mime"],
+                "metadata": {"model": self.model_name, "cached": True}
+            }
+
+        result = self._generate_image_uncached(title, theme, aspect_ratio, image_size)
+
+        # Only successful generations are cached; failures are retried next time
+        if result.get("success") and result.get("image_bytes"):
+            self.cache.put(
+                key,
+                result["image_bytes"],
+                result.get("format") or "image/png",
+                title=title,
+                variant=variant
+            )
+
+        return result
+
+    def generate_image_to_sink(
+        self,
+        title: str,
+        sink: Callable[[bytes, str], str],
+        theme: str = "",
+        aspect_ratio: str = DEFAULT_ASPECT_RATIO,
+        image_size: str = DEFAULT_IMAGE_SIZE
+    ) -> Dict[str, Any]:
         """
+        Generate an image and write it straight to sink (disk, storage upload).
+
+        The returned dictionary carries the sink's URI instead of the image
+        bytes, so callers that only persist the image never hold it.
+
+        Args:
+            title: Blog post title
+            sink: Callable taking (image_bytes, mime type) and returning a URI
+            theme: Additional theme/context for the image
+            aspect_ratio: Image aspect ratio (e.g., "16:9", "1:1")
+            image_size: Resolution ("1K", "2K", "4K")
+
+        Returns:
+            Dictionary with success, uri, format, and metadata
+        """
+        return _send_to_sink(self.generate_image(title, theme, aspect_ratio, image_size), sink)
+
+    def _generate_image_uncached(
+        self,
+        title: str,
+        theme: str,
+        aspect_ratio: str,
+        image_size: str
+    ) -> Dict[str, Any]:
+        """Call Gemini to generate an image (see generate_image)."""
         prompt = self._create_image_prompt(title, theme)
 
         try:
-            print(f"[ImageGenerator] Generating image with model: {self.model_name}", flush=True)
-            print(f"[ImageGenerator] Prompt: {prompt[:80]}...", flush=True)
+            if DEBUG:
+                print(f"[ImageGenerator] Generating image with model: {self.model_name}\n"
+                      f"[ImageGenerator] Prompt: {prompt[:80]}...", flush=True)
 
-            # Use the new google-genai API
-            response = self.client.models.generate_content(
+            # Use the new google-genai API (transient 429/503s are retried)
+            response = _call_with_retry(lambda: self.client.models.generate_content(
                 model=self.model_name,
                 contents=prompt,
-                config=genai_types.GenerateContentConfig(
-                    response_modalities=["TEXT", "IMAGE"],
-                    image_config=genai_types.ImageConfig(
-                        aspect_ratio=aspect_ratio,
-                        image_size=image_size
-                    )
-                )
-            )
+                config=_content_config(aspect_ratio, image_size)
+            ))
 
-            # Debug: Print response structure
+            # Single pass: find the first image part and note part types for debug
+            inline_data = None
             part_types = []
-            if hasattr(response, 'parts') and response.parts:
-                for part in response.parts:
-                    if hasattr(part, 'inline_data') and part.inline_data:
-                        part_types.append("IMAGE")
-                    elif hasattr(part, 'text') and part.text:
-                        part_types.append("TEXT")
-            print(f"[ImageGenerator] Response parts: {part_types if part_types else 'none'}", flush=True)
-
-            # Extract image from response parts
-            if hasattr(response, 'parts') and response.parts:
-                for part in response.parts:
-                    if hasattr(part, 'inline_data') and part.inline_data:
-                        # Get the image bytes from inline_data
-                        image_bytes = part.inline_data.data
-                        # Handle if already bytes or needs encoding
-                        if isinstance(image_bytes, bytes):
-                            image_data = base64.b64encode(image_bytes).decode('utf-8')
-                        else:
-                            image_data = image_bytes  # Already base64 string
-
-                        mime_type = getattr(part.inline_data, "mime_type", "image/png")
-                        print(f"[ImageGenerator] ✓ Image generated successfully ({mime_type})", flush=True)
-
-                        return {
-                            "success": True,
-                            "image_data": image_data,
-                            "format": mime_type,
-                            "metadata": {"model": self.model_name}
-                        }
+            for part in getattr(response, "parts", None) or ():
+                part_inline = getattr(part, "inline_data", None)
+                if part_inline:
+                    part_types.append("IMAGE")
+                    if inline_data is None:
+                        inline_data = part_inline
+                        if not DEBUG:
+                            break
+                elif DEBUG and getattr(part, "text", None):
+                    part_types.append("TEXT")
+
+            if DEBUG:
+                print(f"[ImageGenerator] Response parts: {part_types if part_types else 'none'}", flush=True)
+
+            if inline_data is not None:
+                # Keep raw bytes; decode if the SDK handed back base64
+                image_bytes = inline_data.data
+                if not isinstance(image_bytes, bytes):
+                    image_bytes = base64.b64decode(image_bytes)
+
+                invalid = _image_bytes_error(image_bytes)
+                if invalid:
+                    print(f"[ImageGenerator] ✗ Corrupt image data: {invalid}", file=sys.stderr, flush=True)
+                    return {
+                        "success": False,
+                        "error": invalid,
+                        "image_bytes": None,
+                        "format": None,
+                        "metadata": {"model": self.model_name}
+                    }
+
+                mime_type = getattr(inline_data, "mime_type", None) or "image/png"
+                if DEBUG:
+                    print(f"[ImageGenerator] ✓ Image generated successfully ({mime_type})", flush=True)
+
+                return {
+                    "success": True,
+                    "image_bytes": image_bytes,
+                    "format": mime_type,
+                    "metadata": {"model": self.model_name}
+                }
 
             # If no inline image found, return failure
-            print("[ImageGenerator] ✗ No image data in response", flush=True)
+            print("[ImageGenerator] ✗ No image data in response", file=sys.stderr, flush=True)
             return {
                 "success": False,
                 "error": "No image data in response",
-                "image_data": None,
+                "image_bytes": None,
                 "format": None,
                 "metadata": {"model": self.model_name}
             }
 
         except Exception as e:
-            print(f"[ImageGenerator] ✗ Image generation failed: {str(e)}", flush=True)
+            print(f"[ImageGenerator] ✗ Image generation failed: {type(e).__name__}: {e}",
+                  file=sys.stderr, flush=True)
+            if DEBUG:
+                import traceback
+                traceback.print_exc()
             return {
                 "success": False,
                 "error": str(e),
-                "image_data": None
+                "image_bytes": None,
+                "rate_limited": _is_rate_limited(e)
             }
 
+    async def generate_image_async(
+        self,
+        title: str,
+        theme: str = "",
+        aspect_ratio: str = DEFAULT_ASPECT_RATIO,
+        image_size: str = DEFAULT_IMAGE_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Awaitable generate_image: runs the blocking SDK call on the shared executor.
+
+        Args:
+            title: Blog post title
+            theme: Additional theme/context for the image
+            aspect_ratio: Image aspect ratio (e.g., "16:9", "1:1")
+            image_size: Resolution ("1K", "2K", "4K")
+
+        Returns:
+            Same dictionary as generate_image
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_executor(),
+            partial(self.generate_image, title, theme, aspect_ratio, image_size)
+        )
+
     def generate_image_for_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """Generate an image for an article."""
         # Issue #859 Fix: Extract meaningful theme from article content, not just category
@@ -194,112 +871,400 @@ class ImageGenerator:
             theme=theme
         )
     
+    async def generate_images_concurrent(
+        self,
+        articles: List[Dict[str, Any]],
+        max_workers: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate images for multiple articles concurrently.
+
+        Collects generate_images_as_completed into a list.
+
+        Args:
+            articles: Article dictionaries
+            max_workers: Maximum concurrent Gemini requests
+
+        Returns:
+            One result per article, in input order, each with its "article"
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+        async for index, result in self.generate_images_as_completed(articles, max_workers):
+            results[index] = result
+        return results
+
+    async def generate_images_as_completed(
+        self,
+        articles: List[Dict[str, Any]],
+        max_workers: int = 4
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Generate images concurrently, yielding each one as soon as it is ready.
+
+        Articles are fed through an asyncio.Queue to max_workers submitter
+        tasks, so at most that many Gemini calls are in flight at once and a
+        slow request only holds up its own worker. Articles that yield the
+        same prompt are generated once.
+
+        Args:
+            articles: Article dictionaries
+            max_workers: Maximum concurrent Gemini requests
+
+        Yields:
+            (index into articles, result with its "article") in completion order
+
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        loop = asyncio.get_running_loop()
+        executor = _get_executor()
+
+        # Articles that would produce the same prompt (same title and theme)
+        # are generated once and the result fanned out to each of them
+        groups: Dict[tuple, List[int]] = {}
+        for index, article in enumerate(articles):
+            key = (article.get("title", "Article Image"), self._extract_article_theme(article))
+            groups.setdefault(key, []).append(index)
+
+        if not groups:
+            return
+
+        if not self._warmed_up:
+            await self._warm_up(loop, executor, min(max_workers, len(groups)))
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for key, indices in groups.items():
+            queue.put_nowait((key, articles[indices[0]]))
+        done: asyncio.Queue = asyncio.Queue()
+
+        async def submitter() -> None:
+            while True:
+                try:
+                    key, article = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                done.put_nowait((key, await self._generate_for_article(article)))
+
+        workers = [
+            asyncio.create_task(submitter())
+            for _ in range(min(max_workers, len(groups)))
+        ]
+        try:
+            for _ in range(len(groups)):
+                key, result = await done.get()
+                for index in groups[key]:
+                    yield index, {**result, "article": articles[index]}
+        finally:
+            # Consumer stopped early (or failed): don't leave submitters running
+            for worker in workers:
+                worker.cancel()
+
+    async def _warm_up(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        executor: ThreadPoolExecutor,
+        workers: int
+    ) -> None:
+        """
+        Start executor threads and open the API connection before real traffic.
+
+        The connection is opened with a model metadata lookup, which is not
+        billed; failures are ignored since generation reports its own errors.
+        """
+        def open_connection() -> None:
+            try:
+                self.client.models.get(model=self.model_name)
+            except Exception:
+                pass
+
+        await asyncio.gather(
+            loop.run_in_executor(executor, open_connection),
+            *(loop.run_in_executor(executor, lambda: None) for _ in range(workers - 1))
+        )
+        self._warmed_up = True
+
+    async def _generate_for_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate one article's image (retries happen inside generate_image)."""
+        try:
+            result = await self.generate_image_async(
+                article.get("title", "Article Image"),
+                self._extract_article_theme(article)
+            )
+        except Exception as e:
+            result = {"success": False, "error": str(e), "image_bytes": None}
+
+        result["article"] = article
+        return result
+    
     def _extract_article_theme(self, article: Dict[str, Any]) -> str:
         """
         Extract a meaningful theme from the article for image generation.
         Issue #859: This replaces generic category themes with content-specific themes.
         """
-        title = article.get("title", "").lower()
-        content = article.get("content", article.get("description", "")).lower()
-        category = article.get("category", "").upper()
-        
-        # Food/product-specific keywords to look for
-        food_keywords = {
-            # Beverages
-            "coffee": "coffee beans, coffee cups, or coffee brewing equipment",
-            "tea": "tea leaves, tea bags, or steaming tea cups", 
-            "juice": "fresh fruit juice glasses or fruit being juiced",
-            "soda": "soda bottles or cans with bubbles",
-            "water": "clear water bottles or glasses of water",
-            "wine": "wine bottles and grapes",
-            "beer": "beer bottles or glasses with foam",
-            
-            # Produce
-            "apple": "fresh red and green apples",
-            "banana": "ripe yellow bananas",
-            "orange": "bright orange citrus fruits",
-            "strawberr": "fresh red strawberries", 
-            "lettuce": "fresh green lettuce heads",
-            "tomato": "ripe red tomatoes",
-            "potato": "russet and red potatoes",
-            "onion": "yellow and red onions",
-            "carrot": "fresh orange carrots",
-            "produce": "colorful fresh fruits and vegetables",
-            "organic": "fresh organic produce with natural lighting",
-            
-            # Meat & Dairy
-            "chicken": "raw chicken pieces or cooked chicken dishes",
-            "beef": "raw beef cuts or grilled beef",
-            "pork": "pork chops or bacon strips",
-            "fish": "fresh fish fillets or whole fish",
-            "salmon": "fresh salmon fillets",
-            "milk": "glasses of milk or milk cartons",
-            "cheese": "various cheese blocks and wheels",
-            "yogurt": "yogurt cups or bowls",
-            "eggs": "fresh eggs in cartons or bowls",
-            
-            # Pantry Items
-            "bread": "fresh loaves of bread or sliced bread",
-            "pasta": "uncooked pasta shapes or pasta dishes",
-            "rice": "grains of rice or rice in bowls",
-            "cereal": "cereal boxes or bowls of cereal with milk",
-            "oil": "cooking oil bottles",
-            "sugar": "white sugar or sugar cubes",
-            "flour": "flour bags or flour being sifted",
-            
-            # Price/Economic themes
-            "price": "shopping cart, price tags, or receipts",
-            "expensive": "price tags with high dollar amounts",
-            "cheap": "discount tags or sale signs",
-            "inflation": "rising price charts or expensive shopping cart",
-            "cost": "calculator with grocery receipts",
-            "sale": "sale tags and discount signs",
-            "deal": "promotional pricing and shopping bags",
-            
-            # Store/Shopping themes
-            "walmart": "generic supermarket shopping cart and bags",
-            "target": "red shopping cart and retail bags", 
-            "kroger": "grocery shopping cart with fresh produce",
-            "safeway": "shopping basket with groceries",
-            "costco": "bulk shopping with large quantities",
-            "grocery": "shopping cart filled with various groceries",
-            "shopping": "shopping cart or grocery bags",
-            
-            # Recall themes (if not handled by default image)
-            "recall": "warning signs with food safety imagery",
-            "contaminated": "food safety warning symbols",
-            "bacteria": "microscopic imagery with warning symbols"
-        }
-        
-        # Economic/trend keywords
-        trend_keywords = {
-            "rising": "upward trending arrows with food items",
-            "falling": "downward trending arrows with discounted food",
-            "shortage": "empty shelves or scarce food items", 
-            "surplus": "abundant food items or overflowing baskets"
-        }
-        
-        # Check title first (most specific), then content
-        text_to_check = f"{title} {content}"
-        
-        # Look for specific food/product keywords
-        for keyword, theme in food_keywords.items():
-            if keyword in text_to_check:
-                return f"Focus on {theme}. Make it appetizing and clearly recognizable."
-        
-        # Check for trend/economic keywords  
-        for keyword, theme in trend_keywords.items():
-            if keyword in text_to_check:
-                return f"Show {theme} in a grocery context."
-                
-        # Category-based fallbacks with more specific guidance
-        if category == "RECALL":
-            return "Food safety warning imagery with the affected product type visible"
-        elif category == "SHOPPERS":
-            return "Shopping-related imagery focused on the specific product mentioned in the title"
-        
-        # Final fallback - use title analysis for completely custom themes
-        return f"Create an image that visually represents the main topic from: '{article.get('title', '')}'. Focus on the key subject matter, not generic grocery aisles."
+        return _article_theme(
+            article.get("title", ""),
+            article.get("content", article.get("description", "")),
+            article.get("category", "")
+        )
+
+
+# Category fallback themes (returned as shared constants)
+RECALL_THEME = "Food safety warning imagery with the affected product type visible"
+SHOPPERS_THEME = "Shopping-related imagery focused on the specific product mentioned in the title"
+
+
+# Food/product-specific keywords to look for, in priority order
+# (read-only: _KEYWORD_THEMES and the automaton are built from them at import)
+FOOD_KEYWORDS: Mapping[str, str] = MappingProxyType({
+    # Beverages
+    "coffee": "coffee beans, coffee cups, or coffee brewing equipment",
+    "tea": "tea leaves, tea bags, or steaming tea cups", 
+    "juice": "fresh fruit juice glasses or fruit being juiced",
+    "soda": "soda bottles or cans with bubbles",
+    "water": "clear water bottles or glasses of water",
+    "wine": "wine bottles and grapes",
+    "beer": "beer bottles or glasses with foam",
+
+    # Produce
+    "apple": "fresh red and green apples",
+    "banana": "ripe yellow bananas",
+    "orange": "bright orange citrus fruits",
+    "strawberr": "fresh red strawberries", 
+    "lettuce": "fresh green lettuce heads",
+    "tomato": "ripe red tomatoes",
+    "potato": "russet and red potatoes",
+    "onion": "yellow and red onions",
+    "carrot": "fresh orange carrots",
+    "produce": "colorful fresh fruits and vegetables",
+    "organic": "fresh organic produce with natural lighting",
+
+    # Meat & Dairy
+    "chicken": "raw chicken pieces or cooked chicken dishes",
+    "beef": "raw beef cuts or grilled beef",
+    "pork": "pork chops or bacon strips",
+    "fish": "fresh fish fillets or whole fish",
+    "salmon": "fresh salmon fillets",
+    "milk": "glasses of milk or milk cartons",
+    "cheese": "various cheese blocks and wheels",
+    "yogurt": "yogurt cups or bowls",
+    "eggs": "fresh eggs in cartons or bowls",
+
+    # Pantry Items
+    "bread": "fresh loaves of bread or sliced bread",
+    "pasta": "uncooked pasta shapes or pasta dishes",
+    "rice": "grains of rice or rice in bowls",
+    "cereal": "cereal boxes or bowls of cereal with milk",
+    "oil": "cooking oil bottles",
+    "sugar": "white sugar or sugar cubes",
+    "flour": "flour bags or flour being sifted",
+
+    # Price/Economic themes
+    "price": "shopping cart, price tags, or receipts",
+    "expensive": "price tags with high dollar amounts",
+    "cheap": "discount tags or sale signs",
+    "inflation": "rising price charts or expensive shopping cart",
+    "cost": "calculator with grocery receipts",
+    "sale": "sale tags and discount signs",
+    "deal": "promotional pricing and shopping bags",
+
+    # Store/Shopping themes
+    "walmart": "generic supermarket shopping cart and bags",
+    "target": "red shopping cart and retail bags", 
+    "kroger": "grocery shopping cart with fresh produce",
+    "safeway": "shopping basket with groceries",
+    "costco": "bulk shopping with large quantities",
+    "grocery": "shopping cart filled with various groceries",
+    "shopping": "shopping cart or grocery bags",
+
+    # Recall themes (if not handled by default image)
+    "recall": "warning signs with food safety imagery",
+    "contaminated": "food safety warning symbols",
+    "bacteria": "microscopic imagery with warning symbols"
+})
+
+# Economic/trend keywords, checked after every food keyword
+TREND_KEYWORDS: Mapping[str, str] = MappingProxyType({
+    "rising": "upward trending arrows with food items",
+    "falling": "downward trending arrows with discounted food",
+    "shortage": "empty shelves or scarce food items", 
+    "surplus": "abundant food items or overflowing baskets"
+})
+
+# (keyword, theme sentence) in priority order
+_KEYWORD_THEMES = tuple(
+    [(keyword, f"Focus on {theme}. Make it appetizing and clearly recognizable.")
+     for keyword, theme in FOOD_KEYWORDS.items()]
+    + [(keyword, f"Show {theme} in a grocery context.")
+       for keyword, theme in TREND_KEYWORDS.items()]
+)
+
+
+# keyword -> ((longer keyword, offset of keyword inside it), ...), e.g.
+# "rice" -> (("price", 1),): "rice" inside "prices" is the price keyword
+_KEYWORD_CONTAINERS: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+for _keyword, _ in _KEYWORD_THEMES:
+    _containers = tuple(
+        (longer, offset)
+        for longer, _ in _KEYWORD_THEMES if longer != _keyword
+        for offset in range(len(longer) - len(_keyword) + 1)
+        if longer.startswith(_keyword, offset)
+    )
+    if _containers:
+        _KEYWORD_CONTAINERS[_keyword] = _containers
+del _keyword, _containers
+
+
+def _is_subsumed(text: str, keyword: str, start: int) -> bool:
+    """True if the keyword occurrence at start is part of a longer keyword match."""
+    return any(
+        start >= offset and text.startswith(longer, start - offset)
+        for longer, offset in _KEYWORD_CONTAINERS.get(keyword, ())
+    )
+
+
+def _build_theme_automaton():
+    """
+    Build an Aho-Corasick automaton over the theme keywords.
+
+    Each keyword maps to (priority, keyword, theme sentence) so one pass over
+    the text finds every match and the lowest priority picks the theme.
+
+    Returns:
+        ahocorasick.Automaton, or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (keyword, theme) in enumerate(_KEYWORD_THEMES):
+        automaton.add_word(keyword, (priority, keyword, theme))
+    automaton.make_automaton()
+    return automaton
+
+
+_THEME_AUTOMATON = _build_theme_automaton()
+
+
+def _match_keyword_theme(text: str) -> Optional[str]:
+    """
+    Return the theme sentence for the highest-priority keyword in text, or None.
+
+    Occurrences that sit inside a longer keyword's match are skipped, so the
+    more specific keyword decides ("prices" is price, not rice; "costco" is
+    not cost).
+    """
+    if _THEME_AUTOMATON is None:
+        for keyword, theme in _KEYWORD_THEMES:
+            start = text.find(keyword)
+            while start != -1:
+                if not _is_subsumed(text, keyword, start):
+                    return theme
+                start = text.find(keyword, start + 1)
+        return None
+
+    best = None
+    for end, match in _THEME_AUTOMATON.iter(text):
+        if best is not None and match[0] >= best[0]:
+            continue
+        keyword = match[1]
+        if not _is_subsumed(text, keyword, end - len(keyword) + 1):
+            best = match
+    return best[2] if best else None
+
+
+@lru_cache(maxsize=THEME_CACHE_SIZE)
+def _article_theme(raw_title: str, raw_content: str, raw_category: str) -> str:
+    """
+    Extract a meaningful theme from the article for image generation.
+    Issue #859: This replaces generic category themes with content-specific themes.
+
+    Memoized on (title, content, category) so duplicate articles in a batch
+    and re-runs skip the keyword scan.
+    """
+    category = raw_category.upper()
+
+    # Title first (most specific), then content; lowercased in one pass so a
+    # long body is copied once rather than lowered and then concatenated
+    text_to_check = f"{raw_title} {raw_content}".lower()
+
+    # Earliest keyword in table order wins, whatever its position in the text
+    theme = _match_keyword_theme(text_to_check)
+    if theme is not None:
+        return theme
+
+    # Category-based fallbacks with more specific guidance
+    if category == "RECALL":
+        return RECALL_THEME
+    elif category == "SHOPPERS":
+        return SHOPPERS_THEME
+    
+    # Final fallback - use title analysis for completely custom themes
+    return f"Create an image that visually represents the main topic from: '{raw_title}'. Focus on the key subject matter, not generic grocery aisles."
+
+
+# Placeholder SVG as pre-encoded bytes on either side of the title text
+_PLACEHOLDER_SVG_HEAD = (
+    b'<svg width="600" height="338" xmlns="http://www.w3.org/2000/svg">'
+    b'<rect width="100%" height="100%" fill="#f0f0f0"/>'
+    b'<text x="50%" y="50%" text-anchor="middle" fill="#888" font-size="20">'
+)
+_PLACEHOLDER_SVG_TAIL = b'...</text></svg>'
+
+
+# Characters that continue the previous grapheme (joiners, variation selectors)
+_GRAPHEME_EXTENDERS = frozenset("\u200d\ufe0e\ufe0f")
+PLACEHOLDER_TITLE_LENGTH = 30
+
+
+def _is_regional_indicator(char: str) -> bool:
+    """True for the code points that pair up into flag emoji."""
+    return "\U0001f1e6" <= char <= "\U0001f1ff"
+
+
+def _truncate_label(title: str, limit: int = PLACEHOLDER_TITLE_LENGTH) -> str:
+    """
+    Cut title to at most limit code points without splitting a grapheme.
+
+    Uses the regex module's grapheme clusters when installed. Otherwise backs
+    off while the cut would separate a base character from a combining mark,
+    a variation selector or skin tone, a zero-width-joined emoji sequence, or
+    the two regional indicators of a flag.
+    """
+    if len(title) <= limit:
+        return title
+
+    if regex is not None:
+        end = 0
+        for cluster in regex.finditer(r"\X", title):
+            if cluster.end() > limit:
+                break
+            end = cluster.end()
+        return title[:end]
+
+    end = limit
+    while end > 0 and (
+        title[end] in _GRAPHEME_EXTENDERS or title[end - 1] == "\u200d"
+        or unicodedata.combining(title[end]) or "\U0001f3fb" <= title[end] <= "\U0001f3ff"
+        or (_is_regional_indicator(title[end]) and _regional_indicators_before(title, end) % 2)
+    ):
+        end -= 1
+    return title[:end]
+
+
+def _regional_indicators_before(title: str, end: int) -> int:
+    """Count the run of regional indicators immediately before index end."""
+    start = end
+    while start > 0 and _is_regional_indicator(title[start - 1]):
+        start -= 1
+    return end - start
+
+
+@lru_cache(maxsize=THEME_CACHE_SIZE)
+def _placeholder_svg(label: str) -> bytes:
+    """Build the placeholder SVG for a (truncated) title; repeated titles are memoized."""
+    # Label is XML-escaped so quotes/angle brackets can't break the SVG
+    return _PLACEHOLDER_SVG_HEAD + escape(label).encode("utf-8") + _PLACEHOLDER_SVG_TAIL
 
 
 class PlaceholderImageGenerator:
@@ -319,25 +1284,28 @@ class PlaceholderImageGenerator:
         aspect_ratio: str = DEFAULT_ASPECT_RATIO,
         image_size: str = DEFAULT_IMAGE_SIZE
     ) -> Dict[str, Any]:
-        """Generate a placeholder image."""
-        # Create a simple SVG placeholder
-        svg = f'''<svg width="600" height="338" xmlns="http://www.w3.org/2000/svg">
-            <rect width="100%" height="100%" fill="#f0f0f0"/>
-            <text x="50%" y="50%" text-anchor="middle" fill="#888" font-size="20">
-                {title[:30]}...
-            </text>
-        </svg>'''
-
-        image_data = base64.b64encode(svg.encode('utf-8')).decode('utf-8')
+        """Generate a placeholder image (raw SVG bytes, see image_data_b64)."""
+        svg = _placeholder_svg(_truncate_label(title))
 
         return {
             "success": True,
-            "image_data": image_data,
+            "image_bytes": svg,
             "format": "svg",
             "placeholder": True,
             "title": title
         }
 
+    def generate_image_to_sink(
+        self,
+        title: str,
+        sink: Callable[[bytes, str], str],
+        theme: str = "",
+        aspect_ratio: str = DEFAULT_ASPECT_RATIO,
+        image_size: str = DEFAULT_IMAGE_SIZE
+    ) -> Dict[str, Any]:
+        """Generate a placeholder image and write it to sink (see ImageGenerator)."""
+        return _send_to_sink(self.generate_image(title, theme, aspect_ratio, image_size), sink)
+
     def generate_image_for_article(
         self,
         article: Dict[str, Any]
@@ -357,21 +1325,39 @@ class PlaceholderImageGenerator:
         articles: List[Dict[str, Any]],
         max_workers: int = 4
     ) -> List[Dict[str, Any]]:
-        """Generate placeholder images for multiple articles."""
-        results = []
-        for article in articles:
+        """Generate placeholder images for multiple articles, in input order."""
+        return [result async for _, result in self.generate_images_as_completed(articles, max_workers)]
+
+    async def generate_images_as_completed(
+        self,
+        articles: List[Dict[str, Any]],
+        max_workers: int = 4
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yield (index, placeholder result) for each article, in order.
+
+        Each SVG takes microseconds to build (and repeated titles are
+        memoized), far less than a thread hop or asyncio.to_thread, so they
+        are built inline; the loop yields to the event loop after each one
+        so a consumer's uploads start while later placeholders are built.
+        """
+        for index, article in enumerate(articles):
             result = self.generate_image_for_article(article)
             result["article"] = article
-            results.append(result)
-        return results
+            yield index, result
+            await asyncio.sleep(0)
 
 
-def get_image_generator(use_placeholder: bool = False) -> ImageGenerator:
+def get_image_generator(
+    use_placeholder: bool = False,
+    http_timeout: Optional[float] = None
+) -> ImageGenerator:
     """
     Get an image generator instance.
 
     Args:
         use_placeholder: Use placeholder generator instead of Gemini
+        http_timeout: Gemini request timeout in seconds (SDK default if None)
 
     Returns:
         ImageGenerator or PlaceholderImageGenerator instance
@@ -380,7 +1366,7 @@ def get_image_generator(use_placeholder: bool = False) -> ImageGenerator:
         return PlaceholderImageGenerator()
 
     try:
-        return ImageGenerator()
+        return ImageGenerator(http_timeout=http_timeout)
     except (ImportError, ValueError) as e:
         print(f"Warning: Cannot initialize ImageGenerator ({e}), using placeholder images")
         return PlaceholderImageGenerator()
@@ -3,53 +3,185 @@
 
 import requests
 import os
+import sys
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Union
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 IMGBB_API_KEY = os.getenv("IMGBB_API_KEY")
 IMGBB_UPLOAD_URL = "https://api.imgbb.com/1/upload"
+IMGBB_TIMEOUT = 30  # seconds
+
+# Per-upload progress lines (otherwise only failures are printed, one stderr line each)
+DEBUG = bool(os.getenv("YOUDLE_DEBUG"))
+
+if not IMGBB_API_KEY:
+    # Surface the misconfiguration once; each upload then fails without a request
+    print("Warning: IMGBB_API_KEY not set, imgBB uploads will fail", file=sys.stderr)
+
+# Connections kept open to api.imgbb.com, shared by every upload in the process
+IMGBB_POOL_SIZE = 16
 
 # Default image for RECALL articles (no generated image)
 DEFAULT_RECALL_IMAGE_URL = "https://blogger.googleusercontent.com/img/b/R29vZ2xl/AVvXsEgex6VD3Nxp8182Dnvc09taqAndjcsVSahJc0hFQIct8Sk0oHMoQIJX8WjAsT_ruo_CS389jWfmMCLqe8HPLZbkU2pTbXp_UUwx02tJp19wegZB97c0DztKHFHtl9_JvbBvlTIQ3CdEurOMtjh1mNHkwF6-u_a39cJnyTFHY1q08cXQh6WOcHm6r28rUiMP/w558-h371/IMG_0682.jpg"
 
+# Shared keep-alive client: uploads after the first skip the TCP/TLS handshake,
+# and over HTTP/2 concurrent uploads multiplex on a single connection
+if httpx is not None:
+    _session = httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=IMGBB_POOL_SIZE, max_keepalive_connections=IMGBB_POOL_SIZE),
+        timeout=IMGBB_TIMEOUT
+    )
+else:
+    _session = requests.Session()
+    _session.mount(
+        "https://", HTTPAdapter(pool_connections=IMGBB_POOL_SIZE, pool_maxsize=IMGBB_POOL_SIZE)
+    )
+
 
-def upload_image_to_imgbb(image_data: str, name: str = None) -> dict:
+def _async_client() -> "httpx.AsyncClient":
+    """Create an HTTP/2 AsyncClient (one per event loop, so one per batch)."""
+    return httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=IMGBB_TIMEOUT)
+
+
+def _build_request(
+    image_data: Union[str, bytes],
+    name: Optional[str],
+    content_type: str = "image/png"
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Return (form data, files) for an upload; bytes go as a multipart file."""
+    payload = {"key": IMGBB_API_KEY}
+    if name:
+        payload["name"] = name
+
+    if isinstance(image_data, (bytes, bytearray)):
+        # Binary upload skips base64 (33% smaller request body). The filename
+        # and part Content-Type let imgBB skip sniffing the format.
+        extension = content_type.rsplit("/", 1)[-1].split("+", 1)[0]
+        return payload, {"image": (f"{name or 'image'}.{extension}", bytes(image_data), content_type)}
+    payload["image"] = image_data
+    return payload, None
+
+
+def _parse_response(status_code: int, result: Dict[str, Any]) -> dict:
+    """Turn an imgBB API response into the upload result dict."""
+    if status_code == 200 and result.get("success"):
+        url = result["data"]["url"]
+        if DEBUG:
+            print(f"[imgBB] ✓ Upload successful: {url}", flush=True)
+        return {"success": True, "url": url}
+
+    error_msg = result.get("error", {}).get("message", "Unknown error")
+    print(f"[imgBB] ✗ Upload failed (HTTP {status_code}): {error_msg}", file=sys.stderr)
+    return {"success": False, "error": error_msg}
+
+
+def upload_image_to_imgbb(
+    image_data: Union[str, bytes],
+    name: str = None,
+    content_type: str = "image/png"
+) -> dict:
     """
-    Upload base64 image data to imgBB.
+    Upload an image to imgBB.
 
     Args:
-        image_data: Base64 encoded image string
+        image_data: Raw image bytes (sent as a multipart file) or base64 encoded image string
         name: Optional image name
+        content_type: MIME type of raw image bytes (ignored for base64 strings)
 
     Returns:
         {"success": True, "url": "https://i.ibb.co/..."} or {"success": False, "error": "..."}
     """
-    print(f"[imgBB] Starting upload for: {name}", flush=True)
-    print(f"[imgBB] API key present: {bool(IMGBB_API_KEY)}", flush=True)
-    print(f"[imgBB] Image data length: {len(image_data) if image_data else 0} chars", flush=True)
+    if not IMGBB_API_KEY:
+        return {"success": False, "error": "IMGBB_API_KEY not configured"}
+
+    if DEBUG:
+        print(f"[imgBB] Starting upload for: {name} ({len(image_data) if image_data else 0} bytes)",
+              flush=True)
+
+    try:
+        payload, files = _build_request(image_data, name, content_type)
+        response = _session.post(IMGBB_UPLOAD_URL, data=payload, files=files, timeout=IMGBB_TIMEOUT)
+        return _parse_response(response.status_code, response.json())
+    except Exception as e:
+        print(f"[imgBB] ✗ Upload failed: {type(e).__name__}: {e}", file=sys.stderr)
+        return {"success": False, "error": str(e)}
+
+
+async def upload_image_to_imgbb_async(
+    image_data: Union[str, bytes],
+    name: str = None,
+    client: Optional["httpx.AsyncClient"] = None,
+    content_type: str = "image/png"
+) -> dict:
+    """
+    Async upload_image_to_imgbb over an httpx client.
+
+    Args:
+        image_data: Raw image bytes or base64 encoded image string
+        name: Optional image name
+        client: Shared httpx.AsyncClient (a one-off client is used if None)
+        content_type: MIME type of raw image bytes (ignored for base64 strings)
 
+    Returns:
+        Same result dict as upload_image_to_imgbb
+    """
     if not IMGBB_API_KEY:
-        print("[imgBB] ✗ No API key configured!", flush=True)
         return {"success": False, "error": "IMGBB_API_KEY not configured"}
 
+    if httpx is None:
+        return await asyncio.to_thread(upload_image_to_imgbb, image_data, name, content_type)
+
+    if client is None:
+        async with _async_client() as own_client:
+            return await upload_image_to_imgbb_async(image_data, name, own_client, content_type)
+
     try:
-        payload = {
-            "key": IMGBB_API_KEY,
-            "image": image_data,
-        }
-        if name:
-            payload["name"] = name
-
-        response = requests.post(IMGBB_UPLOAD_URL, data=payload, timeout=30)
-        print(f"[imgBB] Response status: {response.status_code}", flush=True)
-        result = response.json()
-
-        if response.status_code == 200 and result.get("success"):
-            url = result["data"]["url"]
-            print(f"[imgBB] ✓ Upload successful: {url}", flush=True)
-            return {"success": True, "url": url}
-        else:
-            error_msg = result.get("error", {}).get("message", "Unknown error")
-            print(f"[imgBB] ✗ Upload failed: {error_msg}", flush=True)
-            return {"success": False, "error": error_msg}
+        payload, files = _build_request(image_data, name, content_type)
+        response = await client.post(IMGBB_UPLOAD_URL, data=payload, files=files)
+        return _parse_response(response.status_code, response.json())
     except Exception as e:
-        print(f"[imgBB] ✗ Exception: {str(e)}", flush=True)
+        print(f"[imgBB] ✗ Upload failed: {type(e).__name__}: {e}", file=sys.stderr)
         return {"success": False, "error": str(e)}
+
+
+async def upload_batch(
+    items: List[Tuple[Union[str, bytes], Optional[str]]],
+    max_concurrency: int = 8
+) -> List[dict]:
+    """
+    Upload several images concurrently over one connection pool.
+
+    Args:
+        items: (image_data, name) pairs
+        max_concurrency: Maximum uploads in flight
+
+    Returns:
+        One result dict per item, in input order
+    """
+    if not IMGBB_API_KEY:
+        return [{"success": False, "error": "IMGBB_API_KEY not configured"} for _ in items]
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def upload_one(client, image_data, name):
+        async with semaphore:
+            return await upload_image_to_imgbb_async(image_data, name, client)
+
+    if httpx is None:
+        return list(await asyncio.gather(*(upload_one(None, data, name) for data, name in items)))
+
+    async with _async_client() as client:
+        return list(await asyncio.gather(*(upload_one(client, data, name) for data, name in items)))
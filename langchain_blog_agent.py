@@ -2,55 +2,288 @@
 # LangChain-powered blog post generation chains for Youdle
 
 import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
+import openai
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.caches import InMemoryCache
 from langchain_core.globals import set_llm_cache
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
 except ImportError:
     pass
 
+
+def _make_llm_cache():
+    """
+    Pick the LangChain LLM response cache from the environment.
+
+    REDIS_URL shares one cache between processes, LANGCHAIN_CACHE_DB keeps a
+    SQLite file across restarts, and otherwise responses are cached in memory
+    for the life of the process.
+    """
+    try:
+        if os.getenv("REDIS_URL"):
+            import redis
+            from langchain_community.cache import RedisCache
+            return RedisCache(redis.Redis.from_url(os.environ["REDIS_URL"]))
+        if os.getenv("LANGCHAIN_CACHE_DB"):
+            from langchain_community.cache import SQLiteCache
+            return SQLiteCache(database_path=os.path.expanduser(os.environ["LANGCHAIN_CACHE_DB"]))
+    except Exception as e:
+        print(f"Warning: persistent LLM cache disabled ({e}), using in-memory cache")
+    return InMemoryCache()
+
+
 # Initialize LLM cache to prevent regenerating identical content
-set_llm_cache(InMemoryCache())
+set_llm_cache(_make_llm_cache())
+
+# Drafts start on the fast model; a post that fails reflection is
+# regenerated on the escalation model
+DEFAULT_MODEL = "gpt-4o-mini"
+ESCALATION_MODEL = "gpt-4o"
+
+# Concurrent OpenAI requests per batch_generate round
+# (keep under the account's per-minute request/token budget)
+BATCH_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+
+# Transient OpenAI failures are retried with jittered exponential backoff so
+# concurrent batch requests that hit a 429 together don't retry in lockstep
+OPENAI_MAX_ATTEMPTS = 5
+OPENAI_RETRY_MAX_DELAY = 30.0  # seconds
+_TRANSIENT_OPENAI_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+# Posts that passed reflection, reused across runs for the same article and
+# examples (empty BLOG_CACHE_PATH keeps the cache in memory only)
+BLOG_CACHE_PATH = os.path.expanduser(
+    os.getenv("BLOG_CACHE_PATH", "~/.cache/youdle/blog_posts.sqlite")
+)
+BLOG_CACHE_TTL = int(os.getenv("BLOG_CACHE_TTL", "86400"))  # seconds
+# Bump when the prompts change so cached posts are regenerated
+BLOG_CACHE_VERSION = "v1"
 
 # ============================================================================
 # PROMPT TEMPLATES - Imported from prompts module
 # ============================================================================
-from prompts import SHOPPERS_BLOG_PROMPT, RECALL_BLOG_PROMPT, REFLECTION_PROMPT
+from prompts import (
+    SHOPPERS_SYSTEM_PROMPT, SHOPPERS_ARTICLE_PROMPT,
+    RECALL_SYSTEM_PROMPT, RECALL_ARTICLE_PROMPT,
+    REFLECTION_PROMPT
+)
+from reflection_agent import ReflectionAgent
+
+# Parsed once at import; every generator pipes these into its own LLM.
+# Drafting prompts are split into a system message (instructions + examples,
+# identical across a batch so OpenAI's prefix cache applies) and the article.
+_SHOPPERS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SHOPPERS_SYSTEM_PROMPT),
+    ("human", SHOPPERS_ARTICLE_PROMPT)
+])
+_RECALL_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", RECALL_SYSTEM_PROMPT),
+    ("human", RECALL_ARTICLE_PROMPT)
+])
+_REFLECTION_PROMPT = ChatPromptTemplate.from_template(REFLECTION_PROMPT)
+
+# Word count window shared with ReflectionAgent (400-600 words)
+MIN_WORD_COUNT = ReflectionAgent.TARGET_WORD_COUNT - ReflectionAgent.WORD_COUNT_TOLERANCE
+MAX_WORD_COUNT = ReflectionAgent.TARGET_WORD_COUNT + ReflectionAgent.WORD_COUNT_TOLERANCE
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+_CODE_FENCE = re.compile(r"^```[a-zA-Z]*\s*|\s*```$")
+
+# Structural issues _try_repair can fix without another LLM call
+_IMAGE_TAG = '<img src="{IMAGE_HERE}" alt="article image"/>'
+_COMMUNITY_CTA = (
+    '<p>Check the <a href="https://www.youdle.io/community">Youdle Community</a> '
+    'for more finds and tips from shoppers like you.</p>'
+)
+REPAIRABLE_ISSUES = frozenset({
+    "Missing opening <div> tag",
+    "Missing closing </div> tag",
+    "Missing image tag",
+    "Missing Youdle Community link",
+})
+
+
+@lru_cache(maxsize=16)
+def _examples_section(good_examples: tuple, bad_examples: tuple) -> str:
+    """Build the few-shot examples section (memoized: a batch shares one set of examples)."""
+    if not good_examples and not bad_examples:
+        return ""
+    
+    sections = []
+    
+    if good_examples:
+        sections.append("Here are examples of GOOD blog posts (follow this structure):")
+        for i, example in enumerate(good_examples, 1):
+            sections.append(f"\n--- Good Example {i} ---\n{example}")
+    
+    if bad_examples:
+        sections.append("\nHere are examples of BAD blog posts (avoid these mistakes):")
+        for i, example in enumerate(bad_examples, 1):
+            sections.append(f"\n--- Bad Example {i} ---\n{example}")
+    
+    sections.append("\n" + "-" * 50 + "\n")
+    return "\n".join(sections)
+
+
+class BlogPostCache:
+    """
+    Exact-match store for validated blog posts, keyed by BlogPostGenerator.cache_key.
+
+    Entries live in a SQLite file so regenerating the same articles across
+    runs (development, retries, cron re-runs) skips the OpenAI calls.
+
+    Only exact matches are served. Posts are not reused as slot-filled
+    skeletons for "similar" articles: the facts (products, lot codes, dates,
+    prices) are exactly the slots, and filling them without the model is
+    where a wrong recall detail would slip through review.
+    """
+
+    def __init__(self, path: Optional[str] = BLOG_CACHE_PATH, ttl: int = BLOG_CACHE_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file path (None or "" keeps the cache in memory only)
+            ttl: Maximum entry age in seconds (0 disables expiry)
+        """
+        self.ttl = ttl
+        self._memory: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._db = None
+
+        if path:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS posts ("
+                    "key TEXT PRIMARY KEY, value TEXT, created_at REAL)"
+                )
+                self._db.commit()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: blog post disk cache disabled ({e})")
+                self._db = None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None if missing or expired."""
+        cutoff = time.time() - self.ttl if self.ttl else 0
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self._db is not None:
+                try:
+                    entry = self._db.execute(
+                        "SELECT value, created_at FROM posts WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    print(f"Warning: blog post cache read failed ({e})")
+            if entry is None or entry[1] < cutoff:
+                return None
+            self._memory[key] = entry
+            return json.loads(entry[0])
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a JSON-serializable result under key."""
+        entry = (json.dumps(value), time.time())
+        with self._lock:
+            self._memory[key] = entry
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO posts (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, *entry)
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: blog post cache write failed ({e})")
 
 
 class BlogPostGenerator:
     """LangChain-powered blog post generator with learning capabilities."""
     
-    def __init__(self, model: str = "gpt-4", temperature: float = 0.7):
+    def __init__(
+        self,
+        model: str = DEFAULT_MODEL,
+        temperature: float = 0.7,
+        cache: Optional[BlogPostCache] = None,
+        escalation_model: Optional[str] = ESCALATION_MODEL,
+        use_llm_reflection: bool = False
+    ):
         """
         Initialize the blog post generator.
         
         Args:
-            model: OpenAI model to use (default: gpt-4)
+            model: OpenAI model to use (default: gpt-4o-mini)
             temperature: Creativity level (0-1, default: 0.7)
+            cache: Validated-post cache (defaults to the shared on-disk cache)
+            escalation_model: Model for regenerating posts that failed
+                reflection (None keeps retries on model)
+            use_llm_reflection: Review drafts with the LLM reflection chain
+                instead of the local checks (for debugging the prompt)
         """
+        self.model = model
+        self.temperature = temperature
+        self.use_llm_reflection = use_llm_reflection
+        self.cache = cache or BlogPostCache()
         self.llm = ChatOpenAI(
             model=model,
             temperature=temperature,
-            max_retries=3,
+            max_retries=0,  # retried with jitter in _create_chain
             api_key=os.getenv("OPENAI_API_KEY")
         )
         
-        # Create chains
-        self.shoppers_chain = self._create_chain(SHOPPERS_BLOG_PROMPT)
-        self.recall_chain = self._create_chain(RECALL_BLOG_PROMPT)
-        self.reflection_chain = self._create_chain(REFLECTION_PROMPT)
+        # Create chains (reflection only classifies, so it stays on the fast model)
+        self.shoppers_chain = self._create_chain(_SHOPPERS_PROMPT)
+        self.recall_chain = self._create_chain(_RECALL_PROMPT)
+        self.reflection_chain = self._create_chain(_REFLECTION_PROMPT)
+        
+        # Retry chains, built once on the escalation model
+        self.shoppers_chain_strong = self.shoppers_chain
+        self.recall_chain_strong = self.recall_chain
+        if escalation_model and escalation_model != model:
+            self.llm_strong = ChatOpenAI(
+                model=escalation_model,
+                temperature=temperature,
+                max_retries=0,  # retried with jitter in _create_chain
+                api_key=os.getenv("OPENAI_API_KEY")
+            )
+            self.shoppers_chain_strong = self._create_chain(_SHOPPERS_PROMPT, self.llm_strong)
+            self.recall_chain_strong = self._create_chain(_RECALL_PROMPT, self.llm_strong)
+    
+    def _create_chain(self, prompt: ChatPromptTemplate, llm: Optional[ChatOpenAI] = None):
+        """Create a LangChain chain from a parsed prompt template."""
+        llm = (llm or self.llm).with_retry(
+            retry_if_exception_type=_TRANSIENT_OPENAI_ERRORS,
+            wait_exponential_jitter=True,
+            exponential_jitter_params={"initial": 1, "max": OPENAI_RETRY_MAX_DELAY},
+            stop_after_attempt=OPENAI_MAX_ATTEMPTS
+        )
+        return prompt | llm | StrOutputParser()
     
-    def _create_chain(self, prompt_template: str):
-        """Create a LangChain chain from a prompt template."""
-        prompt = ChatPromptTemplate.from_template(prompt_template)
-        return prompt | self.llm | StrOutputParser()
+    def _draft_chain(self, category: str, attempt: int):
+        """Return the drafting chain for a category: fast first, escalated on retries."""
+        if category == "recall":
+            return self.recall_chain_strong if attempt else self.recall_chain
+        return self.shoppers_chain_strong if attempt else self.shoppers_chain
     
     def _format_examples_section(
         self, 
@@ -58,23 +291,30 @@ class BlogPostGenerator:
         bad_examples: List[str] = None
     ) -> str:
         """Format examples section for few-shot learning."""
-        if not good_examples and not bad_examples:
-            return ""
-        
-        sections = []
-        
-        if good_examples:
-            sections.append("Here are examples of GOOD blog posts (follow this structure):")
-            for i, example in enumerate(good_examples[:3], 1):
-                sections.append(f"\n--- Good Example {i} ---\n{example}")
-        
-        if bad_examples:
-            sections.append("\nHere are examples of BAD blog posts (avoid these mistakes):")
-            for i, example in enumerate(bad_examples[:2], 1):
-                sections.append(f"\n--- Bad Example {i} ---\n{example}")
-        
-        sections.append("\n" + "-" * 50 + "\n")
-        return "\n".join(sections)
+        # Only the first 3 good / 2 bad examples are used; tuples make them cacheable
+        return _examples_section(tuple((good_examples or ())[:3]), tuple((bad_examples or ())[:2]))
+    
+    def cache_key(
+        self,
+        category: str,
+        title: str,
+        content: str,
+        original_link: str,
+        good_examples: List[str] = None,
+        bad_examples: List[str] = None
+    ) -> str:
+        """Return the versioned SHA-256 cache key for an article and its examples."""
+        payload = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "category": category,
+            "title": title,
+            "content": content,
+            "original_link": original_link,
+            "examples": self._format_examples_section(good_examples, bad_examples)
+        }
+        digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+        return f"{BLOG_CACHE_VERSION}:blog:{digest}"
     
     def generate_shoppers_post(
         self,
@@ -138,7 +378,11 @@ class BlogPostGenerator:
     
     def reflect_on_post(self, blog_post: str) -> Dict[str, Any]:
         """
-        Use reflection chain to self-evaluate a generated blog post.
+        Self-evaluate a generated blog post.
+        
+        The structural checks run locally; the reflection chain is only called
+        with use_llm_reflection (the workflow's reflect and proofread nodes
+        cover spelling, grammar and tone afterwards).
         
         Args:
             blog_post: Generated HTML blog post
@@ -146,16 +390,23 @@ class BlogPostGenerator:
         Returns:
             Dictionary with is_valid, issues, and suggestions
         """
-        import json
-        
+        if not self.use_llm_reflection:
+            return self._basic_validation(blog_post)
         result = self.reflection_chain.invoke({"blog_post": blog_post})
-        
+        return self._parse_reflection(result, blog_post)
+    
+    def _parse_reflection(self, result: str, blog_post: str) -> Dict[str, Any]:
+        """Parse a reflection chain response, falling back to basic validation."""
+        # Models often wrap the JSON in a ```json fence
+        text = _CODE_FENCE.sub("", result.strip())
         try:
-            # Parse JSON response
-            return json.loads(result)
-        except json.JSONDecodeError:
+            reflection = orjson.loads(text) if orjson else json.loads(text)
+        except ValueError:  # json/orjson JSONDecodeError
+            reflection = None
+        if not isinstance(reflection, dict):
             # If parsing fails, do basic validation
             return self._basic_validation(blog_post)
+        return reflection
     
     def _basic_validation(self, blog_post: str) -> Dict[str, Any]:
         """Perform basic HTML validation."""
@@ -176,12 +427,45 @@ class BlogPostGenerator:
         if "youdle.io/community" not in blog_post.lower():
             issues.append("Missing Youdle Community link")
         
+        word_count = len(_HTML_TAG.sub(" ", blog_post).split())
+        if not MIN_WORD_COUNT <= word_count <= MAX_WORD_COUNT:
+            issues.append(f"Word count {word_count} outside {MIN_WORD_COUNT}-{MAX_WORD_COUNT}")
+        
         return {
             "is_valid": len(issues) == 0,
+            "word_count": word_count,
             "issues": issues,
             "suggestions": [f"Fix: {issue}" for issue in issues]
         }
     
+    def _try_repair(self, blog_post: str, issues: List[str]) -> Optional[str]:
+        """
+        Fix purely structural reflection issues locally.
+        
+        Args:
+            blog_post: Draft that failed reflection
+            issues: Issues reported for the draft
+            
+        Returns:
+            The repaired post if every issue was repairable and it now passes
+            _basic_validation, otherwise None (the draft needs an LLM retry)
+        """
+        if not issues or not REPAIRABLE_ISSUES.issuperset(issues):
+            return None
+        
+        post = _CODE_FENCE.sub("", blog_post.strip())
+        if not post.startswith("<div"):
+            post = "<div>\n" + post
+        if not post.endswith("</div>"):
+            post += "\n</div>"
+        if "{IMAGE_HERE}" not in post and "<img" not in post:
+            head, _, body = post.partition(">")
+            post = f"{head}>\n{_IMAGE_TAG}{body}"
+        if "youdle.io/community" not in post.lower():
+            post = post[:-len("</div>")].rstrip() + f"\n{_COMMUNITY_CTA}\n</div>"
+        
+        return post if self._basic_validation(post)["is_valid"] else None
+    
     def generate_with_reflection(
         self,
         title: str,
@@ -207,31 +491,38 @@ class BlogPostGenerator:
         Returns:
             Dictionary with blog_post, reflection, and metadata
         """
-        generator = (
-            self.generate_recall_post if category == "recall" 
-            else self.generate_shoppers_post
-        )
+        key = self.cache_key(category, title, content, original_link, good_examples, bad_examples)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
         
         for attempt in range(max_retries + 1):
-            # Generate blog post
-            blog_post = generator(
-                title=title,
-                content=content,
-                original_link=original_link,
-                good_examples=good_examples,
-                bad_examples=bad_examples
-            )
+            # Generate blog post (retries run on the escalation model)
+            blog_post = self._draft_chain(category, attempt).invoke({
+                "title": title,
+                "content": content,
+                "original_link": original_link,
+                "examples_section": self._format_examples_section(good_examples, bad_examples)
+            })
             
-            # Reflect on the generated post
+            # Reflect on the generated post; structural slips are fixed locally
             reflection = self.reflect_on_post(blog_post)
+            repaired = None if reflection.get("is_valid", False) else self._try_repair(
+                blog_post, reflection.get("issues", [])
+            )
+            if repaired is not None:
+                blog_post = repaired
+                reflection = self._basic_validation(repaired)
             
             if reflection.get("is_valid", False):
-                return {
+                result = {
                     "blog_post": blog_post,
                     "reflection": reflection,
                     "attempts": attempt + 1,
                     "success": True
                 }
+                self.cache.set(key, {**result, "cached": True})
+                return result
             
             # If not valid and we have retries left, include issues in next attempt
             if attempt < max_retries:
@@ -255,7 +546,9 @@ class BlogPostGenerator:
         self,
         articles: List[Dict[str, Any]],
         good_examples: List[str] = None,
-        bad_examples: List[str] = None
+        bad_examples: List[str] = None,
+        max_retries: int = 2,
+        max_concurrency: int = BATCH_MAX_CONCURRENCY
     ) -> List[Dict[str, Any]]:
         """
         Generate multiple blog posts in parallel using batch processing.
@@ -264,29 +557,159 @@ class BlogPostGenerator:
             articles: List of article dictionaries with title, content, link, category
             good_examples: List of good example HTML posts
             bad_examples: List of bad example HTML posts
+            max_retries: Maximum number of regeneration attempts per article
+            max_concurrency: Maximum concurrent OpenAI requests
             
         Returns:
-            List of generated blog post results
+            List of generated blog post results, in article order
         """
-        results = []
+        return asyncio.run(self.abatch_generate(
+            articles, good_examples, bad_examples, max_retries, max_concurrency
+        ))
+    
+    async def abatch_generate(
+        self,
+        articles: List[Dict[str, Any]],
+        good_examples: List[str] = None,
+        bad_examples: List[str] = None,
+        max_retries: int = 2,
+        max_concurrency: int = BATCH_MAX_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Async batch_generate: same results as generate_with_reflection per article.
         
-        # Prepare batch inputs
-        for article in articles:
-            result = self.generate_with_reflection(
-                title=article["title"],
-                content=article.get("content", article.get("description", "")),
-                original_link=article.get("link", article.get("original_link", "")),
-                category=article.get("category", "shoppers").lower(),
-                good_examples=good_examples,
-                bad_examples=bad_examples
-            )
-            result["article"] = article
-            results.append(result)
+        Each round sends every pending article through its category chain with
+        one abatch call, reflects on all of the drafts with a second, and
+        retries only the articles whose reflection failed. Articles with a
+        cached validated post skip both.
+        """
+        config = {"max_concurrency": max_concurrency}
+        results: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+        article_bad_examples = [list(bad_examples or []) for _ in articles]
+        
+        keys = []
+        pending = []
+        for i, article in enumerate(articles):
+            inputs = self._chain_input(article)
+            keys.append(self.cache_key(
+                self._article_category(article), inputs["title"], inputs["content"],
+                inputs["original_link"], good_examples, bad_examples
+            ))
+            results[i] = self.cache.get(keys[i])
+            if results[i] is None:
+                pending.append(i)
         
+        for attempt in range(max_retries + 1):
+            if not pending:
+                break
+
+            # Draft every pending article, shoppers and recall batches together
+            batches = []
+            for category in ("shoppers", "recall"):
+                chain = self._draft_chain(category, attempt)
+                indexes = [
+                    i for i in pending
+                    if self._article_category(articles[i]) == category
+                ]
+                if indexes:
+                    inputs = [
+                        self._chain_input(articles[i], good_examples, article_bad_examples[i])
+                        for i in indexes
+                    ]
+                    batches.append((indexes, chain.abatch(inputs, config=config, return_exceptions=True)))
+            
+            outputs = await asyncio.gather(*(batch for _, batch in batches))
+            drafts = {}
+            failed = []
+            for (indexes, _), posts in zip(batches, outputs):
+                for i, post in zip(indexes, posts):
+                    if not isinstance(post, Exception):
+                        drafts[i] = post
+                        continue
+                    # Keep an earlier attempt's draft; only record the error if there is none
+                    if results[i] is None or "error" in results[i]:
+                        results[i] = {
+                            "blog_post": "",
+                            "error": str(post),
+                            "attempts": attempt + 1,
+                            "success": False
+                        }
+                    if attempt < max_retries:
+                        failed.append(i)
+            
+            # Reflect on all drafts (one LLM batch only with use_llm_reflection)
+            draft_indexes = list(drafts)
+            if self.use_llm_reflection:
+                reflections = await self.reflection_chain.abatch(
+                    [{"blog_post": drafts[i]} for i in draft_indexes],
+                    config=config,
+                    return_exceptions=True
+                )
+            else:
+                reflections = [self._basic_validation(drafts[i]) for i in draft_indexes]
+            
+            pending = failed
+            for i, reflection in zip(draft_indexes, reflections):
+                blog_post = drafts[i]
+                if isinstance(reflection, Exception):
+                    reflection = self._basic_validation(blog_post)
+                elif isinstance(reflection, str):
+                    reflection = self._parse_reflection(reflection, blog_post)
+                
+                if not reflection.get("is_valid", False):
+                    repaired = self._try_repair(blog_post, reflection.get("issues", []))
+                    if repaired is not None:
+                        blog_post = repaired
+                        reflection = self._basic_validation(repaired)
+                
+                is_valid = reflection.get("is_valid", False)
+                results[i] = {
+                    "blog_post": blog_post,
+                    "reflection": reflection,
+                    "attempts": attempt + 1,
+                    "success": is_valid
+                }
+                if is_valid:
+                    self.cache.set(keys[i], {**results[i], "cached": True})
+                
+                # Retry with this attempt's issues added to the bad examples
+                if not is_valid and attempt < max_retries:
+                    issues_str = "\n".join(reflection.get("issues", []))
+                    article_bad_examples[i].append(
+                        f"<!-- Previous attempt had these issues: {issues_str} -->\n{blog_post}"
+                    )
+                    pending.append(i)
+        
+        for article, result in zip(articles, results):
+            result["article"] = article
         return results
+    
+    def _article_category(self, article: Dict[str, Any]) -> str:
+        """Return "shoppers" or "recall" for an article dict."""
+        return "recall" if (article.get("category") or "").lower() == "recall" else "shoppers"
+    
+    def _chain_input(
+        self,
+        article: Dict[str, Any],
+        good_examples: List[str] = None,
+        bad_examples: List[str] = None
+    ) -> Dict[str, str]:
+        """Build the shoppers/recall chain input for an article."""
+        return {
+            "title": article.get("title", ""),
+            "content": article.get("content", article.get("description", "")),
+            "original_link": article.get("link", article.get("original_link", "")),
+            "examples_section": self._format_examples_section(good_examples, bad_examples)
+        }
+
+
+@lru_cache(maxsize=4)
+def _get_generator(model: str, temperature: float = 0.7) -> BlogPostGenerator:
+    """Return a shared generator per model/temperature (reuses its HTTP connection pool)."""
+    return BlogPostGenerator(model=model, temperature=temperature)
 
 
-def create_shoppers_blog_chain(model: str = "gpt-4") -> BlogPostGenerator:
+def create_shoppers_blog_chain(model: str = DEFAULT_MODEL) -> BlogPostGenerator:
     """
     Create a LangChain chain for shoppers blog post generation.
     
@@ -296,10 +719,10 @@ def create_shoppers_blog_chain(model: str = "gpt-4") -> BlogPostGenerator:
     Returns:
         BlogPostGenerator instance configured for shoppers posts
     """
-    return BlogPostGenerator(model=model)
+    return _get_generator(model)
 
 
-def create_recall_blog_chain(model: str = "gpt-4") -> BlogPostGenerator:
+def create_recall_blog_chain(model: str = DEFAULT_MODEL) -> BlogPostGenerator:
     """
     Create a LangChain chain for recall blog post generation.
     
@@ -309,13 +732,13 @@ def create_recall_blog_chain(model: str = "gpt-4") -> BlogPostGenerator:
     Returns:
         BlogPostGenerator instance configured for recall posts
     """
-    return BlogPostGenerator(model=model)
+    return _get_generator(model)
 
 
 # For testing
 if __name__ == "__main__":
     # Test the generator
-    generator = BlogPostGenerator(model="gpt-4")
+    generator = BlogPostGenerator()
     
     test_article = {
         "title": "FDA Recalls Popular Frozen Pizza Brand Due to Contamination",
@@ -1,17 +1,47 @@
 # learning_memory.py
 # Cross-session learning memory for the blog generation agent
 
-import os
-from typing import Dict, Any, List, Optional
+import copy
+import time
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+# supabase_storage loads .env on import
+from supabase_storage import get_supabase_storage, SupabaseStorage
 
-from supabase_storage import get_supabase_client, SupabaseStorage
+# Sessions in the "recent" window of the approval-rate trend
+TREND_WINDOW = 3
+
+# Percentage points the recent average must move to count as a trend, and
+# the labels indexed by -1/0/+1 (shifted to 0..2)
+TREND_THRESHOLD = 5
+TREND_LABELS = ("declining", "stable", "improving")
+
+# Seconds a load_session_memory result is reused for the same category
+# (writes through this instance invalidate it immediately)
+SESSION_MEMORY_TTL = 60
+
+
+_storage: Optional[SupabaseStorage] = None
+_storage_lock = threading.Lock()
+
+
+def _default_storage() -> Optional[SupabaseStorage]:
+    """
+    Shared SupabaseStorage (and connection pool) for memories created without one.
+    
+    Only a connected client is kept, so memories created before the Supabase
+    credentials are set try again instead of staying on the local store.
+    """
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                _storage = get_supabase_storage()
+    return _storage
 
 
 class LearningMemory:
@@ -27,12 +57,40 @@ class LearningMemory:
         Args:
             supabase_client: Optional Supabase client
         """
-        self.client = supabase_client or get_supabase_client()
+        self.client = supabase_client or _default_storage()
         self._local_memory: Dict[str, Any] = {
             "insights": [],
             "metrics": [],
             "patterns": []
         }
+        # Local insights bucketed by (insight_type, category), with None as a
+        # wildcard, so filtered reads don't rescan every insight
+        self._insight_index: Dict[Tuple[Optional[str], Optional[str]], List[Dict[str, Any]]] = defaultdict(list)
+        self._insight_index[(None, None)] = self._local_memory["insights"]
+        # Local metrics by category (None holds every category)
+        self._metrics_index: Dict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+        self._metrics_index[None] = self._local_memory["metrics"]
+        # Running approval-rate statistics per category (None: all), updated on
+        # write so get_performance_summary doesn't rescan the history
+        self._approval_stats: Dict[Optional[str], Dict[str, Any]] = defaultdict(
+            lambda: {"n": 0, "sum": 0.0, "recent": deque(maxlen=TREND_WINDOW), "older_sum": 0.0, "older_n": 0}
+        )
+        # Cleared when the get_learning_memory SQL function isn't deployed
+        self._fused_lookup = True
+        # category -> (monotonic time, load_session_memory result)
+        self._session_cache: Dict[Optional[str], Tuple[float, Dict[str, Any]]] = {}
+    
+    def _add_local_insight(self, insight: Dict[str, Any]) -> None:
+        """Append an insight to the local store and its filter buckets."""
+        insight_type = insight.get("insight_type") or None
+        category = insight.get("category") or None
+        self._local_memory["insights"].append(insight)
+        if insight_type:
+            self._insight_index[(insight_type, None)].append(insight)
+        if category:
+            self._insight_index[(None, category)].append(insight)
+        if insight_type and category:
+            self._insight_index[(insight_type, category)].append(insight)
     
     def store_insight(
         self,
@@ -53,13 +111,7 @@ class LearningMemory:
         Returns:
             Result dictionary
         """
-        insight = {
-            "insight_type": insight_type,
-            "description": description,
-            "category": category,
-            "frequency": frequency,
-            "created_at": datetime.now().isoformat()
-        }
+        self._session_cache.clear()
         
         if self.client:
             return self.client.save_learning_insight(
@@ -68,15 +120,47 @@ class LearningMemory:
                 category=category,
                 frequency=frequency
             )
-        else:
-            self._local_memory["insights"].append(insight)
-            return {"success": True, "cached": True}
+        
+        # Only the local store keeps a record dict (and its timestamp)
+        self._add_local_insight({
+            "insight_type": insight_type,
+            "description": description,
+            "category": category,
+            "frequency": frequency,
+            "created_at": datetime.now().isoformat()
+        })
+        return {"success": True, "cached": True}
+    
+    def store_insights(self, insights: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Store several learning insights in one write.
+        
+        Args:
+            insights: Dicts with insight_type, description, category and
+                optional frequency and created_at (see store_insight); one
+                timestamp is taken for rows without created_at
+            
+        Returns:
+            Result dictionary
+        """
+        if not insights:
+            return {"success": True}
+        self._session_cache.clear()
+        
+        if self.client:
+            return self.client.save_learning_insights_bulk(insights)
+        
+        created_at = datetime.now().isoformat()
+        for insight in insights:
+            self._add_local_insight({"frequency": 1, "category": "", "created_at": created_at, **insight})
+        return {"success": True, "cached": True}
     
     def get_insights(
         self,
         insight_type: Optional[str] = None,
         category: Optional[str] = None,
-        limit: int = 20
+        limit: int = 20,
+        columns: str = "*"
     ) -> List[Dict[str, Any]]:
         """
         Retrieve learning insights.
@@ -85,6 +169,8 @@ class LearningMemory:
             insight_type: Filter by type
             category: Filter by category
             limit: Maximum number of insights
+            columns: Columns to fetch from Supabase (local insights are
+                always returned whole)
             
         Returns:
             List of insights
@@ -93,15 +179,12 @@ class LearningMemory:
             return self.client.get_learning_insights(
                 insight_type=insight_type,
                 category=category,
-                limit=limit
+                limit=limit,
+                columns=columns
             )
         else:
-            insights = self._local_memory["insights"]
-            if insight_type:
-                insights = [i for i in insights if i.get("insight_type") == insight_type]
-            if category:
-                insights = [i for i in insights if i.get("category") == category]
-            return insights[:limit]
+            bucket = self._insight_index.get((insight_type or None, category or None), [])
+            return bucket[:limit]
     
     def store_session_metrics(
         self,
@@ -118,29 +201,60 @@ class LearningMemory:
         Returns:
             Result dictionary
         """
+        created_at = self._record_metrics(category, metrics)
+        
+        # Store key metrics as insights if notable
+        insight = self._metrics_insight(category, metrics)
+        if insight:
+            self.store_insights([{**insight, "created_at": created_at}])
+        
+        return {"success": True}
+    
+    def _record_metrics(self, category: str, metrics: Dict[str, Any]) -> str:
+        """Append a session's metrics to the local history; returns its created_at."""
+        created_at = datetime.now().isoformat()
         metric_record = {
             "category": category,
             "metrics": metrics,
-            "created_at": datetime.now().isoformat()
+            "created_at": created_at
         }
-        
+        self._session_cache.clear()
         self._local_memory["metrics"].append(metric_record)
+        if category:
+            self._metrics_index[category].append(metric_record)
         
-        # Store key metrics as insights if notable
-        if metrics.get("approval_rate", 0) >= 90:
-            self.store_insight(
-                insight_type="improvement_pattern",
-                description=f"High approval rate ({metrics.get('approval_rate')}%) achieved",
-                category=category
-            )
-        elif metrics.get("approval_rate", 100) < 50:
-            self.store_insight(
-                insight_type="problem",
-                description=f"Low approval rate ({metrics.get('approval_rate')}%) - needs attention",
-                category=category
-            )
+        approval_rate = metrics.get("approval_rate", 0)
+        for key in ({None, category} if category else (None,)):
+            stats = self._approval_stats[key]
+            stats["n"] += 1
+            stats["sum"] += approval_rate
+            recent = stats["recent"]
+            if len(recent) == recent.maxlen:
+                # The oldest recent rate moves into the "older" window
+                stats["older_sum"] += recent[0]
+                stats["older_n"] += 1
+            recent.append(approval_rate)
         
-        return {"success": True}
+        return created_at
+    
+    def _metrics_insight(self, category: str, metrics: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the insight a notably high or low approval rate warrants, if any."""
+        approval_rate = metrics.get("approval_rate")
+        if approval_rate is None:
+            return None
+        if approval_rate >= 90:
+            return {
+                "insight_type": "improvement_pattern",
+                "description": f"High approval rate ({approval_rate}%) achieved",
+                "category": category
+            }
+        if approval_rate < 50:
+            return {
+                "insight_type": "problem",
+                "description": f"Low approval rate ({approval_rate}%) - needs attention",
+                "category": category
+            }
+        return None
     
     def get_performance_summary(
         self,
@@ -155,10 +269,7 @@ class LearningMemory:
         Returns:
             Performance summary
         """
-        metrics = self._local_memory["metrics"]
-        
-        if category:
-            metrics = [m for m in metrics if m.get("category") == category]
+        metrics = self._metrics_index.get(category or None, [])
         
         if not metrics:
             return {
@@ -167,28 +278,19 @@ class LearningMemory:
                 "trend": "no_data"
             }
         
-        # Calculate averages
-        total_sessions = len(metrics)
-        approval_rates = [
-            m.get("metrics", {}).get("approval_rate", 0) 
-            for m in metrics
-        ]
+        # Averages come from the running statistics
+        stats = self._approval_stats[category or None]
+        total_sessions = stats["n"]
+        avg_approval = stats["sum"] / total_sessions
         
-        avg_approval = sum(approval_rates) / len(approval_rates) if approval_rates else 0
-        
-        # Calculate trend
-        if len(approval_rates) >= 3:
-            recent = approval_rates[-3:]
-            older = approval_rates[:-3] if len(approval_rates) > 3 else approval_rates[:1]
+        # Calculate trend: the last TREND_WINDOW sessions against everything
+        # before them (or the first session when there is nothing before)
+        recent = stats["recent"]
+        if total_sessions >= TREND_WINDOW:
             recent_avg = sum(recent) / len(recent)
-            older_avg = sum(older) / len(older) if older else 0
-            
-            if recent_avg > older_avg + 5:
-                trend = "improving"
-            elif recent_avg < older_avg - 5:
-                trend = "declining"
-            else:
-                trend = "stable"
+            older_avg = stats["older_sum"] / stats["older_n"] if stats["older_n"] else recent[0]
+            direction = (recent_avg > older_avg + TREND_THRESHOLD) - (recent_avg < older_avg - TREND_THRESHOLD)
+            trend = TREND_LABELS[direction + 1]
         else:
             trend = "insufficient_data"
         
@@ -217,7 +319,8 @@ class LearningMemory:
         insights = self.get_insights(
             insight_type="common_mistake",
             category=category,
-            limit=limit
+            limit=limit,
+            columns="description"
         )
         
         return [i.get("description", "") for i in insights]
@@ -240,7 +343,8 @@ class LearningMemory:
         insights = self.get_insights(
             insight_type="improvement_pattern",
             category=category,
-            limit=limit
+            limit=limit,
+            columns="description"
         )
         
         return [i.get("description", "") for i in insights]
@@ -256,14 +360,52 @@ class LearningMemory:
             category: Filter by category
             
         Returns:
-            Memory data for the session
+            Memory data for the session (a copy; results are reused for
+            SESSION_MEMORY_TTL seconds)
         """
-        return {
-            "common_mistakes": self.get_common_mistakes(category),
-            "successful_patterns": self.get_successful_patterns(category),
-            "performance_summary": self.get_performance_summary(category),
-            "recent_insights": self.get_insights(category=category, limit=5)
-        }
+        cached = self._session_cache.get(category)
+        if cached and time.monotonic() - cached[0] < SESSION_MEMORY_TTL:
+            return copy.deepcopy(cached[1])
+        
+        fused = None
+        if self.client and self._fused_lookup:
+            # One query for all three insight lists. None means the SQL
+            # function isn't deployed, so stop trying; any other error only
+            # falls back for this load.
+            try:
+                fused = self.client.get_learning_insights_multi(category)
+                self._fused_lookup = fused is not None
+            except Exception:
+                fused = None
+        
+        if fused is not None:
+            memory = {
+                "common_mistakes": fused["common_mistakes"],
+                "successful_patterns": fused["successful_patterns"],
+                "performance_summary": self.get_performance_summary(category),
+                "recent_insights": fused["recent_insights"]
+            }
+        elif self.client:
+            # Three independent Supabase queries: overlap their round-trips
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                mistakes = executor.submit(self.get_common_mistakes, category)
+                patterns = executor.submit(self.get_successful_patterns, category)
+                recent = executor.submit(self.get_insights, category=category, limit=5)
+                memory = {
+                    "common_mistakes": mistakes.result(),
+                    "successful_patterns": patterns.result(),
+                    "performance_summary": self.get_performance_summary(category),
+                    "recent_insights": recent.result()
+                }
+        else:
+            memory = {
+                "common_mistakes": self.get_common_mistakes(category),
+                "successful_patterns": self.get_successful_patterns(category),
+                "performance_summary": self.get_performance_summary(category),
+                "recent_insights": self.get_insights(category=category, limit=5)
+            }
+        self._session_cache[category] = (time.monotonic(), memory)
+        return copy.deepcopy(memory)
     
     def save_session_memory(
         self,
@@ -288,17 +430,38 @@ class LearningMemory:
             "avg_reflection_attempts": session_data.get("avg_attempts", 0)
         }
         
-        self.store_session_metrics(category, metrics)
+        created_at = self._record_metrics(category, metrics)
         
-        # Store any new insights
-        for insight in session_data.get("new_insights", []):
-            self.store_insight(
-                insight_type=insight.get("type", "general"),
-                description=insight.get("description", ""),
-                category=category
-            )
+        # The metrics insight and any new insights go out in one write,
+        # stamped with the session's timestamp
+        insights = [
+            {
+                "insight_type": insight.get("type", "general"),
+                "description": insight.get("description", ""),
+                "category": category,
+                "created_at": created_at
+            }
+            for insight in session_data.get("new_insights", [])
+        ]
+        metrics_insight = self._metrics_insight(category, metrics)
+        if metrics_insight:
+            insights.insert(0, {**metrics_insight, "created_at": created_at})
         
-        return {"success": True}
+        return self.store_insights(insights)
+
+
+_default_memory: Optional[LearningMemory] = None
+_default_memory_lock = threading.Lock()
+
+
+def _get_default_memory() -> LearningMemory:
+    """Return the process-wide LearningMemory used by load_learning_memory."""
+    global _default_memory
+    if _default_memory is None:
+        with _default_memory_lock:
+            if _default_memory is None:
+                _default_memory = LearningMemory()
+    return _default_memory
 
 
 # Convenience function for loading memory
@@ -312,8 +475,7 @@ def load_learning_memory(category: str = "shoppers") -> Dict[str, Any]:
     Returns:
         Memory data
     """
-    memory = LearningMemory()
-    return memory.load_session_memory(category)
+    return _get_default_memory().load_session_memory(category)
 
 
 # For testing
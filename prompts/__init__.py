@@ -9,8 +9,8 @@ Provides comprehensive prompts for blog post generation with:
 - Zeigarnik gap headline formulas
 """
 
-from .shoppers_prompt import SHOPPERS_BLOG_PROMPT
-from .recall_prompt import RECALL_BLOG_PROMPT
+from .shoppers_prompt import SHOPPERS_BLOG_PROMPT, SHOPPERS_SYSTEM_PROMPT, SHOPPERS_ARTICLE_PROMPT
+from .recall_prompt import RECALL_BLOG_PROMPT, RECALL_SYSTEM_PROMPT, RECALL_ARTICLE_PROMPT
 from .reflection_prompt import REFLECTION_PROMPT
 from .base_guidelines import (
     VOICE_TONE_GUIDELINES,
@@ -25,6 +25,10 @@ from .base_guidelines import (
 __all__ = [
     'SHOPPERS_BLOG_PROMPT',
     'RECALL_BLOG_PROMPT',
+    'SHOPPERS_SYSTEM_PROMPT',
+    'SHOPPERS_ARTICLE_PROMPT',
+    'RECALL_SYSTEM_PROMPT',
+    'RECALL_ARTICLE_PROMPT',
     'REFLECTION_PROMPT',
     'VOICE_TONE_GUIDELINES',
     'TWO_AUDIENCE_APPROACH',
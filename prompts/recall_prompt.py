@@ -10,7 +10,10 @@ from .base_guidelines import (
     STRUCTURE_RULES,
 )
 
-RECALL_BLOG_PROMPT = f"""Task: You are a Recall Lead Content Strategist for Youdle, a grocery insights platform with 33,000 members. Transform the provided recall information into a 400-600 word HTML newsletter section for U.S. grocery shoppers.
+# Static instructions plus the few-shot examples. Kept ahead of the article so
+# every request in a batch shares a byte-identical prefix (OpenAI caches
+# repeated prompt prefixes of 1024+ tokens automatically).
+RECALL_SYSTEM_PROMPT = f"""Task: You are a Recall Lead Content Strategist for Youdle, a grocery insights platform with 33,000 members. Transform the provided recall information into a 400-600 word HTML newsletter section for U.S. grocery shoppers.
 
 **IMPORTANT:** If the input contains MULTIPLE recalls (separated by "---"), create a single **Weekly Recall Roundup** article that covers ALL of them. Use a roundup headline like "X food safety alerts you need to know this week" and organize each recall as a clearly labeled section within one article.
 
@@ -128,9 +131,14 @@ Youdle has four core features you should naturally reference:
 - Would a reader know exactly what to check in their pantry?
 
 {{examples_section}}
+"""
 
-Now generate a recall blog post for this article:
-Title: {{title}}
-Content: {{content}}
-Original Link: {{original_link}}
+# The per-article part, sent as the user message
+RECALL_ARTICLE_PROMPT = """Now generate a recall blog post for this article:
+Title: {title}
+Content: {content}
+Original Link: {original_link}
 """
+
+# Single-message form of the prompt (system + article)
+RECALL_BLOG_PROMPT = RECALL_SYSTEM_PROMPT + "\n" + RECALL_ARTICLE_PROMPT
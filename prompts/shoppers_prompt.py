@@ -11,7 +11,10 @@ from .base_guidelines import (
     STRUCTURE_RULES,
 )
 
-SHOPPERS_BLOG_PROMPT = f"""Task: You are a Lead Content Strategist for Youdle, a grocery insights platform with 33,000 members. Transform the provided article into a 400-600 word HTML newsletter section for U.S. grocery shoppers.
+# Static instructions plus the few-shot examples. Kept ahead of the article so
+# every request in a batch shares a byte-identical prefix (OpenAI caches
+# repeated prompt prefixes of 1024+ tokens automatically).
+SHOPPERS_SYSTEM_PROMPT = f"""Task: You are a Lead Content Strategist for Youdle, a grocery insights platform with 33,000 members. Transform the provided article into a 400-600 word HTML newsletter section for U.S. grocery shoppers.
 
 Youdle has four core features you should naturally reference:
 1. **Search** - Shows in-stock groceries at nearby stores with real-time prices
@@ -100,9 +103,14 @@ Youdle has four core features you should naturally reference:
 - Would this article be useful even if Youdle wasn't mentioned?
 
 {{examples_section}}
+"""
 
-Now generate a blog post for this article:
-Title: {{title}}
-Content: {{content}}
-Original Link: {{original_link}}
+# The per-article part, sent as the user message
+SHOPPERS_ARTICLE_PROMPT = """Now generate a blog post for this article:
+Title: {title}
+Content: {content}
+Original Link: {original_link}
 """
+
+# Single-message form of the prompt (system + article)
+SHOPPERS_BLOG_PROMPT = SHOPPERS_SYSTEM_PROMPT + "\n" + SHOPPERS_ARTICLE_PROMPT
@@ -5,9 +5,11 @@ import os
 import base64
 import asyncio
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from concurrent.futures import ThreadPoolExecutor
-from supabase import create_client, Client
+from functools import lru_cache
+import httpx
+from supabase import create_client, Client, ClientOptions
 
 try:
     from dotenv import load_dotenv
@@ -22,6 +24,43 @@ except ImportError:
 STORAGE_BUCKET = "blog-images"
 DEFAULT_FOLDER = "newsletter"
 
+# Shared HTTP connection pool for all Supabase clients in this process
+HTTP_MAX_CONNECTIONS = 50
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_TIMEOUT = 30
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """
+    Get the process-wide pooled httpx client used for Supabase requests.
+
+    Uses HTTP/2 when the `h2` package is installed, HTTP/1.1 keep-alive otherwise.
+    """
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+    )
+    try:
+        return httpx.Client(http2=True, limits=limits, timeout=HTTP_TIMEOUT)
+    except ImportError:
+        return httpx.Client(limits=limits, timeout=HTTP_TIMEOUT)
+
+
+@lru_cache(maxsize=4)
+def create_pooled_client(url: str, key: str) -> Client:
+    """
+    Create (once per url/key) a Supabase client on the shared connection pool.
+
+    Args:
+        url: Supabase project URL
+        key: Supabase anon key
+
+    Returns:
+        Supabase Client instance
+    """
+    return create_client(url, key, options=ClientOptions(httpx_client=get_http_client()))
+
 
 class SupabaseStorage:
     """Supabase client for image storage and database operations."""
@@ -44,7 +83,7 @@ class SupabaseStorage:
         if not self.url or not self.key:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set")
         
-        self.client: Client = create_client(self.url, self.key)
+        self.client: Client = create_pooled_client(self.url, self.key)
         self.bucket = STORAGE_BUCKET
     
     def _ensure_bucket_exists(self) -> bool:
@@ -67,7 +106,7 @@ class SupabaseStorage:
     
     def upload_image(
         self,
-        image_data: str,
+        image_data: Union[str, bytes],
         filename: str,
         folder: str = DEFAULT_FOLDER,
         content_type: str = "image/png"
@@ -76,7 +115,7 @@ class SupabaseStorage:
         Upload an image to Supabase storage.
         
         Args:
-            image_data: Base64 encoded image data
+            image_data: Raw image bytes or base64 encoded image data
             filename: Name for the file
             folder: Folder path in bucket
             content_type: MIME type of the image
@@ -88,8 +127,11 @@ class SupabaseStorage:
             # Ensure bucket exists
             self._ensure_bucket_exists()
             
-            # Decode base64 data
-            image_bytes = base64.b64decode(image_data)
+            # Raw bytes upload as-is; base64 strings are decoded
+            if isinstance(image_data, (bytes, bytearray, memoryview)):
+                image_bytes = bytes(image_data)
+            else:
+                image_bytes = base64.b64decode(image_data)
             
             # Generate unique filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -136,9 +178,12 @@ class SupabaseStorage:
         Returns:
             List of upload results
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # No context manager: a with-block would join the threads on exit,
+        # blocking the event loop if this coroutine is cancelled mid-upload
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
             tasks = [
                 loop.run_in_executor(
                     executor,
@@ -153,6 +198,8 @@ class SupabaseStorage:
             ]
             
             results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         
         # Process results
         processed_results = []
@@ -223,6 +270,48 @@ class SupabaseStorage:
                 "error": str(e)
             }
     
+    def save_blog_examples_batch(self, examples: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Save multiple blog post examples in a single insert.
+        
+        Args:
+            examples: List of dicts with the same keys as save_blog_example's arguments
+            
+        Returns:
+            Result dictionary with the number of rows inserted
+        """
+        if not examples:
+            return {"success": True, "count": 0}
+        
+        try:
+            created_at = datetime.now().isoformat()
+            rows = [
+                {
+                    "original_article_url": e["original_article_url"],
+                    "original_article_title": e["original_article_title"],
+                    "generated_html": e["generated_html"],
+                    "category": e["category"].lower(),
+                    "feedback_score": e.get("feedback_score", 0),
+                    "feedback_comments": e.get("feedback_comments", ""),
+                    "is_good_example": e.get("is_good_example", True),
+                    "created_at": created_at
+                }
+                for e in examples
+            ]
+            
+            result = self.client.table("blog_examples").insert(rows).execute()
+            
+            return {
+                "success": True,
+                "count": len(result.data or [])
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     def get_examples_by_category(
         self,
         category: str,
@@ -306,6 +395,47 @@ class SupabaseStorage:
                 "error": str(e)
             }
     
+    def save_feedback_batch(self, feedback: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Save multiple feedback records in a single insert.
+        
+        Args:
+            feedback: List of dicts with the same keys as save_feedback's arguments
+            
+        Returns:
+            Result dictionary with the number of rows inserted
+        """
+        if not feedback:
+            return {"success": True, "count": 0}
+        
+        try:
+            created_at = datetime.now().isoformat()
+            rows = [
+                {
+                    "blog_post_id": f["blog_post_id"],
+                    "feedback_type": f["feedback_type"],
+                    "score": f["score"],
+                    "comments": f.get("comments", ""),
+                    "approved": f.get("approved", False),
+                    "reviewer_notes": f.get("reviewer_notes", ""),
+                    "created_at": created_at
+                }
+                for f in feedback
+            ]
+            
+            result = self.client.table("feedback").insert(rows).execute()
+            
+            return {
+                "success": True,
+                "count": len(result.data or [])
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     def get_feedback_patterns(
         self,
         category: Optional[str] = None,
@@ -400,11 +530,70 @@ class SupabaseStorage:
                 "error": str(e)
             }
     
+    def save_learning_insights_bulk(self, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Save several learning insights with a single INSERT.
+        
+        Args:
+            rows: Insight dicts with insight_type, description, category and
+                frequency (created_at defaults to now)
+            
+        Returns:
+            Result dictionary with the inserted ids
+        """
+        if not rows:
+            return {"success": True, "ids": []}
+        
+        try:
+            created_at = datetime.now().isoformat()
+            data = [
+                {
+                    "insight_type": row["insight_type"],
+                    "description": row["description"],
+                    "category": row.get("category", ""),
+                    "frequency": row.get("frequency", 1),
+                    "created_at": row.get("created_at") or created_at
+                }
+                for row in rows
+            ]
+            
+            table = self.client.table("learning_insights")
+            try:
+                result = table.insert(data).execute()
+            except Exception:
+                # One bad row (e.g. an insight_type the CHECK constraint
+                # rejects) fails the whole INSERT; save the rest row by row,
+                # keeping the same created_at as the bulk path
+                ids, errors = [], []
+                for row in data:
+                    try:
+                        inserted = table.insert(row).execute().data
+                        ids.append(inserted[0]["id"] if inserted else None)
+                    except Exception as e:
+                        errors.append(str(e))
+                return {
+                    "success": not errors,
+                    "ids": ids,
+                    "errors": errors
+                }
+            
+            return {
+                "success": True,
+                "ids": [item["id"] for item in (result.data or [])]
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     def get_learning_insights(
         self,
         insight_type: Optional[str] = None,
         category: Optional[str] = None,
-        limit: int = 20
+        limit: int = 20,
+        columns: str = "*"
     ) -> List[Dict[str, Any]]:
         """
         Get learning insights.
@@ -413,12 +602,13 @@ class SupabaseStorage:
             insight_type: Filter by insight type
             category: Filter by category
             limit: Maximum number of insights
+            columns: PostgREST column list to return (default: all)
             
         Returns:
             List of insights
         """
         try:
-            query = self.client.table("learning_insights").select("*")
+            query = self.client.table("learning_insights").select(columns)
             
             if insight_type:
                 query = query.eq("insight_type", insight_type)
@@ -434,6 +624,57 @@ class SupabaseStorage:
         except Exception as e:
             print(f"Error fetching insights: {e}")
             return []
+    
+    def get_learning_insights_multi(
+        self,
+        category: Optional[str] = None,
+        limit: int = 10,
+        recent: int = 5
+    ) -> Optional[Dict[str, List[Any]]]:
+        """
+        Get the common mistakes, successful patterns and recent insights for a
+        category in one round-trip (the get_learning_memory SQL function, see
+        api/migrations/003_learning_memory_function.sql).
+        
+        Args:
+            category: Filter by category (None or "" for all)
+            limit: Maximum mistakes and patterns
+            recent: Maximum recent insights
+            
+        Returns:
+            {"common_mistakes": [...], "successful_patterns": [...],
+            "recent_insights": [...]}, or None if the function is not deployed
+            
+        Raises:
+            Exception: Any other error (network, timeout, ...), so callers can
+            fall back for this call without giving up on the function
+        """
+        try:
+            result = self.client.rpc("get_learning_memory", {
+                "p_category": category or None,
+                "p_limit": limit,
+                "p_recent": recent
+            }).execute()
+            data = result.data or {}
+            return {
+                "common_mistakes": data.get("common_mistakes") or [],
+                "successful_patterns": data.get("successful_patterns") or [],
+                "recent_insights": data.get("recent_insights") or []
+            }
+            
+        except Exception as e:
+            if _is_missing_function(e):
+                print(f"get_learning_memory function not found: {e}")
+                return None
+            print(f"Error fetching learning memory: {e}")
+            raise
+
+
+def _is_missing_function(error: Exception) -> bool:
+    """True if an RPC error means the SQL function does not exist (PGRST202 / 404)."""
+    code = str(getattr(error, "code", "") or "")
+    response = getattr(error, "response", None)
+    return code in ("PGRST202", "404") or getattr(response, "status_code", None) == 404
 
 
 def get_supabase_client() -> Optional[Client]:
@@ -473,10 +714,9 @@ if __name__ == "__main__":
     if client:
         print("Supabase client initialized successfully")
         
-        # Test upload with a simple placeholder
-        test_data = base64.b64encode(b"test image data").decode('utf-8')
+        # Test upload with a simple placeholder (raw bytes, as the pipeline sends them)
         result = client.upload_image(
-            image_data=test_data,
+            image_data=b"test image data",
             filename="test_image.txt"
         )
         
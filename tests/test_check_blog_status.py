@@ -0,0 +1,179 @@
+"""
+Tests for check_blog_status.
+Covers: the memoized week start around the Tuesday boundary, count-only
+post queries, the requirement check and the --quiet fast path.
+"""
+import sys
+import os
+import pytest
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timezone
+
+# Add paths so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import check_blog_status
+from check_blog_status import (
+    get_week_start_date, count_this_weeks_posts, check_requirement_met, main
+)
+
+
+# Tuesday 2026-10-20 00:00 America/Chicago (CDT, UTC-5)
+BOUNDARY = datetime(2026, 10, 20, 5, 0, 0, tzinfo=timezone.utc)
+LAST_WEEK = datetime(2026, 10, 13, 5, 0, 0, tzinfo=timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Fixtures and helpers
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze time.time() and datetime.now() in check_blog_status at a settable instant."""
+    frozen = {"now": BOUNDARY}
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return frozen["now"].astimezone(tz) if tz else frozen["now"].replace(tzinfo=None)
+
+    monkeypatch.setattr(check_blog_status, "datetime", FrozenDatetime)
+    monkeypatch.setattr(check_blog_status.time, "time", lambda: frozen["now"].timestamp())
+    monkeypatch.setattr(check_blog_status, "_week_start_cache", None)
+
+    def set_now(when):
+        frozen["now"] = when
+    return set_now
+
+
+def _query(count=None, error=None):
+    """Chainable Supabase query stub whose execute() returns `count`."""
+    query = MagicMock()
+    for method in ("table", "select", "or_", "ilike", "eq", "is_", "gte", "limit"):
+        getattr(query, method).return_value = query
+    query.not_ = query
+    if error:
+        query.execute.side_effect = error
+    else:
+        query.execute.return_value = MagicMock(count=count, data=[])
+    return query
+
+
+# ===========================================================================
+# WEEK START
+# ===========================================================================
+
+class TestWeekStart:
+    """Tests for get_week_start_date and its boundary-aware memo"""
+
+    def test_just_before_boundary_is_last_week(self, clock):
+        """One second before Tuesday midnight Chicago time is still last week."""
+        clock(BOUNDARY.replace(hour=4, minute=59, second=59))
+        assert get_week_start_date() == LAST_WEEK
+
+    def test_memo_rolls_over_at_boundary(self, clock):
+        """A week start cached before the boundary is recomputed right after it."""
+        clock(BOUNDARY.replace(hour=4, minute=59, second=59))
+        assert get_week_start_date() == LAST_WEEK
+
+        clock(BOUNDARY.replace(second=1))
+        assert get_week_start_date() == BOUNDARY
+
+    def test_memo_reused_within_week(self, clock):
+        """Later calls in the same week don't recompute."""
+        clock(BOUNDARY.replace(day=22))
+        get_week_start_date()
+        with patch("check_blog_status._compute_week_start_date") as compute:
+            clock(BOUNDARY.replace(day=26, hour=4))
+            assert get_week_start_date() == BOUNDARY
+        compute.assert_not_called()
+
+    def test_next_boundary_follows_dst_change(self, clock):
+        """The week after DST ends starts at 06:00 UTC, not 05:00."""
+        clock(BOUNDARY.replace(day=28))
+        get_week_start_date()
+        assert check_blog_status._week_start_cache[1] == datetime(
+            2026, 11, 3, 6, 0, 0, tzinfo=timezone.utc
+        ).timestamp()
+
+
+# ===========================================================================
+# POST COUNTS
+# ===========================================================================
+
+class TestCountThisWeeksPosts:
+    """Tests for count_this_weeks_posts"""
+
+    def test_returns_exact_count(self):
+        """The count comes from the count-only query, filtered by category."""
+        supabase = _query(count=5)
+        assert count_this_weeks_posts(supabase, LAST_WEEK.isoformat(), "RECALL") == 5
+        supabase.ilike.assert_called_once_with("category", "RECALL")
+        supabase.select.assert_called_once_with("id", count="exact")
+
+    def test_missing_count_is_zero(self):
+        """A response without a count is treated as no posts."""
+        assert count_this_weeks_posts(_query(count=None), LAST_WEEK.isoformat()) == 0
+
+    def test_query_error_is_zero(self):
+        """Query failures are reported and counted as zero."""
+        assert count_this_weeks_posts(_query(error=RuntimeError("down")), LAST_WEEK.isoformat()) == 0
+
+
+# ===========================================================================
+# REQUIREMENT CHECK
+# ===========================================================================
+
+class TestCheckRequirementMet:
+    """Tests for check_requirement_met"""
+
+    def test_missing_recall_skips_shoppers_query(self, clock):
+        """Without a RECALL post the SHOPPERS count is never queried."""
+        with patch("check_blog_status.count_published_this_week", return_value=0) as count:
+            assert check_requirement_met(MagicMock()) is False
+        assert [c.args[1] for c in count.call_args_list] == ["RECALL"]
+
+    @pytest.mark.parametrize("shoppers, expected", [(6, True), (5, False)])
+    def test_shoppers_threshold(self, clock, shoppers, expected):
+        """With a RECALL post, the result depends on reaching six SHOPPERS posts."""
+        counts = {"RECALL": 1, "SHOPPERS": shoppers}
+        with patch("check_blog_status.count_published_this_week",
+                   side_effect=lambda supabase, category, week_start_iso, limit: counts[category]):
+            assert check_requirement_met(MagicMock()) is expected
+
+    def test_no_client_is_not_met(self):
+        """Missing Supabase credentials count as not met."""
+        with patch("check_blog_status.get_supabase_client", return_value=None):
+            assert check_requirement_met() is False
+
+
+# ===========================================================================
+# CLI
+# ===========================================================================
+
+class TestQuietMode:
+    """Tests for the --quiet / --exit-code command-line paths"""
+
+    @pytest.mark.parametrize("met", [True, False])
+    def test_quiet_exit_code_uses_fast_check(self, met, capsys):
+        """-e -q only runs check_requirement_met and prints nothing."""
+        with patch.object(sys, "argv", ["check_blog_status.py", "-e", "-q"]), \
+             patch("check_blog_status.check_requirement_met", return_value=met), \
+             patch("check_blog_status.check_publish_status") as full_status:
+            if met:
+                main()
+            else:
+                with pytest.raises(SystemExit) as exit_info:
+                    main()
+                assert exit_info.value.code == 1
+        full_status.assert_not_called()
+        assert capsys.readouterr().out == ""
+
+    def test_quiet_alone_skips_report(self, capsys):
+        """-q without -e still checks status but prints no report."""
+        with patch.object(sys, "argv", ["check_blog_status.py", "-q"]), \
+             patch("check_blog_status.check_publish_status",
+                   return_value={"success": True, "meets_requirement": False}) as full_status:
+            main()
+        full_status.assert_called_once()
+        assert capsys.readouterr().out == ""
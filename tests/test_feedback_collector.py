@@ -0,0 +1,224 @@
+"""
+Tests for FeedbackCollector.
+Covers: common-issue extraction from feedback comments and the local
+(no Supabase) feedback cache.
+"""
+import sys
+import os
+import pytest
+from unittest.mock import patch, MagicMock
+
+# Add paths so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from feedback_collector import FeedbackCollector
+
+
+# ---------------------------------------------------------------------------
+# Fixture: collector running on the local cache (no Supabase)
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def collector():
+    with patch("feedback_collector.get_supabase_storage", return_value=None), \
+         patch("example_store.get_supabase_client", return_value=None):
+        yield FeedbackCollector()
+
+
+# ===========================================================================
+# COMMON ISSUE EXTRACTION
+# ===========================================================================
+
+class TestExtractCommonIssues:
+    """Tests for FeedbackCollector._extract_common_issues"""
+
+    def test_keywords_map_to_issue_labels(self, collector):
+        """Each keyword in a comment produces its labelled issue."""
+        patterns = [{
+            "type": "content",
+            "avg_score": 4,
+            "comments": ["Missing the LINK to the source"]
+        }]
+        issues = collector._extract_common_issues(patterns)
+        assert "Missing elements: Missing the LINK to the source" in issues
+        assert "Link issue: Missing the LINK to the source" in issues
+        assert not any(i.startswith("Structure issue") for i in issues)
+
+    def test_low_score_reported(self, collector):
+        """Patterns with an average below 3 are flagged."""
+        patterns = [{"type": "tone", "avg_score": 2, "comments": []}]
+        assert collector._extract_common_issues(patterns) == ["Low score in tone"]
+
+    def test_no_keywords_no_issues(self, collector):
+        """Comments without keywords produce nothing."""
+        patterns = [{"type": "overall", "avg_score": 5, "comments": ["Great post"]}]
+        assert collector._extract_common_issues(patterns) == []
+
+    def test_dedups_in_order_and_caps(self, collector):
+        """Duplicates collapse, first-seen order is kept, output is capped."""
+        comments = ["broken link"] * 3 + [f"missing item {i}" for i in range(20)]
+        patterns = [{"type": "content", "avg_score": 4, "comments": comments}]
+        issues = collector._extract_common_issues(patterns)
+        assert len(issues) == FeedbackCollector.MAX_COMMON_ISSUES
+        assert issues[0] == "Link issue: broken link"
+        assert issues[1] == "Missing elements: missing item 0"
+
+    def test_fallback_without_ahocorasick(self, collector):
+        """Substring fallback matches the automaton results."""
+        patterns = [{
+            "type": "structure",
+            "avg_score": 4,
+            "comments": ["Bad structure and missing intro"]
+        }]
+        expected = sorted(collector._extract_common_issues(patterns))
+        collector._issue_automaton = None
+        assert sorted(collector._extract_common_issues(patterns)) == expected
+
+
+# ===========================================================================
+# LOCAL FEEDBACK CACHE
+# ===========================================================================
+
+class TestLocalFeedback:
+    """Tests for feedback stored without a Supabase client"""
+
+    def test_summary_averages_scores(self, collector):
+        """Summary counts and averages locally cached feedback."""
+        article = {"title": "A", "link": "https://example.com", "category": "shoppers"}
+        collector.collect_feedback("p1", "<p>1</p>", article, score=4, approved=True)
+        collector.collect_feedback("p2", "<p>2</p>", article, score=2, approved=False)
+
+        summary = collector.get_feedback_summary()
+        assert summary["total_feedback"] == 2
+        assert summary["average_score"] == 3.0
+        assert collector.get_approval_rate() == 50.0
+
+    def test_summary_reuses_analysis_until_new_feedback(self, collector):
+        """Local analysis is cached and refreshed when feedback is added."""
+        article = {"title": "A", "link": "https://example.com", "category": "shoppers"}
+        collector.collect_feedback("p1", "<p>1</p>", article, score=5, approved=True,
+                                   comments="Broken LINK")
+        first = collector._analyze_local_feedback()
+        assert collector._analyze_local_feedback() is first
+        assert first[0]["comments_lower"] == ["broken link"]
+
+        collector.collect_feedback("p2", "<p>2</p>", article, score=1, approved=False)
+        assert collector._analyze_local_feedback() is not first
+        assert collector.get_feedback_summary()["total_feedback"] == 2
+
+    def test_invalidate_cache_forces_reanalysis(self, collector):
+        """Edits made outside collect_feedback show up only after invalidate_cache()."""
+        article = {"title": "A", "link": "https://example.com", "category": "shoppers"}
+        collector.collect_feedback("p1", "<p>1</p>", article, score=5, approved=True)
+        first = collector._analyze_local_feedback()
+
+        collector._local_feedback[0]["score"] = 1
+        assert collector._analyze_local_feedback() is first
+        assert first[0]["avg_score"] == 5
+
+        collector.invalidate_cache()
+        refreshed = collector._analyze_local_feedback()
+        assert refreshed is not first
+        assert refreshed[0]["avg_score"] == 1
+
+    def test_local_feedback_export_formats_timestamp(self, collector):
+        """Exported records carry an ISO created_at and no internal fields."""
+        article = {"title": "A", "link": "https://example.com", "category": "shoppers"}
+        collector.collect_feedback("p1", "<p>1</p>", article, score=3, approved=False,
+                                   comments="Needs work")
+        record = collector.get_local_feedback()[0]
+        assert record["blog_post_id"] == "p1"
+        assert record["created_at"].endswith("+00:00")
+        assert "created_at_ns" not in record
+        assert "comments_lower" not in record
+
+# ===========================================================================
+# BATCHED INSERTS
+# ===========================================================================
+
+class TestBatchedFeedback:
+    """Tests for FeedbackCollector.batch() / collect_feedback_batch"""
+
+    def test_batch_issues_one_insert_per_table(self):
+        """Feedback collected inside batch() is inserted once on exit."""
+        client = MagicMock()
+        client.save_feedback_batch.return_value = {"success": True, "count": 2}
+        client.save_blog_examples_batch.return_value = {"success": True, "count": 2}
+        collector = FeedbackCollector(supabase_client=client)
+        article = {"title": "A", "link": "https://example.com", "category": "RECALL"}
+
+        results = collector.collect_feedback_batch([
+            {"blog_post_id": "p1", "blog_post_html": "<p>1</p>", "article_data": article,
+             "score": 5, "approved": True},
+            {"blog_post_id": "p2", "blog_post_html": "<p>2</p>", "article_data": article,
+             "score": 2, "approved": False},
+        ])
+
+        assert [r["is_good_example"] for r in results] == [True, False]
+        assert all(r["success"] and not r["queued"] for r in results)
+        client.save_feedback.assert_not_called()
+        client.save_blog_example.assert_not_called()
+        client.save_feedback_batch.assert_called_once()
+        feedback_rows = client.save_feedback_batch.call_args[0][0]
+        assert [f["blog_post_id"] for f in feedback_rows] == ["p1", "p2"]
+        example_rows = client.save_blog_examples_batch.call_args[0][0]
+        assert example_rows[0]["category"] == "recall"
+
+    def test_failed_batch_retried_per_row(self):
+        """A failed bulk insert falls back to per-row saves and reports each item."""
+        client = MagicMock()
+        client.save_feedback_batch.return_value = {"success": False, "error": "timeout"}
+        client.save_feedback.side_effect = [{"success": True}, {"success": False}]
+        client.save_blog_examples_batch.return_value = {"success": True, "count": 2}
+        collector = FeedbackCollector(supabase_client=client)
+        article = {"title": "A", "link": "https://example.com"}
+
+        results = collector.collect_feedback_batch([
+            {"blog_post_id": "p1", "blog_post_html": "<p>1</p>", "article_data": article,
+             "score": 5, "approved": True},
+            {"blog_post_id": "p2", "blog_post_html": "<p>2</p>", "article_data": article,
+             "score": 2, "approved": False},
+        ])
+
+        assert client.save_feedback.call_count == 2
+        assert client.save_feedback.call_args_list[1].kwargs["blog_post_id"] == "p2"
+        assert [r["success"] for r in results] == [True, False]
+        assert [r["example_stored"] for r in results] == [True, True]
+
+    def test_flush_with_nothing_queued_is_noop(self):
+        """flush() without queued records makes no database calls."""
+        client = MagicMock()
+        collector = FeedbackCollector(supabase_client=client)
+        assert collector.flush()["feedback_count"] == 0
+        client.save_feedback_batch.assert_not_called()
+
+
+# ===========================================================================
+# SUPABASE PATTERN CACHE
+# ===========================================================================
+
+class TestPatternCache:
+    """Tests for memoized Supabase feedback patterns"""
+
+    def test_summary_and_approval_rate_share_one_fetch(self):
+        """Back-to-back summary and approval rate hit Supabase once."""
+        client = MagicMock()
+        client.get_feedback_patterns.return_value = [
+            {"type": "overall", "count": 2, "avg_score": 4.5, "comments": []}
+        ]
+        collector = FeedbackCollector(supabase_client=client)
+
+        assert collector.get_feedback_summary()["total_feedback"] == 2
+        assert collector.get_approval_rate() == 100.0
+        assert client.get_feedback_patterns.call_count == 1
+
+    def test_saving_feedback_invalidates(self):
+        """New feedback forces the next summary to refetch."""
+        client = MagicMock()
+        client.get_feedback_patterns.return_value = []
+        collector = FeedbackCollector(supabase_client=client)
+
+        collector.get_feedback_summary()
+        collector.collect_feedback("p1", "<p>1</p>", {"category": "shoppers"}, score=4, approved=True)
+        collector.get_feedback_summary()
+        assert client.get_feedback_patterns.call_count == 2
@@ -0,0 +1,164 @@
+"""
+Tests for fetch_published_posts.
+Covers: the count-only probe in front of the full select, and writing the
+fetched posts to JSON files (orjson and json writers).
+"""
+import sys
+import os
+import json
+import pytest
+from unittest.mock import patch
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+# Add paths so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import fetch_published_posts
+from fetch_published_posts import fetch_and_write_posts, write_post_json
+
+
+WEEK_START = datetime(2026, 10, 13, 5, 0, 0, tzinfo=timezone.utc)
+
+POSTS = [
+    {"id": i, "title": f"Post {i}", "category": category, "status": "published",
+     "blogger_url": f"https://blog.example.com/{i}", "blogger_post_id": f"b{i}",
+     "article_url": f"https://news.example.com/{i}", "image_url": None,
+     "blogger_published_at": "2026-10-14T09:00:00+00:00", "created_at": "2026-10-14T08:00:00"}
+    for i, category in enumerate(["SHOPPERS", "shoppers", "RECALL", None, "Shoppers"], 1)
+]
+
+
+# ---------------------------------------------------------------------------
+# Stub Supabase client
+# ---------------------------------------------------------------------------
+
+class StubSupabase:
+    """Answers the HEAD count probe with `count` and the full select with `posts`."""
+
+    def __init__(self, count, posts):
+        self.count = count
+        self.posts = posts
+        self.selects = []
+
+    def table(self, name):
+        return self
+
+    def select(self, columns, count=None, head=False):
+        self.selects.append("head" if head else "rows")
+        self._head = head
+        return self
+
+    def gte(self, *args):
+        return self
+
+    def eq(self, *args):
+        return self
+
+    @property
+    def not_(self):
+        return self
+
+    def is_(self, *args):
+        return self
+
+    def order(self, *args, **kwargs):
+        return self
+
+    def limit(self, *args):
+        return self
+
+    def execute(self):
+        if self._head:
+            return SimpleNamespace(count=self.count, data=[])
+        return SimpleNamespace(count=None, data=self.posts)
+
+
+@pytest.fixture
+def run(tmp_path):
+    """Call fetch_and_write_posts against a StubSupabase; returns (result, stub)."""
+    def _run(count, posts):
+        stub = StubSupabase(count, posts)
+        with patch("fetch_published_posts.get_supabase_client", return_value=stub), \
+             patch("fetch_published_posts.get_week_start_date", return_value=WEEK_START):
+            return fetch_and_write_posts(str(tmp_path / "out")), stub
+    return _run
+
+
+# ===========================================================================
+# COUNT PROBE
+# ===========================================================================
+
+class TestCountProbe:
+    """Tests for the count-only probe in fetch_and_write_posts"""
+
+    def test_zero_count_skips_full_select(self, run, tmp_path):
+        """An empty week returns after the HEAD request without fetching rows."""
+        result, stub = run(0, POSTS)
+
+        assert stub.selects == ["head"]
+        assert result["posts_fetched"] == 0
+        assert "warning" in result
+        assert not (tmp_path / "out").exists()
+
+    def test_unknown_count_falls_back_to_select(self, run):
+        """If the probe fails (count None), the full select still runs."""
+        result, stub = run(None, POSTS)
+
+        assert stub.selects == ["head", "rows"]
+        assert result["posts_fetched"] == len(POSTS)
+
+    def test_positive_count_fetches_and_writes(self, run, tmp_path):
+        """Every post is written once, with categories counted case-insensitively."""
+        result, stub = run(len(POSTS), POSTS)
+
+        assert stub.selects == ["head", "rows"]
+        assert result["shoppers_count"] == 3
+        assert result["recall_count"] == 1
+        assert result["files_written"] == [str(tmp_path / "out" / f"{p['id']}.json") for p in POSTS]
+        for post, path in zip(POSTS, result["files_written"]):
+            with open(path, encoding="utf-8") as f:
+                assert json.load(f)["title"] == post["title"]
+
+
+# ===========================================================================
+# JSON WRITER
+# ===========================================================================
+
+class TestWritePostJson:
+    """Tests for write_post_json"""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_writers_produce_same_document(self, tmp_path, monkeypatch, use_orjson):
+        """The orjson and json paths write the same fields, UTF-8 intact."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(fetch_published_posts, "orjson", None)
+        post = {**POSTS[0], "title": "Café prices – up"}
+
+        with open(write_post_json(post, str(tmp_path)), encoding="utf-8") as f:
+            data = json.load(f)
+
+        assert data["title"] == "Café prices – up"
+        assert data["published_url"] == data["blogger_url"] == post["blogger_url"]
+        assert data["original_link"] == post["article_url"]
+        assert data["generated_at"] == post["created_at"]
+
+    def test_partial_post_uses_defaults(self, tmp_path):
+        """Missing columns fall back to POST_DEFAULTS and an 'unknown' filename."""
+        path = write_post_json({"title": "Only a title"}, str(tmp_path))
+
+        assert os.path.basename(path) == "unknown.json"
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["category"] == "SHOPPERS"
+        assert data["original_link"] == ""
+
+    def test_rewrite_truncates_previous_file(self, tmp_path):
+        """Writing a shorter post over a longer one leaves no stale bytes."""
+        write_post_json({**POSTS[0], "title": "x" * 500}, str(tmp_path))
+        path = write_post_json(POSTS[0], str(tmp_path))
+
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f)["title"] == POSTS[0]["title"]
@@ -0,0 +1,343 @@
+"""
+Tests for ImageGenerator.
+Covers: the generated-image cache (in-memory LRU and SQLite store).
+"""
+import sys
+import os
+import time
+import sqlite3
+import asyncio
+import pytest
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# Add paths so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from image_generator import (
+    ImageGenerator, ImageCache, PlaceholderImageGenerator, image_data_b64, image_mime_type,
+    _RateLimiter, _article_theme, _truncate_label
+)
+
+
+FAKE_PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 2048
+
+
+def _image_response(data=FAKE_PNG, mime="image/png"):
+    """Build a minimal Gemini response carrying one inline image part."""
+    part = SimpleNamespace(inline_data=SimpleNamespace(data=data, mime_type=mime), text=None)
+    return SimpleNamespace(parts=[part])
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.setattr("image_generator._rate_limiter", _RateLimiter(0))
+    gen = ImageGenerator(api_key="test-key", cache=ImageCache(path=str(tmp_path / "images.sqlite")))
+    gen.client = MagicMock()
+    gen.client.models.generate_content.return_value = _image_response()
+    return gen
+
+
+# ===========================================================================
+# IMAGE CACHE
+# ===========================================================================
+
+class TestImageCache:
+    """Tests for the cache in front of ImageGenerator.generate_image"""
+
+    def test_repeat_prompt_skips_api(self, generator):
+        """The same title/theme is generated once and then served from cache."""
+        first = generator.generate_image("Coffee prices rise", "coffee beans")
+        second = generator.generate_image("Coffee prices rise", "coffee beans")
+
+        assert generator.client.models.generate_content.call_count == 1
+        assert second["image_bytes"] == first["image_bytes"] == FAKE_PNG
+        assert second["metadata"]["cached"] is True
+        assert generator.cache_stats() == {"hits": 1, "misses": 1}
+
+    def test_disk_tier_survives_new_instance(self, generator, tmp_path):
+        """A fresh generator on the same SQLite file reuses stored images."""
+        generator.generate_image("Egg recall", "eggs")
+
+        other = ImageGenerator(api_key="test-key", cache=ImageCache(path=str(tmp_path / "images.sqlite")))
+        other.client = MagicMock()
+        result = other.generate_image("Egg recall", "eggs")
+
+        assert result["success"] is True
+        other.client.models.generate_content.assert_not_called()
+
+    def test_key_depends_on_size(self, generator):
+        """Different image sizes produce different cache keys."""
+        assert generator.cache_key("A", "b", image_size="1K") != generator.cache_key("A", "b", image_size="2K")
+
+    def test_key_is_versioned(self, generator):
+        """Keys carry the cache version and model so a bump invalidates them."""
+        assert generator.cache_key("A", "b").startswith(f"v1:image:{generator.model_name}:")
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Entries past the TTL are ignored by both tiers."""
+        cache = ImageCache(path=str(tmp_path / "images.sqlite"), ttl=60)
+        cache.put("k", b"img", "image/png")
+        assert cache.get("k")["image_bytes"] == b"img"
+
+        cache.ttl = -1  # everything stored so far is now stale
+        assert cache.get("k") is None
+        assert "k" not in cache._memory
+
+    def test_semantic_match_reads_one_image(self, tmp_path, monkeypatch):
+        """A similar title is served from cache, reading only the winning row's bytes."""
+        np = pytest.importorskip("numpy")
+        vectors = {
+            "Egg prices": [1, 0], "Egg prices climb": [0.99, 0.14], "Milk": [0, 1], "Cheese": [0.6, 0.8]
+        }
+        cache = ImageCache(path=str(tmp_path / "images.sqlite"), semantic=True)
+        monkeypatch.setattr(cache, "_embed", lambda title: np.array(vectors[title], dtype="float32"))
+        cache.put("eggs", b"egg-img", "image/png", title="Egg prices", variant="v")
+        cache.put("milk", b"milk-img", "image/png", title="Milk", variant="v")
+        statements = []
+        cache._db.set_trace_callback(statements.append)
+
+        assert cache.get("other", title="Egg prices climb", variant="v")["image_bytes"] == b"egg-img"
+        assert cache.get("none", title="Cheese", variant="v") is None
+        assert sum("SELECT bytes" in sql and "key = 'eggs'" in sql for sql in statements) == 1
+        assert not any("SELECT bytes" in sql and "variant" in sql for sql in statements)
+
+    def test_disk_store_evicts_oldest_past_size_limit(self, tmp_path):
+        """The SQLite tier stays under max_bytes by dropping its oldest images."""
+        path = str(tmp_path / "images.sqlite")
+        cache = ImageCache(path=path, max_bytes=10)
+        cache.put("old", b"x" * 6, "image/png")
+        cache.put("new", b"y" * 6, "image/png")
+
+        fresh = ImageCache(path=path)
+        assert fresh.get("old") is None
+        assert fresh.get("new")["image_bytes"] == b"y" * 6
+
+    def test_puts_under_limit_skip_size_scan(self, tmp_path):
+        """Only the first put (and ones that cross max_bytes) sum sizes on disk."""
+        cache = ImageCache(path=str(tmp_path / "images.sqlite"), max_bytes=100, ttl=0)
+        statements = []
+        cache._db.set_trace_callback(statements.append)
+        for i in range(5):
+            cache.put(f"k{i}", b"x" * 10, "image/png")
+
+        assert sum("SUM(size)" in sql for sql in statements) == 1
+        assert cache._disk_bytes == 50
+
+    def test_sizes_backfilled_for_old_cache_files(self, tmp_path):
+        """A cache file from before the size column gets sizes filled in and stays prunable."""
+        path = str(tmp_path / "images.sqlite")
+        db = sqlite3.connect(path)
+        db.execute(
+            "CREATE TABLE images (key TEXT PRIMARY KEY, bytes BLOB, mime TEXT, "
+            "created_at TEXT, variant TEXT, embedding BLOB)"
+        )
+        db.execute("INSERT INTO images VALUES ('old', ?, 'image/png', '2000-01-01', '', NULL)", (b"x" * 6,))
+        db.commit()
+        db.close()
+
+        cache = ImageCache(path=path, max_bytes=10, ttl=0)
+        assert cache._db.execute("SELECT size FROM images").fetchone() == (6,)
+        cache.put("new", b"y" * 6, "image/png")
+        assert cache.get("old") is None
+        assert cache.get("new")["image_bytes"] == b"y" * 6
+
+    def test_failures_not_cached(self, generator):
+        """A response without an image is retried on the next call."""
+        generator.client.models.generate_content.return_value = SimpleNamespace(parts=[])
+        assert generator.generate_image("Milk", "milk")["success"] is False
+        generator.generate_image("Milk", "milk")
+        assert generator.client.models.generate_content.call_count == 2
+
+    def test_corrupt_image_rejected(self, generator):
+        """Truncated or non-image bytes fail instead of reaching the upload."""
+        generator.client.models.generate_content.return_value = _image_response(b"\x89PNG fake")
+        assert generator.generate_image("Milk", "milk")["error"].startswith("image too small")
+
+        generator.client.models.generate_content.return_value = _image_response(b"<html>" * 400)
+        result = generator.generate_image("Bread", "bread")
+        assert result["success"] is False
+        assert result["error"] == "invalid image magic bytes"
+
+
+# ===========================================================================
+# CLIENT
+# ===========================================================================
+
+class TestClientReuse:
+    """Tests for the shared genai client"""
+
+    def test_client_shared_across_generators(self):
+        """Generators with the same API key reuse one genai client."""
+        first = ImageGenerator(api_key="shared-key", cache=ImageCache(path=None))
+        second = ImageGenerator(api_key="shared-key", cache=ImageCache(path=None))
+        assert first.client is second.client
+
+
+# ===========================================================================
+# CONCURRENT GENERATION
+# ===========================================================================
+
+class TestGenerateImagesConcurrent:
+    """Tests for ImageGenerator.generate_images_concurrent"""
+
+    def test_results_follow_input_order(self, generator):
+        """Each result is paired with its article, in input order."""
+        articles = [{"title": f"Article {i}", "description": "bread"} for i in range(5)]
+
+        results = asyncio.run(generator.generate_images_concurrent(articles, max_workers=2))
+
+        assert [r["article"]["title"] for r in results] == [a["title"] for a in articles]
+        assert all(r["success"] for r in results)
+        assert generator.client.models.generate_content.call_count == 5
+
+    def test_duplicate_articles_generated_once(self, generator):
+        """Articles with the same title and theme share one Gemini call."""
+        articles = [
+            {"title": "Egg recall", "description": "eggs", "link": "https://a.example"},
+            {"title": "Egg recall", "description": "eggs", "link": "https://b.example"},
+            {"title": "Milk prices", "description": "milk"},
+        ]
+
+        results = asyncio.run(generator.generate_images_concurrent(articles))
+
+        assert generator.client.models.generate_content.call_count == 2
+        assert [r["article"]["link"] for r in results[:2]] == ["https://a.example", "https://b.example"]
+        assert results[0] is not results[1]
+
+    def test_as_completed_yields_every_index(self, generator):
+        """The streaming variant yields one tagged result per article."""
+        articles = [{"title": "Bread"}, {"title": "Bread"}, {"title": "Cheese"}]
+
+        async def collect():
+            return [pair async for pair in generator.generate_images_as_completed(articles)]
+
+        pairs = asyncio.run(collect())
+        assert sorted(index for index, _ in pairs) == [0, 1, 2]
+        assert all(result["article"] is articles[index] for index, result in pairs)
+
+    @pytest.mark.parametrize("max_workers", [0, -1])
+    def test_invalid_max_workers_rejected(self, generator, max_workers):
+        """A worker count below 1 raises instead of waiting forever."""
+        with pytest.raises(ValueError):
+            asyncio.run(asyncio.wait_for(
+                generator.generate_images_concurrent([{"title": "Bread"}], max_workers=max_workers), 5
+            ))
+        generator.client.models.generate_content.assert_not_called()
+
+    def test_rate_limited_call_is_retried(self, generator, monkeypatch):
+        """A 429 from Gemini is retried and the later success is returned."""
+        monkeypatch.setattr("image_generator.IMAGE_RETRY_BASE_DELAY", 0)
+        rate_limit = Exception("429 RESOURCE_EXHAUSTED")
+        generator.client.models.generate_content.side_effect = [rate_limit, _image_response()]
+
+        results = asyncio.run(generator.generate_images_concurrent([{"title": "Rice"}]))
+
+        assert results[0]["success"] is True
+        assert generator.client.models.generate_content.call_count == 2
+
+    def test_timeout_is_retried(self, generator, monkeypatch):
+        """Timeouts count as transient; other errors fail without a retry."""
+        monkeypatch.setattr("image_generator.IMAGE_RETRY_BASE_DELAY", 0)
+        generator.client.models.generate_content.side_effect = [TimeoutError("read timed out"), _image_response()]
+        assert generator.generate_image("Rice", "rice")["success"] is True
+
+        generator.client.models.generate_content.side_effect = ValueError("bad request")
+        assert generator.generate_image("Oats", "oats")["success"] is False
+        assert generator.client.models.generate_content.call_count == 3
+
+
+# ===========================================================================
+# ARTICLE THEMES
+# ===========================================================================
+
+class TestArticleTheme:
+    """Tests for the keyword-driven image theme"""
+
+    def test_table_order_beats_text_order(self):
+        """The earlier table keyword wins even when it appears later in the text."""
+        theme = _article_theme("Milk and coffee prices", "", "SHOPPERS")
+        assert "coffee beans" in theme
+
+    def test_longer_keyword_wins_inside_its_match(self):
+        """'rice' inside 'prices' does not pick the rice theme."""
+        assert "price tags" in _article_theme("Egg prices soar", "", "")
+        assert "grains of rice" in _article_theme("Rice prices soar", "", "")
+
+    def test_matches_plain_scan_without_automaton(self, monkeypatch):
+        """The automaton and the fallback loop pick the same theme."""
+        titles = ["Beef shortage", "Rising costs", "Salmon recall", "Nothing relevant", "A tea sale",
+                  "Costco prices"]
+        with_automaton = [_article_theme.__wrapped__(t, "", "") for t in titles]
+        monkeypatch.setattr("image_generator._THEME_AUTOMATON", None)
+        assert [_article_theme.__wrapped__(t, "", "") for t in titles] == with_automaton
+
+
+# ===========================================================================
+# PLACEHOLDER IMAGES
+# ===========================================================================
+
+class TestPlaceholderImageGenerator:
+    """Tests for PlaceholderImageGenerator.generate_image"""
+
+    def test_title_is_xml_escaped(self):
+        """Special characters in the title produce well-formed SVG."""
+        result = PlaceholderImageGenerator().generate_image('Ben & Jerry\'s "<recall>"')
+
+        root = ET.fromstring(result["image_bytes"])
+        assert 'Ben & Jerry\'s "<recall>"' in root.find("{http://www.w3.org/2000/svg}text").text
+        assert image_data_b64(result)
+
+    @pytest.mark.parametrize("use_regex", [True, False])
+    def test_truncation_keeps_graphemes_whole(self, use_regex, monkeypatch):
+        """Cutting the title never strands a combining mark, half a flag or half an emoji sequence."""
+        if use_regex:
+            pytest.importorskip("regex")
+        else:
+            monkeypatch.setattr("image_generator.regex", None)
+        assert _truncate_label("x" * 29 + "e\u0301 cafe") == "x" * 29
+        family = "\U0001f468\u200d\U0001f469\u200d\U0001f467"
+        assert _truncate_label("x" * 28 + family) == "x" * 28
+        us, ca = "\U0001f1fa\U0001f1f8", "\U0001f1e8\U0001f1e6"
+        assert _truncate_label("x" * 29 + us + " recall") == "x" * 29
+        assert _truncate_label("x" * 26 + us + ca + " recall") == "x" * 26 + us + ca
+        assert _truncate_label("x" * 27 + us + ca + " recall") == "x" * 27 + us
+        assert _truncate_label("Short title") == "Short title"
+
+    def test_concurrent_keeps_order(self):
+        """Batch placeholders are paired with their articles in input order."""
+        articles = [{"title": f"Post {i}"} for i in range(3)]
+        results = asyncio.run(PlaceholderImageGenerator().generate_images_concurrent(articles))
+        assert [r["article"] for r in results] == articles
+
+    def test_sink_receives_bytes(self):
+        """generate_image_to_sink hands over the SVG and returns only its URI."""
+        received = []
+        result = PlaceholderImageGenerator().generate_image_to_sink(
+            "Eggs", lambda data, mime: received.append((data, mime)) or "file://eggs.svg"
+        )
+        assert result["uri"] == "file://eggs.svg"
+        assert "image_bytes" not in result
+        assert received[0][1] == "image/svg+xml"
+
+    def test_mime_type(self, generator):
+        """Placeholder and Gemini results both map to a valid Content-Type."""
+        assert image_mime_type(PlaceholderImageGenerator().generate_image("Eggs")) == "image/svg+xml"
+        assert image_mime_type(generator.generate_image("Eggs", "eggs")) == "image/png"
+
+
+# ===========================================================================
+# RATE LIMITING
+# ===========================================================================
+
+class TestRateLimiter:
+    """Tests for the client-side Gemini request limiter"""
+
+    def test_spaces_requests(self):
+        """Acquisitions beyond the first wait for their slot."""
+        limiter = _RateLimiter(50)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.06
@@ -0,0 +1,193 @@
+"""
+Tests for BlogPostGenerator.
+Covers: batched generation with reflection and per-article retries.
+"""
+import sys
+import os
+import json
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+# Add paths so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from langchain_blog_agent import BlogPostGenerator, BlogPostCache
+
+
+VALID_POST = (
+    '<div><h2>Headline</h2><p>MEMPHIS, Tenn. (Youdle) – Prices.</p>{IMAGE_HERE}'
+    '<p>' + 'word ' * 450 + '</p>'
+    '<ul><li>One</li></ul><a href="https://www.youdle.io/community">Youdle Community</a></div>'
+)
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    gen = BlogPostGenerator(cache=BlogPostCache(path=None), use_llm_reflection=True)
+    gen.calls = []
+
+    def draft(category):
+        def _draft(inputs):
+            gen.calls.append((category, inputs["title"]))
+            return f"{category}:{inputs['title']}"
+        return RunnableLambda(_draft)
+
+    gen.shoppers_chain = gen.shoppers_chain_strong = draft("shoppers")
+    gen.recall_chain = gen.recall_chain_strong = draft("recall")
+    gen.reflection_chain = RunnableLambda(
+        lambda inputs: json.dumps({"is_valid": True, "issues": [], "suggestions": []})
+    )
+    return gen
+
+
+# ===========================================================================
+# BATCH GENERATION
+# ===========================================================================
+
+class TestBatchGenerate:
+    """Tests for BlogPostGenerator.batch_generate"""
+
+    def test_routes_by_category_in_order(self, generator):
+        """Each article goes through its category chain; results keep input order."""
+        articles = [
+            {"title": "Eggs", "category": "SHOPPERS"},
+            {"title": "Pizza recall", "category": "RECALL"},
+            {"title": "Milk"},
+        ]
+
+        results = generator.batch_generate(articles)
+
+        assert [r["blog_post"] for r in results] == ["shoppers:Eggs", "recall:Pizza recall", "shoppers:Milk"]
+        assert [r["article"] for r in results] == articles
+        assert all(r["success"] and r["attempts"] == 1 for r in results)
+
+    def test_only_failed_articles_are_retried(self, generator):
+        """A failed reflection regenerates that article alone, with its issues as a bad example."""
+        def reflect(inputs):
+            valid = "Bread" not in inputs["blog_post"] or len(generator.calls) > 2
+            return json.dumps({"is_valid": valid, "issues": [] if valid else ["Missing <h2> headline"]})
+        generator.reflection_chain = RunnableLambda(reflect)
+
+        results = generator.batch_generate([{"title": "Bread"}, {"title": "Rice"}])
+
+        assert sorted(generator.calls) == [("shoppers", "Bread"), ("shoppers", "Bread"), ("shoppers", "Rice")]
+        assert [r["attempts"] for r in results] == [2, 1]
+        assert all(r["success"] for r in results)
+
+    def test_draft_error_is_retried(self, generator):
+        """A draft that raises goes back into the next round like a failed reflection."""
+        def flaky(inputs):
+            generator.calls.append(("strong", inputs["title"]))
+            if len(generator.calls) == 1:
+                raise TimeoutError("read timeout")
+            return "strong:" + inputs["title"]
+        generator.shoppers_chain = generator.shoppers_chain_strong = RunnableLambda(flaky)
+
+        results = generator.batch_generate([{"title": "Bread"}])
+
+        assert results[0]["success"] is True
+        assert results[0]["attempts"] == 2
+
+    def test_draft_error_keeps_previous_draft(self, generator):
+        """An exception on the last retry leaves the earlier draft and reflection in place."""
+        generator.shoppers_chain_strong = RunnableLambda(lambda inputs: (_ for _ in ()).throw(TimeoutError()))
+        generator.reflection_chain = RunnableLambda(
+            lambda inputs: json.dumps({"is_valid": False, "issues": ["Too salesy"]})
+        )
+
+        results = generator.batch_generate([{"title": "Bread"}], max_retries=1)
+
+        assert results[0]["blog_post"] == "shoppers:Bread"
+        assert results[0]["reflection"]["issues"] == ["Too salesy"]
+        assert "error" not in results[0]
+
+    def test_unparseable_reflection_uses_basic_validation(self, generator):
+        """Non-JSON reflection output falls back to the local HTML checks."""
+        generator.shoppers_chain = RunnableLambda(lambda inputs: VALID_POST)
+        generator.reflection_chain = RunnableLambda(lambda inputs: "looks fine")
+
+        results = generator.batch_generate([{"title": "Cheese"}], max_retries=0)
+
+        assert results[0]["success"] is True
+        assert results[0]["reflection"]["issues"] == []
+
+    def test_fenced_reflection_is_parsed(self, generator):
+        """Reflection JSON wrapped in a markdown fence is still read."""
+        reflection = generator._parse_reflection(
+            '```json\n{"is_valid": false, "issues": ["Too salesy"]}\n```', VALID_POST
+        )
+        assert reflection == {"is_valid": False, "issues": ["Too salesy"]}
+
+    def test_retries_escalate_model(self, generator):
+        """The first draft uses the fast chain and retries use the escalation chain."""
+        generator.shoppers_chain_strong = RunnableLambda(lambda inputs: "strong:" + inputs["title"])
+        generator.reflection_chain = RunnableLambda(
+            lambda inputs: json.dumps({"is_valid": inputs["blog_post"].startswith("strong:"), "issues": []})
+        )
+
+        results = generator.batch_generate([{"title": "Bread"}])
+
+        assert results[0]["blog_post"] == "strong:Bread"
+        assert results[0]["attempts"] == 2
+
+    def test_local_reflection_skips_llm(self, generator):
+        """Without use_llm_reflection, drafts are checked locally."""
+        generator.use_llm_reflection = False
+        generator.shoppers_chain = RunnableLambda(lambda inputs: VALID_POST)
+        generator.reflection_chain = RunnableLambda(lambda inputs: pytest.fail("LLM reflection called"))
+
+        results = generator.batch_generate([{"title": "Cheese"}])
+
+        assert results[0]["success"] is True
+        assert results[0]["reflection"]["word_count"] > 400
+
+    def test_short_post_fails_word_count(self, generator):
+        """Basic validation flags posts outside the word-count window."""
+        reflection = generator._basic_validation(VALID_POST.replace("word " * 450, ""))
+        assert reflection["is_valid"] is False
+        assert any(issue.startswith("Word count") for issue in reflection["issues"])
+
+    def test_structural_issues_repaired_without_retry(self, generator):
+        """A fenced draft missing its wrapper and community link is fixed locally."""
+        generator.use_llm_reflection = False
+        broken = VALID_POST[len("<div>"):-len("</div>")].replace("https://www.youdle.io/community", "#")
+        generator.shoppers_chain = RunnableLambda(lambda inputs: f"```html\n{broken}\n```")
+
+        results = generator.batch_generate([{"title": "Cheese"}])
+
+        assert results[0]["success"] is True and results[0]["attempts"] == 1
+        assert results[0]["blog_post"].startswith("<div>") and "youdle.io/community" in results[0]["blog_post"]
+
+    def test_semantic_issues_not_repaired(self, generator):
+        """Issues the repair can't fix still go back to the LLM."""
+        assert generator._try_repair("<p>short</p>", ["Missing closing </div> tag", "Missing <h2> headline"]) is None
+
+
+# ===========================================================================
+# BLOG POST CACHE
+# ===========================================================================
+
+class TestBlogPostCache:
+    """Tests for the validated-post cache"""
+
+    def test_repeat_batch_skips_llm(self, generator):
+        """A validated article is served from cache on the next batch."""
+        generator.batch_generate([{"title": "Eggs"}])
+        results = generator.batch_generate([{"title": "Eggs"}, {"title": "Milk"}])
+
+        assert generator.calls == [("shoppers", "Eggs"), ("shoppers", "Milk")]
+        assert results[0]["cached"] is True
+        assert results[0]["blog_post"] == "shoppers:Eggs"
+
+    def test_examples_are_part_of_key(self, generator):
+        """New feedback examples produce a different key."""
+        assert generator.cache_key("shoppers", "A", "b", "l") != generator.cache_key(
+            "shoppers", "A", "b", "l", bad_examples=["<!-- avoid this -->"]
+        )
+
+    def test_disk_tier_survives_new_instance(self, tmp_path):
+        """Entries written by one cache are read by another on the same file."""
+        path = str(tmp_path / "posts.sqlite")
+        BlogPostCache(path=path).set("k", {"blog_post": "<div></div>"})
+        assert BlogPostCache(path=path).get("k") == {"blog_post": "<div></div>"}
@@ -0,0 +1,194 @@
+"""
+Tests for LearningMemory.
+Covers: session saves (batched insight writes) and the local (no Supabase)
+insight and metrics store.
+"""
+import sys
+import os
+import pytest
+from unittest.mock import patch, MagicMock
+
+# Add paths so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import learning_memory
+from learning_memory import LearningMemory
+
+
+# ---------------------------------------------------------------------------
+# Fixtures: memory on the local store, and on a mock SupabaseStorage
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def memory():
+    with patch("learning_memory._default_storage", return_value=None):
+        yield LearningMemory()
+
+
+@pytest.fixture
+def remote_memory():
+    storage = MagicMock()
+    storage.save_learning_insights_bulk.return_value = {"success": True, "ids": [1, 2]}
+    storage.get_learning_insights_multi.return_value = None  # SQL function not deployed
+    return LearningMemory(supabase_client=storage)
+
+
+# ===========================================================================
+# DEFAULT STORAGE
+# ===========================================================================
+
+class TestDefaultStorage:
+    """Tests for the shared SupabaseStorage used by LearningMemory()"""
+
+    def test_missing_credentials_not_remembered(self, monkeypatch):
+        """A memory created before Supabase is configured doesn't pin later ones to the local store."""
+        storage = MagicMock()
+        monkeypatch.setattr(learning_memory, "_storage", None)
+        with patch("learning_memory.get_supabase_storage", side_effect=[None, storage]) as factory:
+            assert LearningMemory().client is None
+            assert LearningMemory().client is storage
+            assert LearningMemory().client is storage
+        assert factory.call_count == 2
+
+
+# ===========================================================================
+# SESSION SAVES
+# ===========================================================================
+
+class TestSaveSessionMemory:
+    """Tests for LearningMemory.save_session_memory"""
+
+    def test_insights_written_in_one_call(self, remote_memory):
+        """The approval-rate insight and new insights share one bulk insert."""
+        remote_memory.save_session_memory("shoppers", {
+            "approval_rate": 95,
+            "new_insights": [{"type": "common_mistake", "description": "No source link"}]
+        })
+
+        storage = remote_memory.client
+        storage.save_learning_insight.assert_not_called()
+        rows = storage.save_learning_insights_bulk.call_args.args[0]
+        assert [r["insight_type"] for r in rows] == ["improvement_pattern", "common_mistake"]
+
+    def test_local_store_keeps_insights(self, memory):
+        """Without Supabase, saved insights are readable in the same session."""
+        memory.save_session_memory("shoppers", {
+            "approval_rate": 40,
+            "new_insights": [{"type": "common_mistake", "description": "No source link"}]
+        })
+
+        assert memory.get_common_mistakes("shoppers") == ["No source link"]
+        assert memory.get_insights(insight_type="problem")[0]["category"] == "shoppers"
+        assert memory.get_performance_summary("shoppers")["sessions"] == 1
+
+
+# ===========================================================================
+# LOCAL STORE
+# ===========================================================================
+
+class TestLocalStore:
+    """Tests for the in-process insight and metrics store"""
+
+    def test_filtered_reads_match_a_scan(self, memory):
+        """Indexed lookups return what filtering the full list would, in order."""
+        for insight_type, category in [("common_mistake", "shoppers"), ("common_mistake", "recall"),
+                                       ("improvement_pattern", "shoppers"), ("common_mistake", "")]:
+            memory.store_insight(insight_type, f"{insight_type}/{category}", category)
+
+        everything = memory.get_insights(limit=100)
+        for insight_type in (None, "common_mistake", "improvement_pattern", "missing"):
+            for category in (None, "shoppers", "recall"):
+                expected = [
+                    i for i in everything
+                    if (not insight_type or i["insight_type"] == insight_type)
+                    and (not category or i["category"] == category)
+                ]
+                assert memory.get_insights(insight_type, category, limit=100) == expected
+
+    def test_metrics_filtered_by_category(self, memory):
+        """Performance summaries only count their own category's sessions."""
+        memory.store_session_metrics("shoppers", {"approval_rate": 80})
+        memory.store_session_metrics("recall", {"approval_rate": 60})
+
+        assert memory.get_performance_summary("recall")["avg_approval_rate"] == 60
+        assert memory.get_performance_summary()["sessions"] == 2
+
+    def test_trend_compares_recent_sessions_to_older(self, memory):
+        """The last three sessions are compared against every earlier one."""
+        for rate in (50, 52, 48, 70, 75, 80):
+            memory.store_session_metrics("shoppers", {"approval_rate": rate})
+
+        summary = memory.get_performance_summary("shoppers")
+        assert summary["trend"] == "improving"
+        assert summary["avg_approval_rate"] == 62.5
+        assert len(summary["recent_metrics"]) == 5
+
+
+# ===========================================================================
+# SESSION LOADS
+# ===========================================================================
+
+class TestLoadSessionMemory:
+    """Tests for LearningMemory.load_session_memory"""
+
+    def test_reused_until_write(self, remote_memory):
+        """Repeat loads hit Supabase once; a write makes the next load fresh."""
+        storage = remote_memory.client
+        storage.get_learning_insights.return_value = [{"description": "Cite sources"}]
+
+        first = remote_memory.load_session_memory("shoppers")
+        first["common_mistakes"].append("mutated")
+        assert remote_memory.load_session_memory("shoppers")["common_mistakes"] == ["Cite sources"]
+        calls = storage.get_learning_insights.call_count
+
+        remote_memory.store_insight("common_mistake", "No image", "shoppers")
+        remote_memory.load_session_memory("shoppers")
+        assert storage.get_learning_insights.call_count == 2 * calls
+
+    def test_descriptions_fetched_without_other_columns(self, remote_memory):
+        """Mistake and pattern lookups only ask Supabase for descriptions."""
+        remote_memory.client.get_learning_insights.return_value = [{"description": "Cite sources"}]
+
+        assert remote_memory.get_successful_patterns("recall") == ["Cite sources"]
+        assert remote_memory.client.get_learning_insights.call_args.kwargs["columns"] == "description"
+
+    def test_single_query_when_function_deployed(self, remote_memory):
+        """With get_learning_memory available, one call fills all three lists."""
+        storage = remote_memory.client
+        storage.get_learning_insights_multi.return_value = {
+            "common_mistakes": ["No source link"],
+            "successful_patterns": ["Bullet lists"],
+            "recent_insights": [{"description": "Bullet lists"}]
+        }
+
+        memory = remote_memory.load_session_memory("shoppers")
+
+        assert memory["common_mistakes"] == ["No source link"]
+        assert memory["successful_patterns"] == ["Bullet lists"]
+        storage.get_learning_insights.assert_not_called()
+
+    def test_falls_back_once_function_missing(self, remote_memory):
+        """A missing SQL function is detected once; later loads go straight to per-list queries."""
+        storage = remote_memory.client
+        storage.get_learning_insights.return_value = []
+
+        remote_memory.load_session_memory("shoppers")
+        remote_memory.load_session_memory("recall")
+
+        assert storage.get_learning_insights_multi.call_count == 1
+        assert storage.get_learning_insights.call_count == 6
+
+    def test_transient_error_falls_back_for_one_load(self, remote_memory):
+        """A network error uses the per-list queries once and keeps the single-query path."""
+        storage = remote_memory.client
+        storage.get_learning_insights.return_value = []
+        storage.get_learning_insights_multi.side_effect = [
+            TimeoutError("read timeout"),
+            {"common_mistakes": [], "successful_patterns": [], "recent_insights": []}
+        ]
+
+        remote_memory.load_session_memory("shoppers")
+        remote_memory.load_session_memory("recall")
+
+        assert storage.get_learning_insights_multi.call_count == 2
+        assert storage.get_learning_insights.call_count == 3
@@ -317,7 +317,7 @@ def init_exa_client():
     return Exa(api_key=api_key)
 
 
-def execute_search(exa, query_config, start_date, end_date):
+def execute_search(exa, query_config, start_date, end_date, num_results=EXA_MAX_RESULTS_PER_QUERY):
     """Execute a single Exa search query and return results."""
     query = query_config["query"]
     category = query_config["category"]
@@ -325,7 +325,7 @@ def execute_search(exa, query_config, start_date, end_date):
     search_params = {
         "query": query,
         "type": "auto",
-        "num_results": EXA_MAX_RESULTS_PER_QUERY,
+        "num_results": num_results,
         "start_published_date": start_date,
         "end_published_date": end_date,
         "text": {"max_characters": EXA_CONTENT_MAX_CHARS},
@@ -393,6 +393,11 @@ def main(input_data):
             - batch_index: int (default 0)
             - recent_window_days: int (default 14)
             - search_days_back: int (default 30)
+            - limit_top: int, optional cap on returned items
+            - limit_recall: int, optional cap on returned recall_items
+              (when both limits are set, searching stops as soon as enough
+              shoppers and recent recall items have been found, e.g. for
+              previews)
     
     Returns:
         dict with keys:
@@ -405,6 +410,16 @@ def main(input_data):
     batch_index = int(input_data.get("batch_index", 0))
     recent_days = int(input_data.get("recent_window_days", RECENT_WINDOW_DAYS))
     search_days = int(input_data.get("search_days_back", EXA_SEARCH_DAYS_BACK))
+    limit_top = input_data.get("limit_top")
+    limit_recall = input_data.get("limit_recall")
+    
+    # Preview mode: fewer results per query, stop once both limits are met
+    early_stop = limit_top is not None and limit_recall is not None
+    num_results = EXA_MAX_RESULTS_PER_QUERY
+    if early_stop:
+        num_results = max(1, min(EXA_MAX_RESULTS_PER_QUERY, max(limit_top, limit_recall)))
+    shoppers_links = set()
+    recent_recall_links = set()
     
     items = []
     start_ts = time.time()
@@ -435,7 +450,7 @@ def main(input_data):
         
         # Execute search
         results, category, subcategory = execute_search(
-            exa, query_config, start_date, end_date
+            exa, query_config, start_date, end_date, num_results
         )
         
         # Process results
@@ -443,11 +458,21 @@ def main(input_data):
             item = process_exa_result(result, category, query_index, result_index)
             items.append(item)
             
+            if early_stop and item["link"]:
+                if category != "RECALL":
+                    shoppers_links.add(item["link"])
+                elif within_days(item["pubDate"], recent_days):
+                    recent_recall_links.add(item["link"])
+            
             if len(items) >= MAX_TOTAL_ITEMS:
                 break
         
         if len(items) >= MAX_TOTAL_ITEMS:
             break
+        
+        if (early_stop and len(shoppers_links) >= limit_top
+                and len(recent_recall_links) >= limit_recall):
+            break
     
     # Deduplicate by URL
     seen_urls = set()
@@ -513,6 +538,11 @@ def main(input_data):
         if len(recall_items) >= MAX_RECALL_ITEMS:
             break
     
+    if limit_top is not None:
+        batch_items = batch_items[:limit_top]
+    if limit_recall is not None:
+        recall_items = recall_items[:limit_recall]
+    
     return {
         "items": batch_items,
         "recall_items": recall_items,